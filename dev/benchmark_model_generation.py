@@ -0,0 +1,70 @@
+"""Micro-benchmark the construction of the models returned by the client.
+
+Every page of documents retrieved from the API is validated with a model
+generated by `_generate_returned_model`. This compares the time spent
+converting small pages of documents with and without caching these models.
+
+Run with `python dev/benchmark_model_generation.py`.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from timeit import repeat
+
+from emmet.core.summary import SummaryDoc
+
+from mp_api.client.core import schemas
+
+
+def _page(chunk_size: int) -> list[dict]:
+    return [
+        {
+            "material_id": f"mp-{idx}",
+            "formula_pretty": "Si",
+            "band_gap": 0.6,
+            "energy_above_hull": 0.0,
+            "is_stable": True,
+        }
+        for idx in range(chunk_size)
+    ]
+
+
+def benchmark(chunk_size: int, number: int, repeats: int) -> dict[str, float]:
+    """Time the conversion of a page of `chunk_size` documents in microseconds."""
+    page = _page(chunk_size)
+    requested_fields = list(page[0])
+
+    def _convert():
+        schemas._convert_to_model(page, SummaryDoc, requested_fields=requested_fields)
+
+    timings = {}
+    cached = schemas._build_returned_model
+    for label, builder in (("uncached", cached.__wrapped__), ("cached", cached)):
+        schemas._build_returned_model = builder
+        try:
+            timings[label] = (
+                min(repeat(_convert, number=number, repeat=repeats)) / number * 1e6
+            )
+        finally:
+            schemas._build_returned_model = cached
+    return timings
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--chunk-sizes", type=int, nargs="+", default=[1, 10, 100, 1000]
+    )
+    parser.add_argument("--number", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'chunk_size':>10} {'uncached (us)':>14} {'cached (us)':>12} {'saved':>7}")
+    for chunk_size in args.chunk_sizes:
+        timings = benchmark(chunk_size, args.number, args.repeat)
+        saved = 1 - timings["cached"] / timings["uncached"]
+        print(
+            f"{chunk_size:>10} {timings['uncached']:>14.1f} "
+            f"{timings['cached']:>12.1f} {saved:>7.1%}"
+        )
@@ -0,0 +1,97 @@
+"""Access the Materials Project API from an asyncio event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from mp_api.client.core.async_client import AsyncBaseRester, _asyncify, _create_client
+from mp_api.client.core.settings import MAPI_CLIENT_SETTINGS
+from mp_api.client.mprester import MPRester
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    import httpx
+
+
+class AsyncMPRester:
+    """Asynchronous counterpart of the MPRester.
+
+    The resters of the MPRester are available as AsyncBaseResters, whose
+    `search` and `count` methods are coroutines sending their requests
+    from the event loop through a shared connection pool. Other public
+    methods, e.g., `get_*` methods, run in a worker thread.
+
+    An AsyncMPRester should only be used within a single event loop.
+
+    Example:
+        >>> async with AsyncMPRester() as mpr:
+        >>>     docs = await asyncio.gather(
+        >>>         *(
+        >>>             mpr.materials.summary.search(material_ids=mpid, fields=["band_gap"])
+        >>>             for mpid in ["mp-149", "mp-13", "mp-22862"]
+        >>>         )
+        >>>     )
+        >>>     structure = await mpr.get_structure_by_material_id("mp-149")
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_concurrency: int = MAPI_CLIENT_SETTINGS.NUM_ASYNC_REQUESTS,
+        client: httpx.AsyncClient | None = None,
+        **kwargs,
+    ):
+        """Initialize the AsyncMPRester.
+
+        Arguments:
+            *args: positional arguments of MPRester
+            max_concurrency (int): Maximum number of requests in flight at once.
+            client (httpx.AsyncClient): Client to send requests with. By default (None),
+                the AsyncMPRester will create one with a connection pool of
+                `max_concurrency` connections.
+            **kwargs: keyword arguments of MPRester
+        """
+        self._rester = MPRester(*args, **kwargs)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._owns_client = client is None
+        self._client = client or _create_client(
+            self._rester.session.headers, max_concurrency=max_concurrency
+        )
+        self._resters: dict[str, AsyncBaseRester] = {}
+
+    @property
+    def rester(self) -> MPRester:
+        return self._rester
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr == "_rester":
+            raise AttributeError(attr)
+        return _asyncify(
+            attr,
+            getattr(self._rester, attr),
+            self._client,
+            self._semaphore,
+            self._resters,
+        )
+
+    def __dir__(self):
+        return sorted(set(dir(self.__class__)) | set(dir(self._rester)))
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"Async{self._rester!r}"
+
+    async def close(self) -> None:
+        """Close the connection pool and the session of the MPRester."""
+        if self._owns_client:
+            await self._client.aclose()
+        self._rester.__exit__(None, None, None)
+
+    async def __aenter__(self):
+        """Support for "async with" context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Support for "async with" context."""
+        await self.close()
@@ -0,0 +1,145 @@
+"""Evaluate energies above a convex hull for many candidates at once."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pymatgen.core import Composition, Element
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pymatgen.analysis.phase_diagram import PhaseDiagram
+    from pymatgen.entries.computed_entries import ComputedEntry
+
+# Maximum number of (candidate, facet) energies to hold in memory at once
+_MAX_BATCH_ELEMENTS = 2**24
+
+
+class HullEvaluator:
+    """Energies above the hull of a phase diagram, evaluated with linear algebra.
+
+    The lower convex hull of a phase diagram is the pointwise maximum of the
+    hyperplanes through its facets. The hyperplanes are solved for once, so
+    that the hull energy of a batch of compositions is a matrix product and a
+    maximum, instead of a search for the decomposition of each composition.
+
+    Parameters
+    -----------
+    phase_diagram : PhaseDiagram
+        The phase diagram to evaluate energies against.
+    """
+
+    def __init__(self, phase_diagram: PhaseDiagram):
+        self.phase_diagram = phase_diagram
+        self.elements: list[Element] = list(phase_diagram.elements)
+        self._element_index = {str(el): idx for idx, el in enumerate(self.elements)}
+
+        # Rows of qhull_data are the fractions of elements[1:] and the energy per atom
+        qhull_data = np.asarray(phase_diagram.qhull_data, dtype=float)
+        planes = []
+        for facet in phase_diagram.facets:
+            vertices = qhull_data[list(facet)]
+            coords = np.column_stack([vertices[:, :-1], np.ones(len(facet))])
+            planes.append(np.linalg.solve(coords, vertices[:, -1]))
+        # Energy per atom of the hull at (fractions of elements[1:], 1) . plane
+        self._planes = np.array(planes).reshape(-1, len(self.elements))
+
+    def _fractions(
+        self,
+        compositions: Sequence[Composition | Mapping[str | Element, float] | str],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Atomic fractions of compositions, and whether they are in the phase diagram."""
+        amounts = np.zeros((len(compositions), len(self.elements)))
+        valid = np.ones(len(compositions), dtype=bool)
+        for row, composition in enumerate(compositions):
+            if not isinstance(composition, Composition):
+                composition = Composition(composition)
+            for el, amount in composition.items():
+                # Species are evaluated as their element
+                symbol = str(getattr(el, "element", el))
+                if (col := self._element_index.get(symbol)) is None:
+                    valid[row] = False
+                    break
+                amounts[row, col] += amount
+
+        totals = amounts.sum(axis=1)
+        valid &= totals > 0
+        totals[~valid] = 1.0
+        return amounts / totals[:, None], valid
+
+    def get_hull_energies(
+        self,
+        compositions: Sequence[Composition | Mapping[str | Element, float] | str],
+    ) -> np.ndarray:
+        """Energy per atom of the hull at many compositions.
+
+        Parameters
+        -----------
+        compositions : Sequence of Composition, dict, or str
+            The compositions to evaluate.
+
+        Returns:
+        -----------
+        np.ndarray of the hull energies in eV/atom. Compositions with elements
+        outside of the phase diagram are NaN.
+        """
+        fractions, valid = self._fractions(compositions)
+        coords = np.column_stack([fractions[:, 1:], np.ones(len(fractions))])
+
+        hull_energies = np.full(len(fractions), np.nan)
+        batch_size = max(_MAX_BATCH_ELEMENTS // max(len(self._planes), 1), 1)
+        for start in range(0, len(coords), batch_size):
+            stop = start + batch_size
+            hull_energies[start:stop] = (coords[start:stop] @ self._planes.T).max(
+                axis=1
+            )
+        hull_energies[~valid] = np.nan
+        return hull_energies
+
+    def get_e_above_hull(
+        self,
+        compositions: Sequence[Composition | Mapping[str | Element, float] | str],
+        energies_per_atom: Sequence[float] | np.ndarray,
+    ) -> np.ndarray:
+        """Energy above the hull of many compositions and energies.
+
+        Unlike PhaseDiagram.get_e_above_hull, the candidates are not part of the
+        hull: candidates below the hull have a negative energy above it.
+
+        Parameters
+        -----------
+        compositions : Sequence of Composition, dict, or str
+            The compositions of the candidates.
+        energies_per_atom : Sequence of float or np.ndarray
+            The (corrected) energies of the candidates in eV/atom.
+
+        Returns:
+        -----------
+        np.ndarray of the energies above the hull in eV/atom. Candidates with
+        elements outside of the phase diagram are NaN.
+        """
+        return np.asarray(energies_per_atom, dtype=float) - self.get_hull_energies(
+            compositions
+        )
+
+    def get_e_above_hull_of_entries(
+        self, entries: Sequence[ComputedEntry]
+    ) -> np.ndarray:
+        """Energy above the hull of many entries, see `get_e_above_hull`.
+
+        Parameters
+        -----------
+        entries : Sequence of ComputedEntry or PDEntry
+            The (corrected) entries to evaluate.
+
+        Returns:
+        -----------
+        np.ndarray of the energies above the hull in eV/atom.
+        """
+        return self.get_e_above_hull(
+            [entry.composition for entry in entries],
+            [entry.energy_per_atom for entry in entries],
+        )
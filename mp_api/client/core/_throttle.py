@@ -0,0 +1,209 @@
+"""Adapt the number and rate of requests sent to a server to its responses."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from math import inf
+
+
+class _LimiterRegistry:
+    """Limiters shared by all clients of a process, keyed by server."""
+
+    def __init__(self) -> None:
+        self.limiters: dict[str, RequestLimiter] = {}
+        self.lock = threading.Lock()
+
+
+_LIMITERS = _LimiterRegistry()
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Parse a Retry-After header, given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+class RequestLimiter:
+    """Limit the requests in flight with AIMD, and their rate with a token bucket.
+
+    The concurrency limit grows additively, by about one request per round of
+    healthy responses, and is halved when the server signals overload: a 429 or
+    5xx status code, or a failed request. It is halved at most once per round,
+    i.e., only by requests started after the last decrease. Responses are
+    healthy while their latency stays within `latency_tolerance` times the
+    lowest latency observed. Without `adaptive`, the limit stays at
+    `initial_limit`.
+
+    Independently, a token bucket caps the rate of requests, and a Retry-After
+    header pauses all requests until the time given by the server.
+
+    Arguments:
+        initial_limit (int): initial number of requests in flight
+        max_limit (int): maximum number of requests in flight
+        rate (float or None): maximum number of requests per second, or None
+            to not limit the rate
+        burst (int or None): number of requests which can be sent at once
+            after a quiet period. Defaults to `max_limit`.
+        min_limit (int): minimum number of requests in flight
+        latency_tolerance (float): factor of the lowest latency observed above
+            which the concurrency limit stops growing
+        adaptive (bool): whether to adapt the concurrency limit to the responses
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        max_limit: int,
+        rate: float | None = None,
+        burst: int | None = None,
+        min_limit: int = 1,
+        latency_tolerance: float = 2.0,
+        adaptive: bool = True,
+    ) -> None:
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.rate = rate or None
+        self.capacity = float(burst or self.max_limit)
+        self.latency_tolerance = latency_tolerance
+        self.adaptive = adaptive
+
+        self._cond = threading.Condition()
+        self._tokens = self.capacity
+        self._refilled = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = -inf
+        self._min_latency = inf
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight."""
+        return self._in_flight
+
+    def acquire(self) -> float:
+        """Wait until a request can be sent.
+
+        Returns:
+            The start time of the request, to pass to `release`
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                wait_for: float | None = None
+                if now < self._paused_until:
+                    wait_for = self._paused_until - now
+                elif self._in_flight < int(self.limit):
+                    if self.rate is not None:
+                        self._tokens = min(
+                            self.capacity,
+                            self._tokens + (now - self._refilled) * self.rate,
+                        )
+                        self._refilled = now
+                        if self._tokens < 1:
+                            wait_for = (1 - self._tokens) / self.rate
+                    if wait_for is None:
+                        self._tokens -= 1
+                        self._in_flight += 1
+                        return now
+                # Otherwise, wait for a request in flight to be released
+                self._cond.wait(timeout=wait_for)
+
+    def release(
+        self,
+        started: float,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        """Record the outcome of a request, and let waiting requests through.
+
+        Arguments:
+            started (float): start time of the request, as returned by `acquire`
+            status_code (int or None): status code of the response, or None if
+                the request failed
+            retry_after (float or None): time in seconds to pause all requests for
+        """
+        now = time.monotonic()
+        with self._cond:
+            self._in_flight -= 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+            if self.adaptive:
+                self._adapt(now, started, status_code)
+
+            self._cond.notify_all()
+
+    def _adapt(self, now: float, started: float, status_code: int | None) -> None:
+        """Grow or halve the concurrency limit after a response."""
+        if status_code is None or status_code == 429 or status_code >= 500:
+            if started >= self._last_decrease:
+                self.limit = max(self.limit / 2, self.min_limit)
+                self._last_decrease = now
+        else:
+            latency = now - started
+            self._min_latency = min(self._min_latency, latency)
+            if latency <= self.latency_tolerance * self._min_latency:
+                self.limit = min(self.limit + 1 / self.limit, self.max_limit)
+
+
+def get_limiter(
+    server: str,
+    initial_limit: int,
+    max_limit: int,
+    rate: float | None = None,
+    adaptive: bool = True,
+) -> RequestLimiter:
+    """Get the limiter shared by all requests of this process to a server.
+
+    The arguments other than `server` only apply when the limiter is created,
+    see `RequestLimiter`.
+
+    Arguments:
+        server (str): URL of the server
+        initial_limit (int): initial number of requests in flight
+        max_limit (int): maximum number of requests in flight
+        rate (float or None): maximum number of requests per second
+        adaptive (bool): whether to adapt the number of requests in flight
+
+    Returns:
+        RequestLimiter
+    """
+    with _LIMITERS.lock:
+        if server not in _LIMITERS.limiters:
+            _LIMITERS.limiters[server] = RequestLimiter(
+                initial_limit=initial_limit,
+                max_limit=max_limit,
+                rate=rate,
+                adaptive=adaptive,
+            )
+        return _LIMITERS.limiters[server]
+
+
+def _reset_limiters() -> None:
+    """Drop the limiters in the child of a fork.
+
+    Their requests in flight belong to the parent, and their locks may be held by
+    threads which do not exist in the child.
+    """
+    _LIMITERS.limiters = {}
+    _LIMITERS.lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_limiters)
@@ -0,0 +1,496 @@
+"""Define an asyncio client on top of the synchronous resters.
+
+The query parameters of every request are built by the `search` methods
+of the synchronous route resters, so that both clients stay consistent.
+Requests are then sent through a shared `httpx.AsyncClient`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from copy import copy
+from functools import wraps
+from itertools import chain
+from math import ceil
+from typing import TYPE_CHECKING
+
+try:
+    import httpx
+except ImportError as exc:
+    raise ImportError(
+        "Run `pip install 'mp-api[async]'` to use the asynchronous client."
+    ) from exc
+
+from mp_api.client.core._throttle import _retry_after_seconds
+from mp_api.client.core.client import (
+    BaseRester,
+    _batched,
+    _cached_response,
+    _record_queries,
+)
+from mp_api.client.core.exceptions import MPRestError
+from mp_api.client.core.settings import MAPI_CLIENT_SETTINGS
+from mp_api.client.core.utils import LazyImport, validate_endpoint
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
+    from pydantic import BaseModel
+
+# Status codes to retry on, as in the synchronous client
+_RETRY_STATUS_CODES = {429, 502, 504}
+
+
+def _create_client(
+    headers: Mapping[str, str],
+    max_concurrency: int = MAPI_CLIENT_SETTINGS.NUM_ASYNC_REQUESTS,
+) -> httpx.AsyncClient:
+    """Create an asynchronous HTTP client with a bounded connection pool.
+
+    Arguments:
+        headers (Mapping of str): headers to send with every request
+        max_concurrency (int): maximum number of open connections
+
+    Returns:
+        httpx.AsyncClient
+    """
+    limits = httpx.Limits(
+        max_connections=max_concurrency, max_keepalive_connections=max_concurrency
+    )
+    return httpx.AsyncClient(
+        headers=dict(headers),
+        transport=httpx.AsyncHTTPTransport(
+            retries=MAPI_CLIENT_SETTINGS.MAX_RETRIES, limits=limits
+        ),
+    )
+
+
+def _asyncify(
+    name: str,
+    value: Any,
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    resters: dict[str, AsyncBaseRester],
+) -> Any:
+    """Return the asynchronous counterpart of an attribute of a synchronous rester.
+
+    Resters are wrapped in an AsyncBaseRester. Public methods run in a worker
+    thread, so that they do not block the event loop.
+
+    Arguments:
+        name (str): name of the attribute
+        value (Any): value of the attribute
+        client (httpx.AsyncClient): client to send requests with
+        semaphore (asyncio.Semaphore): semaphore limiting the number of requests in flight
+        resters (dict of str to AsyncBaseRester): cache of wrapped resters
+
+    Returns:
+        The asynchronous counterpart of the attribute
+    """
+    if isinstance(value, LazyImport):
+        value = value._obj
+
+    if isinstance(value, BaseRester):
+        if name not in resters or resters[name].rester is not value:
+            resters[name] = AsyncBaseRester(value, client, semaphore)
+        return resters[name]
+
+    if inspect.isgeneratorfunction(value):
+        raise AttributeError(f"{name!r} has no asynchronous counterpart")
+
+    if callable(value) and not name.startswith("_"):
+
+        @wraps(value)
+        async def _in_thread(*args, **kwargs):
+            return await asyncio.to_thread(value, *args, **kwargs)
+
+        return _in_thread
+
+    return value
+
+
+class AsyncBaseRester:
+    """Asynchronous counterpart of a BaseRester.
+
+    `search` and `count` build their queries with the wrapped rester, and send
+    all requests concurrently from the event loop. Other public methods, e.g.,
+    `get_*` methods, run the synchronous implementation in a worker thread.
+    """
+
+    def __init__(
+        self,
+        rester: BaseRester,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Initialize an AsyncBaseRester.
+
+        Arguments:
+            rester (BaseRester): synchronous rester used to build queries
+            client (httpx.AsyncClient): client to send requests with
+            semaphore (asyncio.Semaphore): semaphore limiting the number of requests in flight
+        """
+        self._rester = rester
+        self._client = client
+        self._semaphore = semaphore
+        self._resters: dict[str, AsyncBaseRester] = {}
+
+    @property
+    def rester(self) -> BaseRester:
+        return self._rester
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr == "_rester":
+            raise AttributeError(attr)
+        return _asyncify(
+            attr,
+            getattr(self._rester, attr),
+            self._client,
+            self._semaphore,
+            self._resters,
+        )
+
+    def __dir__(self):
+        return sorted(set(dir(self.__class__)) | set(dir(self._rester)))
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<{self.__class__.__name__} {self._rester.endpoint}>"
+
+    async def search(self, *args, **kwargs) -> list[BaseModel] | list[dict]:
+        """Query the endpoint with the same arguments as the `search` method of the rester.
+
+        Arguments:
+            *args: positional arguments of `search`
+            **kwargs: keyword arguments of `search`
+
+        Returns:
+            A list of documents.
+        """
+        plans, results = self._rester._plan_search(*args, **kwargs)
+        if not plans:
+            return results
+
+        resources = await asyncio.gather(
+            *(self._query_resource(**plan) for plan in plans)
+        )
+        if len(resources) == 1:
+            return resources[0]["data"]
+        return list(chain.from_iterable(resource["data"] for resource in resources))
+
+    async def count(self, criteria: dict | None = None) -> int:
+        """Return a count of total documents.
+
+        Args:
+            criteria (dict | None): As in .search(). Defaults to None
+
+        Returns:
+            int : Count of total results
+        """
+        with _record_queries(self._rester) as plans:
+            self._rester.count(criteria)
+
+        resources = await asyncio.gather(
+            *(self._query_resource(**plan) for plan in plans)
+        )
+        return sum(resource["meta"]["total_doc"] for resource in resources)
+
+    async def _query_resource(
+        self,
+        criteria: dict | None = None,
+        fields: list[str] | None = None,
+        suburl: str | None = None,
+        use_document_model: bool | None = None,
+        num_chunks: int | None = None,
+        chunk_size: int | None = None,
+        timeout: int | None = None,
+    ) -> dict[str, Any]:
+        """Asynchronous counterpart of `BaseRester._query_resource`.
+
+        Full downloads of a collection (no query and `num_chunks=None`) come
+        from the bulk data store, and are retrieved in a worker thread.
+
+        Arguments:
+            criteria: dictionary of criteria to filter down
+            fields: list of fields to return
+            suburl: make a request to a specified sub-url
+            use_document_model: if None, will defer to the use_document_model attribute of the rester
+            num_chunks: Maximum number of chunks of data to yield. None will yield all possible.
+            chunk_size: Number of data entries per chunk.
+            timeout (float or None): Time in seconds to wait until a request timeout error is thrown
+
+        Returns:
+            A Resource, a dict with two keys, "data" containing a list of documents, and
+            "meta" containing meta information, e.g. total number of documents
+            available.
+        """
+        if use_document_model is None:
+            use_document_model = self._rester.use_document_model
+
+        timeout = self._rester.timeout if timeout is None else timeout
+
+        no_query = not {
+            field
+            for field, v in (criteria or {}).items()
+            if field[0] != "_" and v is not None
+        }
+        if no_query and num_chunks is None:
+            return await asyncio.to_thread(
+                self._rester._query_resource,
+                criteria=criteria,
+                fields=fields,
+                suburl=suburl,
+                use_document_model=use_document_model,
+                chunk_size=chunk_size,
+                timeout=timeout,
+            )
+
+        criteria = self._rester._prepare_criteria(
+            criteria, fields=fields, suburl=suburl
+        )
+        url = validate_endpoint(self._rester.endpoint, suffix=suburl)
+
+        return await self._submit_requests(
+            url=url,
+            criteria=criteria,
+            use_document_model=use_document_model,
+            chunk_size=chunk_size,
+            num_chunks=num_chunks,
+            timeout=timeout,
+        )
+
+    async def _submit_batched_requests(
+        self,
+        url: str,
+        criteria: dict[str, Any],
+        split_param: str,
+        batches: list[list[str]],
+        max_batch_size: int | None,
+        **kwargs,
+    ) -> dict:
+        """Concurrently submit a query in batches of values of a parameter and combine the results.
+
+        Arguments:
+            url (str): url used to make request
+            criteria (dict of str): dictionary of criteria to filter down
+            split_param (str): name of the comma-separated parameter to split
+            batches (list of list of str): batches of values of the parameter
+            max_batch_size (int or None): If an int, forbid splitting batches of at most
+                this size further. If None, batches can be split again when rejected.
+            **kwargs: other arguments of `_submit_requests`
+
+        Returns:
+            Dictionary containing data and metadata
+        """
+        results = await asyncio.gather(
+            *(
+                self._submit_requests(
+                    url=url,
+                    criteria={**criteria, split_param: ",".join(batch)},
+                    norecur=max_batch_size is not None and len(batch) <= max_batch_size,
+                    **kwargs,
+                )
+                for batch in batches
+            )
+        )
+
+        total_data: dict[str, Any] = {
+            "data": list(chain.from_iterable(result["data"] for result in results))
+        }
+        if metas := [result["meta"] for result in results if "meta" in result]:
+            total_data["meta"] = metas[-1]
+            total_data["meta"]["total_doc"] = sum(
+                meta.get("total_doc", 0) for meta in metas
+            )
+        return total_data
+
+    async def _submit_requests(
+        self,
+        url: str,
+        criteria: dict[str, Any],
+        use_document_model: bool,
+        chunk_size: int | None,
+        num_chunks: int | None = None,
+        timeout: int | None = None,
+        max_batch_size: int = 100,
+        norecur: bool = False,
+    ) -> dict:
+        """Asynchronous counterpart of `BaseRester._submit_requests`.
+
+        The requests for all batches of a split parameter, and for all
+        pages of a query, are sent concurrently.
+
+        Arguments:
+            url (str): url used to make request
+            criteria (dict of str): dictionary of criteria to filter down
+            use_document_model (bool): whether to use the document model
+            chunk_size (int or None): Number of data entries per chunk.
+            num_chunks (int or None): Maximum number of chunks of data to yield. None will yield all possible.
+            timeout (int or None): Time in seconds to wait until a request timeout error is thrown
+            max_batch_size (int) : Maximum size of a batch when splitting a parameter
+            norecur (bool) : Whether to forbid recursive splitting of a query field
+                when a direct query fails
+
+        Returns:
+            Dictionary containing data and metadata
+        """
+        split_param, split_values = self._rester._find_split_param(criteria)
+        can_split = split_param is not None and len(split_values) > 1
+
+        # Size batches up front, rather than waiting for the server to reject a long URL
+        batches = (
+            self._rester._plan_batches(url, criteria, split_param, split_values)  # type: ignore[arg-type]
+            if can_split
+            else []
+        )
+        if len(batches) > 1:
+            return await self._submit_batched_requests(
+                url=url,
+                criteria=criteria,
+                split_param=split_param,  # type: ignore[arg-type]
+                batches=batches,
+                max_batch_size=None,
+                use_document_model=use_document_model,
+                chunk_size=chunk_size,
+                num_chunks=num_chunks,
+                timeout=timeout,
+            )
+
+        initial_criteria = copy(criteria)
+        if (
+            not can_split
+            and isinstance(initial_criteria.get("_page"), int)
+            and not initial_criteria.get("_per_page")
+        ):
+            initial_criteria["_per_page"] = initial_criteria.get("_limit")
+
+        try:
+            data, total_num_docs = await self._submit_request_and_process(
+                url=url,
+                params=initial_criteria,
+                use_document_model=use_document_model,
+                timeout=timeout,
+            )
+        except MPRestError as e:
+            # If we get 422 or 414 error, split into batches
+            if (
+                not can_split
+                or norecur
+                or not any(trace in str(e) for trace in ("422", "414"))
+            ):
+                raise
+
+            batch_size = min(len(split_values), max_batch_size)
+            return await self._submit_batched_requests(
+                url=url,
+                criteria=criteria,
+                split_param=split_param,  # type: ignore[arg-type]
+                batches=list(_batched(split_values, batch_size)),
+                max_batch_size=max_batch_size,
+                use_document_model=use_document_model,
+                chunk_size=chunk_size,
+                num_chunks=num_chunks,
+                timeout=timeout,
+            )
+
+        if chunk_size is None or chunk_size < 1:
+            raise ValueError(
+                "A positive chunk size must be provided to enable pagination"
+            )
+
+        max_pages = (
+            num_chunks if num_chunks is not None else ceil(total_num_docs / chunk_size)
+        )
+        num_docs_needed = min((max_pages * chunk_size), total_num_docs)
+
+        total_data = {"data": data["data"][:num_docs_needed]}
+        if "meta" in data:
+            total_data["meta"] = data["meta"]
+
+        if len(data["data"]) >= num_docs_needed or num_chunks == 1:
+            return total_data
+
+        pages = await asyncio.gather(
+            *(
+                self._submit_request_and_process(
+                    url=url,
+                    params=page_criteria,
+                    use_document_model=use_document_model,
+                    timeout=timeout,
+                )
+                for page_criteria in self._rester._plan_pages(
+                    criteria,
+                    skip=criteria.get("_limit") or chunk_size,
+                    chunk_size=chunk_size,
+                    num_docs=num_docs_needed - len(data["data"]),
+                )
+            )
+        )
+        total_data["data"] = list(
+            chain(total_data["data"], *(page["data"] for page, _ in pages))
+        )
+        return total_data
+
+    async def _submit_request_and_process(
+        self,
+        url: str,
+        params: dict,
+        use_document_model: bool,
+        timeout: int | None = None,
+    ) -> tuple[dict, int]:
+        """Asynchronously submit a GET request and handle the response.
+
+        Rate-limited and gateway errors are retried with exponential backoff,
+        honoring the Retry-After header of the response.
+
+        Arguments:
+            url: URL to send request to
+            params: dictionary of parameters to send in the request
+            use_document_model: whether to use the document model
+            timeout: Time in seconds to wait until a request timeout error is thrown
+
+        Returns:
+            Tuple with data and total number of docs in matching the query in the database.
+        """
+        response_cache = self._rester._response_cache
+        if response_cache is not None:
+            cache_key = self._rester._response_cache_key(url, params)
+            if (content := response_cache.get(cache_key)) is not None:
+                return self._rester._process_response(
+                    _cached_response(url, content), params, use_document_model
+                )
+
+        # Encode booleans as `requests` does
+        query = {k: str(v) if isinstance(v, bool) else v for k, v in params.items()}
+
+        for attempt in range(MAPI_CLIENT_SETTINGS.MAX_RETRIES + 1):
+            async with self._semaphore:
+                try:
+                    response = await self._client.get(
+                        url, params=query, timeout=timeout
+                    )
+                except httpx.TimeoutException:
+                    raise MPRestError(
+                        f"REST query timed out on URL {url}. Try again with a smaller request."
+                    )
+                except httpx.HTTPError as ex:
+                    raise MPRestError(str(ex))
+
+            if (
+                response.status_code not in _RETRY_STATUS_CODES
+                or attempt == MAPI_CLIENT_SETTINGS.MAX_RETRIES
+            ):
+                break
+
+            await asyncio.sleep(
+                _retry_after_seconds(response.headers.get("Retry-After"))
+                or MAPI_CLIENT_SETTINGS.BACKOFF_FACTOR * 2**attempt
+            )
+
+        if response_cache is not None and response.status_code == 200:
+            response_cache.set(
+                cache_key, response.content, version=self._rester.db_version
+            )
+
+        return self._rester._process_response(response, params, use_document_model)
@@ -0,0 +1,203 @@
+"""Define a persistent, size-bounded cache on disk."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+# Errors accessing the database, e.g., in an unwritable or full directory
+_CACHE_ERRORS = (OSError, sqlite3.Error)
+
+# The total size of the values is kept up to date by triggers, so that it never
+# has to be summed over all entries
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS entries ("
+    "key TEXT PRIMARY KEY, version TEXT, value BLOB, "
+    "size INTEGER, accessed REAL)",
+    "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)",
+    "CREATE TABLE IF NOT EXISTS total_size (size INTEGER)",
+    "INSERT INTO total_size SELECT COALESCE(SUM(size), 0) FROM entries "
+    "WHERE NOT EXISTS (SELECT 1 FROM total_size)",
+    "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries "
+    "BEGIN UPDATE total_size SET size = size + new.size; END",
+    "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries "
+    "BEGIN UPDATE total_size SET size = size - old.size; END",
+    "CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries "
+    "BEGIN UPDATE total_size SET size = size - old.size + new.size; END",
+)
+
+
+class DiskCache:
+    """Compressed key-value store in an SQLite database.
+
+    Once the total size of the compressed values exceeds `max_size`, the
+    least recently used entries are evicted. SQLite's locking makes a cache
+    safe to share between threads and processes on one node.
+
+    Entries are tagged with a version, e.g., the database version they were
+    retrieved from, so that stale entries can be dropped with `prune`.
+
+    Errors accessing the database are logged, and otherwise treated as a
+    cache miss: a cache should never break the client. A cache which cannot
+    be created, e.g., in a read-only directory, stores nothing.
+    """
+
+    def __init__(self, path: str | Path, max_size: int) -> None:
+        """Initialize a DiskCache, creating the database if needed.
+
+        Arguments:
+            path (str or Path): path to the SQLite database
+            max_size (int): maximum total size in bytes of the compressed values
+        """
+        self.path = Path(path).expanduser()
+        self.max_size = max_size
+        self.enabled = True
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+        except _CACHE_ERRORS as exc:
+            logger.warning(f"Could not open cache {self.path}, disabling it: {exc}")
+            self.enabled = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation keeps the cache thread- and fork-safe
+        conn = sqlite3.connect(self.path, timeout=60)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> bytes | None:
+        """Retrieve a value, or None if it is not cached.
+
+        Arguments:
+            key (str): key of the value
+
+        Returns:
+            The value, or None
+        """
+        if not self.enabled:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE entries SET accessed = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+            return zlib.decompress(row[0])
+        except (*_CACHE_ERRORS, zlib.error) as exc:
+            logger.warning(f"Could not read from cache {self.path}: {exc}")
+            return None
+
+    def set(self, key: str, value: bytes, version: str = "") -> None:
+        """Store a value, evicting the least recently used values if needed.
+
+        Arguments:
+            key (str): key of the value
+            value (bytes): value to store
+            version (str): version to tag the value with
+        """
+        if not self.enabled:
+            return
+        compressed = zlib.compress(value)
+        if len(compressed) > self.max_size:
+            return
+
+        try:
+            with self._connect() as conn:
+                # Not INSERT OR REPLACE, which does not fire the delete trigger
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                conn.execute(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (key, version, compressed, len(compressed), time.time()),
+                )
+                (excess,) = conn.execute(
+                    "SELECT size - ? FROM total_size", (self.max_size,)
+                ).fetchone()
+                if excess > 0:
+                    self._evict(conn, excess)
+        except _CACHE_ERRORS as exc:
+            logger.warning(f"Could not write to cache {self.path}: {exc}")
+
+    @staticmethod
+    def _evict(conn: sqlite3.Connection, excess: int) -> None:
+        """Evict the least recently used values until `excess` bytes are freed."""
+        evicted = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed"
+        ):
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def prune(self, version: str) -> None:
+        """Drop all values tagged with a version other than `version`.
+
+        Arguments:
+            version (str): version of the values to keep
+        """
+        if not self.enabled:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM entries WHERE version != ?", (version,))
+        except _CACHE_ERRORS as exc:
+            logger.warning(f"Could not prune cache {self.path}: {exc}")
+
+    def clear(self) -> None:
+        """Drop all values."""
+        if not self.enabled:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM entries")
+        except _CACHE_ERRORS as exc:
+            logger.warning(f"Could not clear cache {self.path}: {exc}")
+
+    def __len__(self) -> int:
+        if not self.enabled:
+            return 0
+        try:
+            with self._connect() as conn:
+                return conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        except _CACHE_ERRORS as exc:
+            logger.warning(f"Could not read from cache {self.path}: {exc}")
+            return 0
+
+    def __contains__(self, key: str) -> bool:
+        if not self.enabled:
+            return False
+        try:
+            with self._connect() as conn:
+                return (
+                    conn.execute(
+                        "SELECT 1 FROM entries WHERE key = ?", (key,)
+                    ).fetchone()
+                    is not None
+                )
+        except _CACHE_ERRORS as exc:
+            logger.warning(f"Could not read from cache {self.path}: {exc}")
+            return False
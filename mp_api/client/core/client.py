@@ -6,17 +6,30 @@ Materials Project data.
 from __future__ import annotations
 
 import gzip
+import hashlib
 import inspect
 import itertools
+import json
 import logging
 import os
 import platform
 import shutil
 import sys
+import threading
 import warnings
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import weakref
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import closing, contextmanager
+from contextvars import ContextVar, copy_context
 from copy import copy
-from functools import cache
+from functools import cache, partial
 from importlib.metadata import PackageNotFoundError, version
 from io import BytesIO
 from itertools import chain, islice
@@ -24,11 +37,14 @@ from json import JSONDecodeError
 from math import ceil
 from pathlib import Path
 from typing import TYPE_CHECKING
-from urllib.parse import urljoin
+from urllib.parse import quote_plus, unquote, urlencode, urljoin
 
 import boto3
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
 import requests
 from botocore import UNSIGNED
 from botocore.config import Config
@@ -43,6 +59,8 @@ from tqdm.auto import tqdm
 from urllib3.util.retry import Retry
 
 from mp_api.client._server_utils import get_consumer, get_user_api_key, is_dev_env
+from mp_api.client.core._throttle import _retry_after_seconds, get_limiter
+from mp_api.client.core.cache import DiskCache
 from mp_api.client.core.exceptions import (
     MPRestError,
     MPRestWarning,
@@ -51,7 +69,14 @@ from mp_api.client.core.exceptions import (
 from mp_api.client.core.schemas import _convert_to_model, _DictLikeAccess
 from mp_api.client.core.settings import MAPI_CLIENT_SETTINGS
 from mp_api.client.core.utils import (
+    _INDEX_FILE,
     MPDataset,
+    _arrow_schema,
+    _criteria_to_sql,
+    _dataset_memory_budget,
+    _docs_to_table,
+    _prefetch_batches,
+    _StreamingDatasetWriter,
     load_json,
     validate_endpoint,
     validate_ids,
@@ -59,7 +84,9 @@ from mp_api.client.core.utils import (
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable, Iterator
-    from typing import Any
+    from typing import Any, Literal
+
+    import pandas as pd
 
     from mp_api.client.core.utils import LazyImport
 
@@ -88,6 +115,107 @@ CONTROLLED_COLLECTIONS = [
     "thermo",
 ]
 
+# Sidecar file recording which remote files a local dataset was built from
+_SYNC_STATE_FILE = "_mp_sync.json"
+
+# Set while planning a search, to record the queries of a rester instead of running them
+_QUERY_PLAN: ContextVar[tuple[BaseRester, list[dict[str, Any]]] | None] = ContextVar(
+    "_QUERY_PLAN", default=None
+)
+
+# Options of the current call, overriding the attributes of the same name of all
+# resters, see `_Rester._call_options`
+_CALL_OPTIONS: ContextVar[dict[str, Any] | None] = ContextVar(
+    "_CALL_OPTIONS", default=None
+)
+
+# Marks the threads running a task of a client's executor
+_WORKER_STATE = threading.local()
+
+# Default maximum number of parallel requests with ADAPTIVE_CONCURRENCY, as a
+# multiple of NUM_PARALLEL_REQUESTS
+_ADAPTIVE_CEILING_FACTOR = 4
+
+
+def _run_in_worker(func: Callable, params: dict[str, Any]) -> Any:
+    """Run a task of a client's executor, marking the thread as one of its workers."""
+    _WORKER_STATE.active = True
+    try:
+        return func(**params)
+    finally:
+        _WORKER_STATE.active = False
+
+
+def _submit_in_context(
+    executor: Executor, func: Callable, params: dict[str, Any]
+) -> Future:
+    """Submit a task to a client's executor, running it in a copy of the current context.
+
+    The task thus sees the options of the call which submitted it.
+    """
+    return executor.submit(copy_context().run, _run_in_worker, func, params)
+
+
+# Live clients, whose connections are reset in the child of a fork
+_RESTERS: weakref.WeakSet[_Rester] = weakref.WeakSet()
+
+
+def _reset_after_fork() -> None:
+    """Give all clients new connections in the child of a fork.
+
+    The sessions of the parent share its sockets, and its executors' threads do not
+    exist in the child. Sub-resters are given the new connections of their parent.
+    """
+    resters = list(_RESTERS)
+    # A broken client must not keep the others on the connections of the parent
+    for rester in resters:
+        try:
+            rester._reset_connections()
+        except Exception as exc:
+            logger.warning(f"Could not reset the connections of {rester!r}: {exc}")
+    children = {id(child) for rester in resters for child in rester._child_resters()}
+    for rester in resters:
+        if id(rester) not in children:
+            try:
+                rester._share_connections()
+            except Exception as exc:
+                logger.warning(f"Could not share the connections of {rester!r}: {exc}")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class _RegisteredRester(type):
+    """Register clients for `_reset_after_fork` once they are fully initialized.
+
+    A client whose initialization failed is never registered, so that it cannot
+    linger in `_RESTERS`, e.g., referenced by a traceback.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        rester = super().__call__(*args, **kwargs)
+        _RESTERS.add(rester)
+        return rester
+
+
+def _max_parallel_requests() -> int:
+    """Maximum number of parallel requests, the limiter of a server sets how many are sent."""
+    num_parallel = MAPI_CLIENT_SETTINGS.NUM_PARALLEL_REQUESTS
+    if not MAPI_CLIENT_SETTINGS.ADAPTIVE_CONCURRENCY:
+        return num_parallel
+    return max(
+        MAPI_CLIENT_SETTINGS.MAX_PARALLEL_REQUESTS
+        or _ADAPTIVE_CEILING_FACTOR * num_parallel,
+        num_parallel,
+    )
+
+
+def _in_worker() -> bool:
+    """Whether this thread is running a task of a client's executor."""
+    return getattr(_WORKER_STATE, "active", False)
+
+
 hdlr = logging.StreamHandler()
 fmt = logging.Formatter("%(name)s - %(levelname)s - %(message)s")
 hdlr.setFormatter(fmt)
@@ -97,6 +225,55 @@ logger.setLevel(logging.INFO)
 logger.addHandler(hdlr)
 
 
+@cache
+def _open_disk_cache(path: Path, max_size: int, db_version: str = "") -> DiskCache:
+    """Open a persistent cache once per process, dropping values of other database versions.
+
+    Arguments:
+        path (Path): path to the cache database
+        max_size (int): maximum total size in bytes of the compressed values
+        db_version (str): current database version, as reported by the heartbeat.
+            If empty, values of all versions are kept (until evicted).
+
+    Returns:
+        DiskCache
+    """
+    disk_cache = DiskCache(path, max_size=max_size)
+    if db_version:
+        disk_cache.prune(db_version)
+    return disk_cache
+
+
+def _cached_response(url: str, content: bytes) -> requests.Response:
+    """Rebuild a successful response from its cached content."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.encoding = "utf-8"
+    response._content = content
+    return response
+
+
+@contextmanager
+def _record_queries(rester: BaseRester) -> Iterator[list[dict[str, Any]]]:
+    """Record the queries `rester` sends through `_query_resource` instead of running them.
+
+    While recording, `_query_resource` returns an empty resource.
+
+    Arguments:
+        rester (BaseRester): the rester to record queries of
+
+    Yields:
+        The list of recorded keyword arguments to `_query_resource`
+    """
+    plans: list[dict[str, Any]] = []
+    token = _QUERY_PLAN.set((rester, plans))
+    try:
+        yield plans
+    finally:
+        _QUERY_PLAN.reset(token)
+
+
 def _batched(iterable: Iterable, n: int) -> Iterator:
     if n < 1:
         raise ValueError("n must be at least one")
@@ -130,9 +307,13 @@ class QueryBuilderWithCache(QueryBuilder):
         return super().register(table_name, delta_table)
 
 
-class _Rester:
+class _Rester(metaclass=_RegisteredRester):
     """Define base attributes of a REST client."""
 
+    # Attributes holding connections, which are neither pickled nor shared with
+    # the child of a fork, but recreated there
+    _connection_attrs: tuple[str, ...] = ("_session", "_executor", "_query_builder")
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -147,7 +328,9 @@ class _Rester:
             str | os.PathLike
         ) = MAPI_CLIENT_SETTINGS.LOCAL_DATASET_CACHE,
         force_renew: bool = False,
+        sync_datasets: bool = False,
         query_builder: QueryBuilderWithCache | None = None,
+        executor: Executor | None = None,
         **kwargs,
     ) -> None:
         """Initialize a RESTer.
@@ -182,8 +365,14 @@ class _Rester:
             local_dataset_cache: Target directory for downloading full datasets. Defaults
                 to 'mp_datasets' in the user's home directory
             force_renew: Option to overwrite existing local dataset
+            sync_datasets: Option to incrementally update existing local datasets,
+                only retrieving the data which changed since they were downloaded
             query_builder : Instance of QueryBuilderWithCache to use in querying delta tables
                 NOTE: Must be a QueryBuilderWithCache, a deltalake.QueryBuilder will be ignored.
+            executor: Thread-based executor with which to send parallel requests, shared
+                with the sub-resters of this client. By default (None), the client creates
+                one with a worker per parallel request and shuts it down on exit.
+                An executor passed here is not shut down by the client.
             **kwargs: access to legacy kwargs that may be in the process of being deprecated
         """
         self.api_key = get_user_api_key(api_key=api_key)
@@ -207,9 +396,13 @@ class _Rester:
         self.db_version: str = db_version or ""
         self.local_dataset_cache = Path(local_dataset_cache)
         self.force_renew = force_renew
+        self.sync_datasets = sync_datasets
         self._query_builder = (
             query_builder if isinstance(query_builder, QueryBuilderWithCache) else None
         )
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
 
         if "monty_decode" in kwargs:
             # Pop to not repeatedly trigger warning to the user
@@ -229,6 +422,91 @@ class _Rester:
             )
         return self._session
 
+    @property
+    def executor(self) -> Executor:
+        """The executor running the parallel requests of this client and its sub-resters."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=_max_parallel_requests(),
+                    thread_name_prefix="mp_api",
+                )
+            return self._executor
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the configuration of the client, without its connections."""
+        state = self.__dict__.copy()
+        for attr in (*self._connection_attrs, "_executor_lock"):
+            state.pop(attr, None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled client, which recreates its connections lazily."""
+        self.__dict__.update(state)
+        self._reset_connections()
+        self._share_connections()
+        _RESTERS.add(self)
+
+    def _reset_connections(self) -> None:
+        """Drop the connections of this client, which are then recreated on use.
+
+        A session or executor passed to the client is dropped as well.
+        """
+        for attr in self._connection_attrs:
+            setattr(self, attr, None)
+        self._owns_executor = True
+        self._executor_lock = threading.Lock()
+
+    def _child_resters(self) -> list[_Rester]:
+        """The sub-resters created by this client."""
+        return [value for value in vars(self).values() if isinstance(value, _Rester)]
+
+    def _share_connections(self) -> None:
+        """Share the session and executor of this client with its sub-resters, recursively."""
+        for child in self._child_resters():
+            child._session = self.session
+            child._executor, child._owns_executor = self.executor, False
+            child._query_builder = self._query_builder
+            child._share_connections()
+
+    @property
+    def use_document_model(self) -> bool:
+        return (_CALL_OPTIONS.get() or {}).get(
+            "use_document_model", self._use_document_model
+        )
+
+    @use_document_model.setter
+    def use_document_model(self, value: bool):
+        self._use_document_model = value
+
+    @property
+    def mute_progress_bars(self) -> bool:
+        return (_CALL_OPTIONS.get() or {}).get(
+            "mute_progress_bars", self._mute_progress_bars
+        )
+
+    @mute_progress_bars.setter
+    def mute_progress_bars(self, value: bool):
+        self._mute_progress_bars = value
+
+    @contextmanager
+    def _call_options(self, **options: Any) -> Iterator[None]:
+        """Override attributes of all resters for the duration of a call.
+
+        Unlike setting the attributes, the options only apply to the current
+        thread (or task) and the requests it submits to the executor, so that
+        a client can be shared between threads.
+
+        Arguments:
+            **options: the attributes to override, i.e., use_document_model
+                and/or mute_progress_bars
+        """
+        token = _CALL_OPTIONS.set({**(_CALL_OPTIONS.get() or {}), **options})
+        try:
+            yield
+        finally:
+            _CALL_OPTIONS.reset(token)
+
     @property
     def query_builder(self):
         if not self._query_builder:
@@ -254,7 +532,8 @@ class _Rester:
             read=max_retry_num,
             connect=max_retry_num,
             respect_retry_after_header=True,
-            status_forcelist=[429, 504, 502],  # rate limiting
+            # Rate limiting (429) is retried by `_submit_request`, through the limiter
+            status_forcelist=[504, 502],
             backoff_factor=MAPI_CLIENT_SETTINGS.BACKOFF_FACTOR,
         )
         adapter = HTTPAdapter(max_retries=retry)
@@ -273,6 +552,10 @@ class _Rester:
             self.session.close()
         self._session = None
 
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
     @staticmethod
     @cache
     def _get_heartbeat_info(endpoint) -> tuple[str, list[str]]:
@@ -320,6 +603,7 @@ class BaseRester(_Rester):
     document_model: type[BaseModel] = _DictLikeAccess
     primary_key: str = "material_id"
     delta_backed: bool = True
+    _connection_attrs = (*_Rester._connection_attrs, "_s3_client")
 
     def __init__(
         self,
@@ -335,6 +619,7 @@ class BaseRester(_Rester):
             str | os.PathLike
         ) = MAPI_CLIENT_SETTINGS.LOCAL_DATASET_CACHE,
         force_renew: bool = False,
+        sync_datasets: bool = False,
         query_builder: QueryBuilderWithCache | None = None,
         s3_client: Any | None = None,
         timeout: int = 20,
@@ -375,6 +660,8 @@ class BaseRester(_Rester):
             local_dataset_cache: Target directory for downloading full datasets. Defaults
                 to 'mp_datasets' in the user's home directory
             force_renew: Option to overwrite existing local dataset
+            sync_datasets: Option to incrementally update existing local datasets,
+                only retrieving the data which changed since they were downloaded
             query_builder : Instance of QueryBuilderWithCache to use in querying delta tables
                 NOTE: Must be a QueryBuilderWithCache, a deltalake.QueryBuilder will be ignored.
             s3_client: boto3 S3 client object with which to connect to the object stores.ct to the object stores.ct to the object stores.
@@ -392,6 +679,7 @@ class BaseRester(_Rester):
             db_version=db_version,
             local_dataset_cache=local_dataset_cache,
             force_renew=force_renew,
+            sync_datasets=sync_datasets,
             query_builder=query_builder,
             **kwargs,
         )
@@ -406,6 +694,16 @@ class BaseRester(_Rester):
         if not self.db_version:
             self.db_version = hb_db_version
 
+        self._response_cache = (
+            _open_disk_cache(
+                MAPI_CLIENT_SETTINGS.CACHE_DIR / "responses.sqlite",
+                MAPI_CLIENT_SETTINGS.RESPONSE_CACHE_MAX_SIZE,
+                hb_db_version,
+            )
+            if MAPI_CLIENT_SETTINGS.RESPONSE_CACHE
+            else None
+        )
+
         self.timeout = timeout
         self._s3_client = s3_client
 
@@ -687,6 +985,374 @@ class BaseRester(_Rester):
                 f"parameter on MPRester (current value: {self.timeout}s)."
             ) from e
 
+    def _has_controlled_access(self, timeout: int | None = None) -> bool:
+        """Check whether the API key grants access to access-controlled data, e.g., GNoMe.
+
+        Args:
+            timeout (int or None) : timeout on getting access-controlled groups
+
+        Returns:
+            bool
+        """
+        with self._call_options(mute_progress_bars=True):
+            return bool(
+                self._submit_requests(
+                    url=urljoin(self.base_endpoint, "materials/summary/"),
+                    criteria={
+                        "batch_id": "gnome_r2scan_statics",
+                        "_fields": "material_id",
+                    },
+                    use_document_model=False,
+                    num_chunks=1,
+                    chunk_size=1,
+                    timeout=timeout if timeout is not None else self.timeout,
+                )
+                .get("meta", {})
+                .get("total_doc", 0)
+            )
+
+    def _access_condition(self, prefix: str) -> str:
+        """SQL condition excluding access-controlled data from a DeltaTable.
+
+        Args:
+            prefix (str) : S3 object prefix of the table
+
+        Returns:
+            str
+        """
+        if prefix.rstrip("/").split("/")[-1] == "tasks":
+            controlled_batch_str = ",".join(
+                [f"'{tag}'" for tag in self.access_controlled_batch_ids]
+            )
+            return f"batch_id NOT IN ({controlled_batch_str})"
+        return "builder_meta.license != 'BY-NC'"
+
+    def _dataset_schema(
+        self, versioned: bool
+    ) -> tuple[pa.Schema, pa.dataset.Partitioning | None]:
+        """Schema and partitioning of a local dataset.
+
+        Args:
+            versioned (bool): whether or not table is partitioned on db version
+
+        Returns:
+            pa.Schema : schema of the dataset
+            pa.dataset.Partitioning or None : partitioning of the dataset
+        """
+        schema = pa.schema(arrowize(self.document_model))
+        if not versioned:
+            return schema, None
+        return schema.insert(
+            0, pa.field("version", pa.string())
+        ), pa.dataset.partitioning(
+            pa.schema([pa.field("version", pa.string())]), flavor="hive"
+        )
+
+    @staticmethod
+    def _convert_local_dataset(target_path: str, versioned: bool) -> None:
+        """(Re)write the Delta log of a local dataset from its Parquet files.
+
+        Args:
+            target_path (str) : path to the local dataset
+            versioned (bool): whether or not table is partitioned on db version
+        """
+        shutil.rmtree(os.path.join(target_path, "_delta_log"), ignore_errors=True)
+        # The primary key index is stale, and must not be picked up as a data file
+        Path(target_path, _INDEX_FILE).unlink(missing_ok=True)
+        convert_to_deltalake(
+            target_path,
+            partition_by=(
+                Schema.from_arrow(pa.schema([pa.field("version", pa.string())]))
+                if versioned
+                else None
+            ),
+            partition_strategy="hive" if versioned else None,
+        )
+
+    @staticmethod
+    def _delta_files(delta_table: DeltaTable) -> dict[str, str | None]:
+        """Map the files of the current version of a DeltaTable to their partition.
+
+        Args:
+            delta_table (DeltaTable) : the DeltaTable
+
+        Returns:
+            dict of file path relative to the table to its "version" partition, if any
+        """
+        actions = pa.table(delta_table.get_add_actions(flatten=True))
+        partitions = (
+            actions["partition.version"].to_pylist()
+            if "partition.version" in actions.column_names
+            else [None] * actions.num_rows
+        )
+        return dict(zip(actions["path"].to_pylist(), partitions, strict=True))
+
+    @staticmethod
+    def _write_sync_state(
+        target_path: str,
+        delta_table: DeltaTable,
+        filtered: bool,
+        files: dict[str, dict[str, Any]],
+    ) -> None:
+        """Record which remote files a local dataset was built from.
+
+        Args:
+            target_path (str) : path to the local dataset
+            delta_table (DeltaTable) : remote DeltaTable the dataset was built from
+            filtered (bool) : whether access-controlled data was filtered out
+            files (dict) : remote file paths, mapped to their partition and whether
+                the local files built from them can be located (see `_sync_delta_dataset`)
+        """
+        with open(os.path.join(target_path, _SYNC_STATE_FILE), "w") as f:
+            json.dump(
+                {
+                    "table_uri": delta_table.table_uri,
+                    "table_version": delta_table.version(),
+                    "filtered": filtered,
+                    "files": files,
+                },
+                f,
+            )
+
+    def _sync_delta_dataset(
+        self,
+        bucket: str,
+        prefix: str,
+        target_path: str,
+        versioned: bool = False,
+        filtered: bool = False,
+        label: str | None = None,
+    ) -> bool:
+        """Incrementally update a local dataset to the current version of its DeltaTable.
+
+        The files of the DeltaTable are compared to those the local dataset was built
+        from, and only the data of added files is retrieved. For tables partitioned on
+        db version, partitions with removed files are retrieved again. Otherwise, the
+        local data of removed files is dropped if it can be located, i.e., it was
+        retrieved by an earlier sync. The Delta log of the local dataset is then rewritten.
+
+        Added files are read as plain parquet, so tables using deletion vectors or
+        column mapping are not updated incrementally.
+
+        Args:
+            bucket (str) : S3 OpenData bucket
+            prefix (str) : S3 object prefix
+            target_path (str) : path to the local dataset
+            versioned (bool): whether or not table is partitioned on db version
+            filtered (bool) : whether access-controlled data should be filtered out
+            label (str or None) : label of the table in QueryBuilder
+
+        Returns:
+            bool : False if the dataset cannot be updated incrementally
+        """
+        try:
+            with open(os.path.join(target_path, _SYNC_STATE_FILE)) as f:
+                state = json.load(f)
+        except (OSError, JSONDecodeError):
+            return False
+
+        _, tbl = self._get_delta_table(bucket, prefix, label=label)
+        tbl.update_incremental()
+        if state["table_uri"] != tbl.table_uri or state["filtered"] != filtered:
+            return False
+
+        if not self._plain_parquet_files(tbl):
+            logger.info(
+                f"The DeltaTable of {target_path} uses deletion vectors or column "
+                "mapping, retrieving the full dataset."
+            )
+            return False
+
+        if state["table_version"] == tbl.version():
+            logger.info(f"Dataset at {target_path} is up to date.")
+            return True
+
+        remote_files = self._delta_files(tbl)
+        local_files: dict[str, dict[str, Any]] = state["files"]
+        added = [path for path in remote_files if path not in local_files]
+        removed = [path for path in local_files if path not in remote_files]
+
+        if versioned:
+            stale = {local_files[path]["partition"] for path in removed}
+            for partition in stale:
+                shutil.rmtree(
+                    os.path.join(target_path, f"version={partition}"),
+                    ignore_errors=True,
+                )
+            added.extend(
+                path
+                for path, partition in remote_files.items()
+                if partition in stale and path not in added
+            )
+        elif not all(local_files[path]["synced"] for path in removed):
+            return False
+        else:
+            for path in removed:
+                for local_file in Path(target_path).glob(
+                    f"**/sync-{self._sync_digest(path)}-part-*.parquet"
+                ):
+                    local_file.unlink()
+
+        logger.info(
+            f"Updating dataset at {target_path}: retrieving {len(added)} files, "
+            f"dropping {len(removed)} files..."
+        )
+
+        fs, base_path = self._delta_file_system(tbl)
+        schema, partitioning = self._dataset_schema(versioned)
+        file_filter = self._access_filter(prefix) if filtered else None
+        params_list = [
+            {
+                "fs": fs,
+                "path": f"{base_path}/{unquote(path)}",
+                "partition": remote_files[path],
+                "schema": schema,
+                "partitioning": partitioning,
+                "file_filter": file_filter,
+                "target_path": target_path,
+                "basename_template": f"sync-{self._sync_digest(path)}-"
+                + "part-{i}.zstd.parquet",
+            }
+            for path in added
+        ]
+
+        pbar = (
+            tqdm(desc="Retrieving changed files", total=len(params_list))
+            if not self.mute_progress_bars
+            else None
+        )
+        for _ in self._multi_thread_iter(self._fetch_delta_file, params_list):
+            if pbar is not None:
+                pbar.update(1)
+        if pbar is not None:
+            pbar.close()
+
+        self._convert_local_dataset(target_path, versioned)
+        self._write_sync_state(
+            target_path,
+            tbl,
+            filtered,
+            {
+                path: {
+                    "partition": partition,
+                    "synced": path in added or local_files[path]["synced"],
+                }
+                for path, partition in remote_files.items()
+            },
+        )
+        logger.info(f"Dataset at {target_path} updated to version {tbl.version()}.")
+        return True
+
+    @staticmethod
+    def _plain_parquet_files(delta_table: DeltaTable) -> bool:
+        """Whether the data files of a DeltaTable hold its rows and columns as is.
+
+        Deletion vectors mark rows of a file as deleted outside of the file, and with
+        column mapping the columns of the files are named differently from the table.
+
+        Args:
+            delta_table (DeltaTable) : the DeltaTable
+
+        Returns:
+            bool
+        """
+        reader_features = delta_table.protocol().reader_features or []
+        column_mapping = delta_table.metadata().configuration.get(
+            "delta.columnMapping.mode", "none"
+        )
+        return "deletionVectors" not in reader_features and column_mapping == "none"
+
+    @staticmethod
+    def _sync_digest(path: str) -> str:
+        """Short digest of a remote file path, used to name the local files built from it."""
+        return hashlib.sha256(path.encode()).hexdigest()[:16]
+
+    def _delta_file_system(
+        self, delta_table: DeltaTable
+    ) -> tuple[pafs.FileSystem, str]:
+        """File system and base path of the files of a DeltaTable.
+
+        Args:
+            delta_table (DeltaTable) : the DeltaTable
+
+        Returns:
+            pafs.FileSystem : the file system
+            str : path to the table in the file system
+        """
+        uri = delta_table.table_uri.rstrip("/")
+        if uri.startswith(("s3://", "s3a://")):
+            return (
+                pafs.S3FileSystem(
+                    anonymous=True,
+                    region="us-east-1",
+                    connect_timeout=self.timeout * 3,
+                    request_timeout=self.timeout * 3,
+                ),
+                uri.split("://", 1)[1],
+            )
+        return pafs.FileSystem.from_uri(uri)
+
+    def _access_filter(self, prefix: str) -> pc.Expression:
+        """Filter expression excluding access-controlled data, see `_access_condition`.
+
+        Args:
+            prefix (str) : S3 object prefix of the table
+
+        Returns:
+            pc.Expression
+        """
+        if prefix.rstrip("/").split("/")[-1] == "tasks":
+            return ~pc.field("batch_id").isin(self.access_controlled_batch_ids)
+        return pc.field("builder_meta", "license") != "BY-NC"
+
+    @staticmethod
+    def _fetch_delta_file(
+        fs: pafs.FileSystem,
+        path: str,
+        partition: str | None,
+        schema: pa.Schema,
+        partitioning: pa.dataset.Partitioning | None,
+        file_filter: pc.Expression | None,
+        target_path: str,
+        basename_template: str,
+    ) -> None:
+        """Copy the data of a file of a DeltaTable to a local dataset.
+
+        Args:
+            fs (pafs.FileSystem) : file system of the DeltaTable
+            path (str) : path to the file in the file system
+            partition (str or None) : "version" partition of the file
+            schema (pa.Schema) : schema of the local dataset
+            partitioning (pa.dataset.Partitioning or None) : partitioning of the local dataset
+            file_filter (pc.Expression or None) : filter on the rows to copy
+            target_path (str) : path to the local dataset
+            basename_template (str) : template of the names of the local files
+        """
+        data = pq.read_table(path, filesystem=fs, filters=file_filter)
+        # Partition values are stored in the Delta log, rather than the file
+        columns = [
+            (
+                pa.array([partition] * data.num_rows, pa.string())
+                if field.name == "version" and partitioning is not None
+                else (
+                    data[field.name]
+                    if field.name in data.column_names
+                    else pa.nulls(data.num_rows, field.type)
+                )
+            )
+            for field in schema
+        ]
+        ds.write_dataset(
+            pa.Table.from_arrays(columns, names=schema.names).cast(schema),
+            base_dir=target_path,
+            format="parquet",
+            partitioning=partitioning,
+            basename_template=basename_template,
+            existing_data_behavior="overwrite_or_ignore",
+            max_rows_per_group=1024,
+            file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+        )
+
     def _query_delta_backed(
         self,
         bucket: str,
@@ -712,26 +1378,7 @@ class BaseRester(_Rester):
         # just in case
         prefix = prefix.rstrip("/")
 
-        # Check if user has access to GNoMe
-        # temp suppress tqdm
-        re_enable = not self.mute_progress_bars
-        self.mute_progress_bars = True
-        has_gnome_access = bool(
-            self._submit_requests(
-                url=urljoin(self.base_endpoint, "materials/summary/"),
-                criteria={
-                    "batch_id": "gnome_r2scan_statics",
-                    "_fields": "material_id",
-                },
-                use_document_model=False,
-                num_chunks=1,
-                chunk_size=1,
-                timeout=timeout if timeout is not None else self.timeout,
-            )
-            .get("meta", {})
-            .get("total_doc", 0)
-        )
-        self.mute_progress_bars = not re_enable
+        has_gnome_access = self._has_controlled_access(timeout)
 
         suffix = prefix.rsplit("/")[1]
 
@@ -742,43 +1389,49 @@ class BaseRester(_Rester):
         )
         os.makedirs(target_path, exist_ok=True)
 
+        filtered = access_controlled and not has_gnome_access
+
         if DeltaTable.is_deltatable(target_path):
-            if self.force_renew:
+            if self.force_renew or (
+                self.sync_datasets
+                and not self._sync_delta_dataset(
+                    bucket,
+                    prefix,
+                    target_path,
+                    versioned=versioned,
+                    filtered=filtered,
+                    label=label,
+                )
+            ):
                 shutil.rmtree(target_path)
                 logger.warning(f"Regenerating {suffix} dataset at {target_path}...")
                 os.makedirs(target_path, exist_ok=True)
             else:
-                logger.warning(
-                    f"Dataset for {suffix} already exists at {target_path}, returning existing dataset."
-                )
-                logger.info(
-                    "Delete or move existing dataset or re-run search query with MPRester(force_renew=True) "
-                    "to refresh local dataset.",
-                )
+                if not self.sync_datasets:
+                    logger.warning(
+                        f"Dataset for {suffix} already exists at {target_path}, returning existing dataset."
+                    )
+                    logger.info(
+                        "Delete or move existing dataset or re-run search query with "
+                        "MPRester(sync_datasets=True) to update, or MPRester(force_renew=True) "
+                        "to regenerate the local dataset.",
+                    )
 
                 return {
                     "data": MPDataset(
                         path=target_path,
                         document_model=self.document_model,
                         use_document_model=self.use_document_model,
+                        primary_key=self.primary_key,
                     )
                 }
 
         tbl_lbl, tbl = self._get_delta_table(bucket, prefix, label=label)
+        # Files of the snapshot being downloaded, to allow syncing the dataset later
+        remote_files = self._delta_files(tbl)
 
-        controlled_batch_str = ",".join(
-            [f"'{tag}'" for tag in self.access_controlled_batch_ids]
-        )
         _coll = prefix.split("/")[-1]
-
-        if _coll == "tasks":
-            condition = f"batch_id NOT IN ({controlled_batch_str})"
-        else:
-            condition = "builder_meta.license != 'BY-NC'"
-
-        predicate = (
-            f"WHERE {condition}" if not has_gnome_access and access_controlled else ""
-        )
+        predicate = f"WHERE {self._access_condition(prefix)}" if filtered else ""
         # TODO: do we need something like this?
         # predicate += f"{' AND ' if predicate else 'WHERE '}version='{self.db_version}'"
 
@@ -812,67 +1465,19 @@ class BaseRester(_Rester):
 
         iterator = self.query_builder.execute(f"SELECT * FROM {tbl_lbl} {predicate}")
 
-        file_options = ds.ParquetFileFormat().make_write_options(compression="zstd")
-
-        def _flush(
-            accumulator: list[pa.RecordBatch],
-            group: int,
-            schema: pa.Schema,
-            partitioning: pa.dataset.Partitioning,
-        ):
-            # somewhere post datafusion 51.0.0 and arrow-rs 57.0.0
-            # casts to *View types began, need to cast back to base schema
-            # -> pyarrow is behind on implementation support for *View types
-            tbl = (
-                pa.Table.from_batches(accumulator)
-                .select(schema.names)
-                .cast(target_schema=schema)
-            )
-
-            ds.write_dataset(
-                tbl,
-                base_dir=target_path,
-                format="parquet",
-                partitioning=partitioning,
-                basename_template=f"group-{group}-" + "part-{i}.zstd.parquet",
-                existing_data_behavior="overwrite_or_ignore",
-                max_rows_per_group=1024,
-                file_options=file_options,
-            )
-
-        group = 1
-        size = 0
-        accumulator = []
-        _schema = pa.schema(arrowize(self.document_model))
-        schema = (
-            _schema.insert(0, pa.field("version", pa.string()))
-            if versioned
-            else _schema
-        )
-        partitioning_schema = pa.schema([pa.field("version", pa.string())])
-        partitioning = (
-            pa.dataset.partitioning(partitioning_schema, flavor="hive")
-            if versioned
-            else None
-        )
-        for page in iterator:
-            # arro3 rb to pyarrow rb for compat w/ pyarrow ds writer
-            rg = pa.record_batch(page)
-            accumulator.append(rg)
-            page_size = page.num_rows
-            size += rg.get_total_buffer_size()
-
-            if pbar is not None:
-                pbar.update(page_size)
-
-            if size >= MAPI_CLIENT_SETTINGS.DATASET_FLUSH_THRESHOLD:
-                _flush(accumulator, group, schema, partitioning)
-                group += 1
-                size = 0
-                accumulator.clear()
+        # Each batch is written as soon as it is consumed, and the query is only read
+        # ahead while the batches waiting to be written fit in the memory budget
+        schema, _ = self._dataset_schema(versioned)
+        with _StreamingDatasetWriter(
+            target_path,
+            schema,
+            partition_by="version" if versioned else None,
+        ) as writer:
+            for rg in _prefetch_batches(iterator, _dataset_memory_budget()):
+                writer.write_batch(rg)
 
-        if accumulator:
-            _flush(accumulator, group + 1, schema, partitioning)
+                if pbar is not None:
+                    pbar.update(rg.num_rows)
 
         if pbar is not None:
             pbar.close()
@@ -880,12 +1485,15 @@ class BaseRester(_Rester):
         logger.info(f"Dataset for {suffix} written to {target_path}")
         logger.info("Converting to DeltaTable...")
 
-        delta_paritioning = Schema.from_arrow(partitioning_schema)
-
-        convert_to_deltalake(
+        self._convert_local_dataset(target_path, versioned)
+        self._write_sync_state(
             target_path,
-            partition_by=delta_paritioning if versioned else None,
-            partition_strategy="hive" if versioned else None,
+            tbl,
+            filtered,
+            {
+                path: {"partition": partition, "synced": False}
+                for path, partition in remote_files.items()
+            },
         )
 
         logger.info(
@@ -898,6 +1506,7 @@ class BaseRester(_Rester):
                 path=target_path,
                 document_model=self.document_model,
                 use_document_model=self.use_document_model,
+                primary_key=self.primary_key,
             )
         }
 
@@ -931,33 +1540,37 @@ class BaseRester(_Rester):
             "meta" containing meta information, e.g. total number of documents
             available.
         """
+        # When planning a search, only record the query, see `_record_queries`
+        if (plan := _QUERY_PLAN.get()) is not None and plan[0] is self:
+            plan[1].append(
+                {
+                    "criteria": copy(criteria),
+                    "fields": fields,
+                    "suburl": suburl,
+                    "use_document_model": (
+                        self.use_document_model
+                        if use_document_model is None
+                        else use_document_model
+                    ),
+                    "num_chunks": num_chunks,
+                    "chunk_size": chunk_size,
+                    "timeout": timeout,
+                }
+            )
+            return {"data": [], "meta": {"total_doc": 0}}
+
         if use_document_model is None:
             use_document_model = self.use_document_model
 
         timeout = self.timeout if timeout is None else timeout
 
-        criteria = {k: v for k, v in (criteria or {}).items() if v is not None}
+        criteria = self._prepare_criteria(criteria, fields=fields, suburl=suburl)
 
         # Query s3 if no query is passed and all documents are asked for
         # TODO also skip fields set to same as their default
         no_query = not {field for field in criteria if field[0] != "_"}
         query_s3 = no_query and num_chunks is None
 
-        if fields:
-            if isinstance(fields, str):
-                fields = [fields]
-
-            if not suburl:
-                invalid_fields = [
-                    f for f in fields if f.split(".", 1)[0] not in self.available_fields
-                ]
-                if invalid_fields:
-                    raise MPRestError(
-                        f"invalid fields requested: {invalid_fields}. Available fields: {self.available_fields}"
-                    )
-
-            criteria["_fields"] = ",".join(fields)
-
         try:
             url = validate_endpoint(self.endpoint, suffix=suburl)
 
@@ -968,28 +1581,7 @@ class BaseRester(_Rester):
                     else "Retrieving documents"
                 )
 
-                if "/" not in self.suffix:
-                    suffix = self.suffix
-                elif self.suffix == "molecules/summary":
-                    suffix = "molecules"
-                elif self.suffix == "molecules/jcesr":
-                    suffix = "jcesr"
-                else:
-                    infix, suffix = self.suffix.split("/", 1)
-                    suffix = infix if suffix == "core" else suffix
-                    suffix = suffix.replace("_", "-")
-
-                if "tasks" in suffix:
-                    bucket_suffix, prefix = ("parsed", "core/tasks")
-                elif suffix in STATIC_COLLECTIONS:
-                    bucket_suffix = "build"
-                    prefix = f"static-collections/{suffix}"
-                else:
-                    # TODO: remove once all collections are migrated to delta-backed format
-                    bucket_suffix = "build"
-                    prefix = f"collections/{suffix}"
-
-                bucket = f"materialsproject-{bucket_suffix}"
+                suffix, bucket, prefix = self._bulk_data_location()
 
                 if self.delta_backed:
                     access_controlled = suffix in CONTROLLED_COLLECTIONS
@@ -1078,13 +1670,272 @@ class BaseRester(_Rester):
                     num_chunks=num_chunks,
                     chunk_size=chunk_size,
                     timeout=timeout,
+                    on_total=(
+                        partial(
+                            self._query_delta_pushdown,
+                            criteria,
+                            use_document_model=use_document_model,
+                            timeout=timeout,
+                        )
+                        if num_chunks is None
+                        and self.delta_backed
+                        and MAPI_CLIENT_SETTINGS.DELTA_PUSHDOWN
+                        else None
+                    ),
                 )
             return data
 
         except RequestException as ex:
             raise MPRestError(str(ex))
 
-    def _submit_requests(
+    def _bulk_data_location(self) -> tuple[str, str, str]:
+        """Locate the bulk data of this rester's collection on S3.
+
+        Returns:
+            str : name of the collection
+            str : S3 OpenData bucket
+            str : S3 object prefix
+        """
+        if "/" not in self.suffix:
+            suffix = self.suffix
+        elif self.suffix == "molecules/summary":
+            suffix = "molecules"
+        elif self.suffix == "molecules/jcesr":
+            suffix = "jcesr"
+        else:
+            infix, suffix = self.suffix.split("/", 1)
+            suffix = infix if suffix == "core" else suffix
+            suffix = suffix.replace("_", "-")
+
+        if "tasks" in suffix:
+            bucket_suffix, prefix = ("parsed", "core/tasks")
+        elif suffix in STATIC_COLLECTIONS:
+            bucket_suffix = "build"
+            prefix = f"static-collections/{suffix}"
+        else:
+            # TODO: remove once all collections are migrated to delta-backed format
+            bucket_suffix = "build"
+            prefix = f"collections/{suffix}"
+
+        return suffix, f"materialsproject-{bucket_suffix}", prefix
+
+    def _query_delta_pushdown(
+        self,
+        criteria: dict[str, Any],
+        num_docs: int,
+        use_document_model: bool,
+        timeout: int | None = None,
+    ) -> dict[str, Any] | None:
+        """Serve a query from the DeltaTable of this rester's collection.
+
+        The criteria and fields of the query are translated to a SQL WHERE clause
+        and column list, so that only the matching rows and requested columns of
+        the Parquet files on S3 are read. Queries which cannot be translated, or
+        which match fewer than `DELTA_PUSHDOWN_MIN_DOCS` documents, are left to
+        the API. Rows of versioned collections are restricted to the database
+        version of this rester.
+
+        Args:
+            criteria (dict) : query parameters of the API request
+            num_docs (int) : number of matching documents, as reported by the API
+                with the first page of the query
+            use_document_model (bool) : whether to use the document model
+            timeout (int or None) : timeout on getting access-controlled groups
+
+        Returns:
+            dict of str to Any, or None if the query should be sent to the API
+        """
+        if num_docs < MAPI_CLIENT_SETTINGS.DELTA_PUSHDOWN_MIN_DOCS:
+            return None
+
+        schema = _arrow_schema(self.document_model) if self.document_model else None
+        sql = _criteria_to_sql(criteria, schema) if schema is not None else None
+        if sql is None:
+            return None
+        columns, conditions = sql
+        if columns == "*":
+            # Not the "version" partition column of the table
+            columns = ", ".join(f'"{name}"' for name in schema.names)  # type: ignore[union-attr]
+
+        suffix, bucket, prefix = self._bulk_data_location()
+        tbl_lbl, _ = self._get_delta_table(bucket, prefix)
+        if suffix != "tasks" and suffix not in STATIC_COLLECTIONS:
+            # Partitions are named after the database version with dashes
+            conditions.append(f"version = '{self.db_version.replace('.', '-')}'")
+        if suffix in CONTROLLED_COLLECTIONS and not self._has_controlled_access(
+            timeout
+        ):
+            conditions.append(self._access_condition(prefix))
+
+        query = f"SELECT {columns} FROM {tbl_lbl}"
+        if conditions:
+            query += f" WHERE {' AND '.join(conditions)}"
+
+        pbar = (
+            tqdm(
+                desc=f"Retrieving DeltaTable-backed {self.document_model.__name__} documents",
+                total=num_docs,
+            )
+            if not self.mute_progress_bars
+            else None
+        )
+
+        docs: list[dict[str, Any]] = []
+        try:
+            for batch in self.query_builder.execute(query):
+                # arro3 rb to pyarrow rb
+                docs.extend(pa.record_batch(batch).to_pylist(maps_as_pydicts="strict"))
+                if pbar is not None:
+                    pbar.update(batch.num_rows)
+        except Exception as e:
+            raise MPRestError(
+                f"Failed to retrieve documents due to: {e}. "
+                f"If this is a timeout error, try increasing the 'timeout' "
+                f"parameter on MPRester (current value: {self.timeout}s)."
+            ) from e
+        finally:
+            if pbar is not None:
+                pbar.close()
+
+        return {
+            "data": (
+                _convert_to_model(
+                    docs,
+                    self.document_model,
+                    requested_fields=(
+                        criteria["_fields"].split(",")
+                        if isinstance(criteria.get("_fields"), str)
+                        else None
+                    ),
+                )
+                if use_document_model
+                else docs
+            ),
+            "meta": {"total_doc": len(docs)},
+        }
+
+    def _prepare_criteria(
+        self,
+        criteria: dict | None = None,
+        fields: list[str] | None = None,
+        suburl: str | None = None,
+    ) -> dict[str, Any]:
+        """Drop unset criteria and add the validated projection of fields.
+
+        Arguments:
+            criteria: dictionary of criteria to filter down
+            fields: list of fields to return
+            suburl: make a request to a specified sub-url
+
+        Returns:
+            The criteria to send to the server
+        """
+        criteria = {k: v for k, v in (criteria or {}).items() if v is not None}
+
+        if fields:
+            if isinstance(fields, str):
+                fields = [fields]
+
+            if not suburl:
+                invalid_fields = [
+                    f for f in fields if f.split(".", 1)[0] not in self.available_fields
+                ]
+                if invalid_fields:
+                    raise MPRestError(
+                        f"invalid fields requested: {invalid_fields}. Available fields: {self.available_fields}"
+                    )
+
+            criteria["_fields"] = ",".join(fields)
+
+        return criteria
+
+    def _query_resource_iter(
+        self,
+        criteria: dict | None = None,
+        fields: list[str] | None = None,
+        suburl: str | None = None,
+        use_document_model: bool | None = None,
+        num_chunks: int | None = None,
+        chunk_size: int | None = None,
+        timeout: int | None = None,
+    ) -> Iterator[list[BaseModel] | list[dict]]:
+        """Lazily query the endpoint, yielding one page of documents at a time.
+
+        Only one page of documents is decoded and validated at a time, so that
+        large queries can be processed without holding all results in memory.
+        Full downloads of a collection (no query and `num_chunks=None`) are
+        retrieved from the bulk data store first, and then yielded in chunks
+        projected on `fields` (see `MPDataset.iter_batches`).
+
+        Arguments:
+            criteria: dictionary of criteria to filter down
+            fields: list of fields to return
+            suburl: make a request to a specified sub-url
+            use_document_model: if None, will defer to the self.use_document_model attribute
+            num_chunks: Maximum number of chunks of data to yield. None will yield all possible.
+            chunk_size: Number of data entries per chunk.
+            timeout (float or None): Time in seconds to wait until a request timeout error is thrown
+
+        Yields:
+            Lists of documents, one per page
+        """
+        if use_document_model is None:
+            use_document_model = self.use_document_model
+
+        timeout = self.timeout if timeout is None else timeout
+
+        if self._is_full_download(criteria, num_chunks):
+            data = self._query_resource(
+                criteria=criteria,
+                fields=fields,
+                suburl=suburl,
+                use_document_model=use_document_model,
+                chunk_size=chunk_size,
+                timeout=timeout,
+            )["data"]
+            if isinstance(data, MPDataset):
+                columns = (
+                    [f for f in fields if f in data.pyarrow_dataset.schema.names]
+                    if fields
+                    else None
+                )
+                options = {"batch_size": chunk_size} if chunk_size else {}
+                yield from data.iter_batches(columns=columns, **options)
+                return
+
+            chunk_size = chunk_size or len(data) or 1
+            for start in range(0, len(data), chunk_size):
+                yield data[start : start + chunk_size]
+            return
+
+        criteria = self._prepare_criteria(criteria, fields=fields, suburl=suburl)
+
+        try:
+            url = validate_endpoint(self.endpoint, suffix=suburl)
+            for page in self._submit_requests_iter(
+                url=url,
+                criteria=criteria,
+                use_document_model=use_document_model,
+                num_chunks=num_chunks,
+                chunk_size=chunk_size,
+                timeout=timeout,
+            ):
+                yield page["data"]
+
+        except RequestException as ex:
+            raise MPRestError(str(ex))
+
+    @staticmethod
+    def _is_full_download(criteria: dict | None, num_chunks: int | None) -> bool:
+        """Whether a query retrieves a full collection from the bulk data store."""
+        no_query = not {
+            field
+            for field, v in (criteria or {}).items()
+            if field[0] != "_" and v is not None
+        }
+        return no_query and num_chunks is None
+
+    def _submit_requests(
         self,
         url: str,
         criteria: dict[str, Any],
@@ -1094,11 +1945,16 @@ class BaseRester(_Rester):
         timeout: int | None = None,
         max_batch_size: int = 100,
         norecur: bool = False,
+        on_total: Callable[[int], dict | None] | None = None,
     ) -> dict:
-        """Handle submitting requests sequentially with pagination.
+        """Handle submitting requests with pagination and combine the results.
 
         If criteria contains comma-separated parameters (except those that are naturally comma-separated),
-        split them into multiple sequential requests and combine results.
+        split them into multiple concurrent requests and combine results.
+
+        If `on_total` is given, it is called with the total number of documents
+        reported with the first page. When it returns results, no further pages
+        are requested and these results are returned instead.
 
         Arguments:
             url (str): url used to make request
@@ -1110,10 +1966,59 @@ class BaseRester(_Rester):
             max_batch_size (int) : Maximum size of a batch when retrieving batches in parallel
             norecur (bool) : Whether to forbid recursive splitting of a query field
                 when a direct query fails
+            on_total (callable or None) : Callback taking the total number of
+                documents, returning results replacing those of the API or None
 
         Returns:
             Dictionary containing data and metadata
         """
+        total_data: dict[str, Any] = {"data": []}
+        data_chunks = []
+        metas = []
+        with closing(
+            self._submit_requests_iter(
+                url=url,
+                criteria=criteria,
+                use_document_model=use_document_model,
+                chunk_size=chunk_size,
+                num_chunks=num_chunks,
+                timeout=timeout,
+                max_batch_size=max_batch_size,
+                norecur=norecur,
+            )
+        ) as pages:
+            for page in pages:
+                if on_total is not None and not data_chunks:
+                    total_num_docs = page.get("meta", {}).get("total_doc", 0)
+                    if (results := on_total(total_num_docs)) is not None:
+                        return results
+                data_chunks.append(page["data"])
+                if "meta" in page:
+                    metas.append(page["meta"])
+
+        total_data["data"] = list(chain.from_iterable(data_chunks))
+
+        if metas:
+            total_data["meta"] = metas[-1]
+            # Split queries report one total per batch
+            if len(metas) > 1:
+                total_data["meta"]["total_doc"] = sum(
+                    meta.get("total_doc", 0) for meta in metas
+                )
+
+        return total_data
+
+    @staticmethod
+    def _find_split_param(criteria: dict[str, Any]) -> tuple[str | None, list[str]]:
+        """Find a comma-separated parameter that can be split into batches of requests.
+
+        Arguments:
+            criteria (dict of str): dictionary of criteria to filter down
+
+        Returns:
+            The name of the parameter, or None if no parameter can be split,
+            and the list of its values
+        """
         # Parameters that naturally support comma-separated values and should NOT be split
         no_split_params = {
             "elements",
@@ -1133,17 +2038,8 @@ class BaseRester(_Rester):
             "condition_mixing_media",
             "condition_heating_atmosphere",
             "_fields",
-            "formula",
-            "chemsys",
         }
 
-        # Check if we need to split any comma-separated parameters
-        split_param = None
-        split_values = []
-        total_num_docs = 0  # Initialize before try/else blocks
-        data_chunks = []
-        total_data_len = 0
-
         for key, value in criteria.items():
             if (
                 isinstance(value, str)
@@ -1151,9 +2047,156 @@ class BaseRester(_Rester):
                 and key not in no_split_params
                 and not key.startswith("_")
             ):
-                split_param = key
-                split_values = value.split(",")
-                break
+                return key, value.split(",")
+        return None, []
+
+    @staticmethod
+    def _plan_batches(
+        url: str, criteria: dict[str, Any], split_param: str, split_values: list[str]
+    ) -> list[list[str]]:
+        """Split the values of a parameter into batches whose request URLs fit in MAX_URL_LENGTH.
+
+        Arguments:
+            url (str): url used to make request
+            criteria (dict of str): dictionary of criteria to filter down
+            split_param (str): name of the comma-separated parameter to split
+            split_values (list of str): values of the parameter
+
+        Returns:
+            The batches of values, in order
+        """
+        budget = MAPI_CLIENT_SETTINGS.MAX_URL_LENGTH - len(
+            f"{url}?{urlencode({**criteria, split_param: ''}, doseq=True)}"
+        )
+        separator = len(quote_plus(","))
+
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        length = 0
+        for value in split_values:
+            value_length = len(quote_plus(value))
+            if batch and length + separator + value_length > budget:
+                batches.append(batch)
+                batch, length = [], 0
+            length += value_length + (separator if batch else 0)
+            batch.append(value)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _submit_batched_requests_iter(
+        self,
+        url: str,
+        criteria: dict[str, Any],
+        split_param: str,
+        batches: list[list[str]],
+        **kwargs,
+    ) -> Iterator[dict[str, Any]]:
+        """Submit a query in concurrent batches of values of a parameter, yielding pages in order.
+
+        Arguments:
+            url (str): url used to make request
+            criteria (dict of str): dictionary of criteria to filter down
+            split_param (str): name of the comma-separated parameter to split
+            batches (list of list of str): batches of values of the parameter
+            **kwargs: other arguments of `_submit_requests_iter`
+
+        Yields:
+            Dictionaries containing a page of data, and metadata for the first page of a batch
+        """
+
+        def _retrieve_batch(batch_criteria: dict[str, Any]) -> list[dict[str, Any]]:
+            return list(
+                self._submit_requests_iter(url=url, criteria=batch_criteria, **kwargs)
+            )
+
+        pbar = (
+            tqdm(
+                desc=f"Retrieving {sum(len(batch) for batch in batches)} "
+                f"{split_param} values in {len(batches)} batches",
+                total=len(batches),
+            )
+            if not self.mute_progress_bars
+            else None
+        )
+
+        try:
+            # Batches are retrieved concurrently, up to PREFETCH_DEPTH batches
+            # ahead of the batch being yielded
+            with closing(
+                self._multi_thread_iter(
+                    _retrieve_batch,
+                    [
+                        {"batch_criteria": {**criteria, split_param: ",".join(batch)}}
+                        for batch in batches
+                    ],
+                    max_pending=MAPI_CLIENT_SETTINGS.PREFETCH_DEPTH + 1,
+                )
+            ) as results:
+                for pages in results:
+                    yield from pages
+
+                    if pbar is not None:
+                        pbar.update(1)
+        finally:
+            if pbar is not None:
+                pbar.close()
+
+    def _submit_requests_iter(
+        self,
+        url: str,
+        criteria: dict[str, Any],
+        use_document_model: bool,
+        chunk_size: int | None,
+        num_chunks: int | None = None,
+        timeout: int | None = None,
+        max_batch_size: int = 100,
+        norecur: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily submit requests with pagination, yielding one page at a time.
+
+        If criteria contains comma-separated parameters (except those that are naturally comma-separated),
+        split them into concurrent batches of requests whose URLs fit within MAX_URL_LENGTH.
+        If the server still rejects a request, split it into batches of `max_batch_size`.
+
+        Pages are yielded in order. The first page of every (batched) query also
+        carries the "meta" information returned by the server.
+
+        Arguments:
+            url (str): url used to make request
+            criteria (dict of str): dictionary of criteria to filter down
+            use_document_model (bool): whether to use the document model
+            num_chunks (int or None): Maximum number of chunks of data to yield. None will yield all possible.
+            chunk_size (int or None): Number of data entries per chunk.
+            timeout (int or None): Time in seconds to wait until a request timeout error is thrown
+            max_batch_size (int) : Maximum size of a batch when retrieving batches in parallel
+            norecur (bool) : Whether to forbid recursive splitting of a query field
+                when a direct query fails
+
+        Yields:
+            Dictionaries containing a page of data, and metadata for the first page of a query
+        """
+        split_param, split_values = self._find_split_param(criteria)
+
+        # Size batches up front, rather than waiting for the server to reject a long URL
+        batches = (
+            self._plan_batches(url, criteria, split_param, split_values)
+            if split_param and len(split_values) > 1
+            else []
+        )
+        if split_param and len(batches) > 1:
+            yield from self._submit_batched_requests_iter(
+                url=url,
+                criteria=criteria,
+                split_param=split_param,
+                batches=batches,
+                use_document_model=use_document_model,
+                chunk_size=chunk_size,
+                num_chunks=num_chunks,
+                timeout=timeout,
+                max_batch_size=max_batch_size,
+            )
+            return
 
         # If we found a parameter to split, try the request first and only split on error
         if split_param and len(split_values or []) > 1:
@@ -1167,55 +2210,46 @@ class BaseRester(_Rester):
                     use_document_model=use_document_model,
                     timeout=timeout,
                 )
-
-                # If successful, continue with normal pagination
-                data_chunks = [data["data"]]
-                total_data: dict[str, Any] = {"data": []}
-                total_data_len = len(data["data"])
-
-                if "meta" in data:
-                    total_data["meta"] = data["meta"]
-
-                # Continue with pagination if needed (handled below)
+                # If successful, continue with normal pagination (handled below)
 
             except MPRestError as e:
                 # If we get 422 or 414 error, split into batches
-                if not norecur and any(
+                if norecur or not any(
                     trace in str(e)
                     for trace in (
                         "422",
                         "414",
                     )
                 ):
-                    total_data = {"data": []}
-                    total_num_docs = 0
-                    data_chunks = []
-
-                    # Batch the split values to reduce number of requests
-                    # Use batches of up to 100 values to balance URL length and request count
-                    num_batches = min(
-                        max_batch_size, max(1, len(split_values) // max_batch_size)
-                    )
-                    batch_size = min(len(split_values), max_batch_size)
-
-                    # Setup progress bar for split parameter requests
-                    pbar_message = f"Retrieving {len(split_values)} {split_param} values in {num_batches} batches"
-                    pbar = (
-                        tqdm(
-                            desc=pbar_message,
-                            total=num_batches,
-                        )
-                        if not self.mute_progress_bars
-                        else None
+                    # Re-raise other errors
+                    raise
+
+                # Batch the split values to reduce number of requests
+                # Use batches of up to 100 values to balance URL length and request count
+                num_batches = min(
+                    max_batch_size, max(1, len(split_values) // max_batch_size)
+                )
+                batch_size = min(len(split_values), max_batch_size)
+
+                # Setup progress bar for split parameter requests
+                pbar_message = f"Retrieving {len(split_values)} {split_param} values in {num_batches} batches"
+                pbar = (
+                    tqdm(
+                        desc=pbar_message,
+                        total=num_batches,
                     )
+                    if not self.mute_progress_bars
+                    else None
+                )
 
+                try:
                     for batch in _batched(split_values, batch_size):
                         split_criteria = copy(criteria)
                         split_criteria[split_param] = ",".join(batch)
 
-                        # Recursively call _submit_requests with the batch
+                        # Recursively submit the batch
                         # This will trigger another split if the batch is still too large
-                        result = self._submit_requests(
+                        yield from self._submit_requests_iter(
                             url=url,
                             criteria=split_criteria,
                             use_document_model=use_document_model,
@@ -1225,30 +2259,15 @@ class BaseRester(_Rester):
                             norecur=len(batch) <= max_batch_size,
                         )
 
-                        data_chunks.append(result["data"])
-                        if "meta" in result:
-                            total_data["meta"] = result["meta"]
-                            total_num_docs += result["meta"].get("total_doc", 0)
-
                         if pbar is not None:
                             pbar.update(1)
-
+                finally:
                     if pbar is not None:
                         pbar.close()
 
-                    total_data["data"] = list(chain.from_iterable(data_chunks))
-
-                    # Update total_doc if we have meta
-                    if "meta" in total_data:
-                        total_data["meta"]["total_doc"] = total_num_docs
-
-                    return total_data
-                else:
-                    # Re-raise other errors
-                    raise
+                return
         else:
             # No splitting needed - get first page
-            total_data = {"data": []}
             initial_criteria = copy(criteria)
             if isinstance(
                 initial_criteria.get("_page"), int
@@ -1262,13 +2281,7 @@ class BaseRester(_Rester):
                 timeout=timeout,
             )
 
-            data_chunks = [data["data"]]
-            total_data_len = len(data["data"])
-
-            if "meta" in data:
-                total_data["meta"] = data["meta"]
-
-        # otherwise, paginate sequentially
+        # otherwise, paginate
         if chunk_size is None or chunk_size < 1:
             raise ValueError(
                 "A positive chunk size must be provided to enable pagination"
@@ -1282,6 +2295,12 @@ class BaseRester(_Rester):
         # Get total number of docs needed
         num_docs_needed = min((max_pages * chunk_size), total_num_docs)
 
+        first_page: dict[str, Any] = {"data": data["data"][:num_docs_needed]}
+        if "meta" in data:
+            first_page["meta"] = data["meta"]
+
+        initial_data_length = len(data["data"])
+
         # Setup progress bar
         pbar_message = (  # type: ignore
             f"Retrieving {self.document_model.__name__} documents"  # type: ignore
@@ -1297,21 +2316,15 @@ class BaseRester(_Rester):
             else None
         )
 
-        initial_data_length = total_data_len
-
         if pbar is not None:
             pbar.update(initial_data_length)
 
         # If we have all the results in a single page, return directly
         if initial_data_length >= num_docs_needed or num_chunks == 1:
-            new_total_data = copy(total_data)
-            new_total_data["data"] = list(chain.from_iterable(data_chunks))[
-                :num_docs_needed
-            ]
-
             if pbar is not None:
                 pbar.close()
-            return new_total_data
+            yield first_page
+            return
 
         # Warning to select specific fields only for many results
         if criteria.get("_all_fields", False) and (total_num_docs / chunk_size > 10):
@@ -1327,52 +2340,91 @@ class BaseRester(_Rester):
         skip = criteria.get("_limit") or chunk_size
         remaining_docs = total_num_docs - initial_data_length
 
-        while total_data_len < num_docs_needed and remaining_docs > 0:
-            page_criteria = copy(criteria)
-            page_criteria["_skip"] = skip
+        try:
+            yield first_page
+
+            # The first page fixes the total, so every remaining page can be planned up front
+            page_params = [
+                {
+                    "url": url,
+                    "verify": True,
+                    "params": page_criteria,
+                    "timeout": timeout,
+                }
+                for page_criteria in self._plan_pages(
+                    criteria,
+                    skip=skip,
+                    chunk_size=chunk_size,
+                    num_docs=min(num_docs_needed - initial_data_length, remaining_docs),
+                )
+            ]
 
-            # Determine limit for this request
-            docs_still_needed = num_docs_needed - total_data_len
-            page_criteria["_limit"] = min(chunk_size, docs_still_needed, remaining_docs)
+            # Pages are downloaded in worker threads, up to PREFETCH_DEPTH pages
+            # ahead of the page being decoded and validated in this thread
+            with closing(
+                self._multi_thread_iter(
+                    self._submit_request,
+                    page_params,
+                    max_workers=(
+                        _max_parallel_requests()
+                        if MAPI_CLIENT_SETTINGS.CONCURRENT_PAGINATION
+                        else 1
+                    ),
+                    max_pending=MAPI_CLIENT_SETTINGS.PREFETCH_DEPTH + 1,
+                )
+            ) as responses:
+                for params, response in zip(page_params, responses, strict=True):
+                    data, _ = self._process_response(
+                        response, params["params"], use_document_model
+                    )
 
-            data, _ = self._submit_request_and_process(
-                url=url,
-                verify=True,
-                params=page_criteria,
-                use_document_model=use_document_model,
-                timeout=timeout,
-            )
+                    if pbar is not None:
+                        pbar.update(len(data["data"]))
 
-            data_chunks.append(data["data"])
-            chunk_len = len(data["data"])
-            total_data_len += chunk_len
+                    yield {"data": data["data"]}
 
+                    # Stop if we didn't get any data (shouldn't happen, but safety check)
+                    if not data["data"]:
+                        break
+        finally:
             if pbar is not None:
-                pbar.update(chunk_len)
-
-            skip += page_criteria["_limit"]
-            remaining_docs -= chunk_len
-
-            # Break if we didn't get any data (shouldn't happen, but safety check)
-            if chunk_len == 0:
-                break
+                pbar.close()
 
-        if pbar is not None:
-            pbar.close()
+    @staticmethod
+    def _plan_pages(
+        criteria: dict[str, Any], skip: int, chunk_size: int, num_docs: int
+    ) -> list[dict[str, Any]]:
+        """Split the retrieval of `num_docs` documents into paginated criteria.
 
-        total_data["data"] = list(chain.from_iterable(data_chunks))
+        Arguments:
+            criteria (dict of str): dictionary of criteria to filter down
+            skip (int): Number of documents already retrieved
+            chunk_size (int): Number of data entries per chunk.
+            num_docs (int): Number of documents still needed
 
-        return total_data
+        Returns:
+            list of criteria, one per page, with `_skip` and `_limit` set.
+        """
+        pages = []
+        for offset in range(0, max(num_docs, 0), chunk_size):
+            page_criteria = copy(criteria)
+            page_criteria["_skip"] = skip + offset
+            page_criteria["_limit"] = min(chunk_size, num_docs - offset)
+            pages.append(page_criteria)
+        return pages
 
     # this is here as a separate function to allow for multithreading when querying s3 buckets
-    # which is necessary to speed up retrieval of large data dumps
+    # and paginating, which is necessary to speed up retrieval of large data dumps
     def _multi_thread(
         self,
         func: Callable,
         params_list: list[dict],
         progress_bar: tqdm | None = None,
     ) -> list[tuple[Any, int, int]]:
-        """Handles setting up a threadpool and sending parallel requests.
+        """Send parallel requests on the executor of the client.
+
+        Called from a task of the executor, e.g., when nested in another parallel
+        request, the requests are sent one after another in the calling thread.
 
         Arguments:
             func (Callable): Callable function to multi
@@ -1385,62 +2437,151 @@ class BaseRester(_Rester):
         """
         return_data = []
 
-        params_gen = iter(
-            params_list
-        )  # Iter necessary for islice to keep track of what has been accessed
+        def _record(data: Any, subtotal: int, crit_ind: int) -> None:
+            if progress_bar is not None:
+                if isinstance(data, dict):
+                    size = len(data["data"])
+                elif isinstance(data, list):
+                    size = len(data)
+                else:
+                    size = 1
+                progress_bar.update(size)
 
-        params_ind = 0
+            return_data.append((data, subtotal, crit_ind))
 
-        with ThreadPoolExecutor(
-            max_workers=MAPI_CLIENT_SETTINGS.NUM_PARALLEL_REQUESTS  # type: ignore
-        ) as executor:
-            # Get list of initial futures defined by max number of parallel requests
-            futures = set()
+        if _in_worker():
+            # Waiting on the executor from one of its own workers could deadlock it
+            for params_ind, params in enumerate(params_list):
+                _record(*func(**params), params_ind)
+            return return_data
 
-            for params in itertools.islice(
-                params_gen,
-                MAPI_CLIENT_SETTINGS.NUM_PARALLEL_REQUESTS,  # type: ignore
-            ):
-                future = executor.submit(
-                    func,
-                    **params,
-                )
+        params_gen = enumerate(
+            params_list
+        )  # Iter necessary for islice to keep track of what has been accessed
 
-                future.crit_ind = params_ind  # type: ignore
-                futures.add(future)
-                params_ind += 1
+        # Get list of initial futures defined by max number of parallel requests
+        futures = set()
+        for params_ind, params in itertools.islice(
+            params_gen,
+            _max_parallel_requests(),
+        ):
+            future = _submit_in_context(self.executor, func, params)
+            future.crit_ind = params_ind  # type: ignore
+            futures.add(future)
 
+        try:
             while futures:
                 # Wait for at least one future to complete and process finished
                 finished, futures = wait(futures, return_when=FIRST_COMPLETED)
 
                 for future in finished:
-                    data, subtotal = future.result()
-
-                    if progress_bar is not None:
-                        if isinstance(data, dict):
-                            size = len(data["data"])
-                        elif isinstance(data, list):
-                            size = len(data)
-                        else:
-                            size = 1
-                        progress_bar.update(size)
-
-                    return_data.append((data, subtotal, future.crit_ind))  # type: ignore
+                    _record(*future.result(), future.crit_ind)  # type: ignore
 
                 # Populate more futures to replace finished
-                for params in itertools.islice(params_gen, len(finished)):
-                    new_future = executor.submit(
-                        func,
-                        **params,
-                    )
-
+                for params_ind, params in itertools.islice(params_gen, len(finished)):
+                    new_future = _submit_in_context(self.executor, func, params)
                     new_future.crit_ind = params_ind  # type: ignore
                     futures.add(new_future)
-                    params_ind += 1
+        finally:
+            for future in futures:
+                future.cancel()
 
         return return_data
 
+    def _multi_thread_iter(
+        self,
+        func: Callable,
+        params_list: list[dict],
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+    ) -> Iterator[Any]:
+        """Send parallel requests and lazily yield their results in the order of `params_list`.
+
+        Unlike `_multi_thread`, new requests are only submitted as results are consumed,
+        so that no more than `max_pending` requests are in flight or waiting to be
+        consumed at any time. While a result is being consumed, up to `max_pending - 1`
+        requests are in flight.
+
+        Requests are sent on the executor of the client, which caps the number of
+        requests in flight across all calls. Called from a task of the executor,
+        the requests are sent one after another in the calling thread.
+
+        Arguments:
+            func (Callable): Callable function to multi
+            params_list (list): list of dictionaries containing url and params for each request
+            max_workers (int or None): Maximum number of requests of this call in flight.
+                Defaults to MAX_PARALLEL_REQUESTS with ADAPTIVE_CONCURRENCY, and
+                NUM_PARALLEL_REQUESTS otherwise.
+            max_pending (int or None): Maximum number of results in flight or
+                waiting to be consumed. Defaults to `max_workers`.
+
+        Yields:
+            The return value of `func` for each request
+        """
+        max_workers = max_workers or _max_parallel_requests()
+        max_pending = max(max_pending or max_workers, 1)
+        params_gen = iter(params_list)
+
+        if _in_worker():
+            # Waiting on the executor from one of its own workers could deadlock it
+            for params in params_gen:
+                yield func(**params)
+            return
+
+        # Requests beyond `max_workers` wait here rather than in the shared executor,
+        # so that they do not hold up the requests of other calls
+        lock = threading.RLock()
+        waiting: deque[tuple[Future, dict]] = deque()
+        running: set[Future] = set()
+
+        def _start(result: Future, params: dict) -> None:
+            try:
+                future = _submit_in_context(self.executor, func, params)
+            except RuntimeError as exc:  # the executor was shut down
+                result.set_exception(exc)
+                return
+            running.add(future)
+            future.add_done_callback(partial(_finish, result))
+
+        def _finish(result: Future, future: Future) -> None:
+            with lock:
+                running.discard(future)
+                if waiting:
+                    _start(*waiting.popleft())
+
+            if future.cancelled():
+                result.cancel()
+            elif (exc := future.exception()) is not None:
+                result.set_exception(exc)
+            else:
+                result.set_result(future.result())
+
+        def _schedule(params: dict) -> Future:
+            result: Future = Future()
+            with lock:
+                if len(running) < max_workers:
+                    _start(result, params)
+                else:
+                    waiting.append((result, params))
+            return result
+
+        futures = deque(
+            _schedule(params) for params in itertools.islice(params_gen, max_pending)
+        )
+        try:
+            while futures:
+                yield futures.popleft().result()
+
+                # Only replace the finished request once its result is consumed
+                for params in itertools.islice(params_gen, 1):
+                    futures.append(_schedule(params))
+        finally:
+            # Do not wait on requests nobody will consume
+            with lock:
+                waiting.clear()
+                for future in list(running):
+                    future.cancel()
+
     def _submit_request_and_process(
         self,
         url: str,
@@ -1461,19 +2602,110 @@ class BaseRester(_Rester):
         Returns:
             Tuple with data and total number of docs in matching the query in the database.
         """
-        try:
-            response = self.session.get(
-                url=url,
-                verify=verify,
-                params=params,
-                timeout=timeout,
-                headers=self.headers,
-            )
-        except requests.exceptions.ConnectTimeout:
-            raise MPRestError(
-                f"REST query timed out on URL {url}. Try again with a smaller request."
+        response = self._submit_request(
+            url=url, verify=verify, params=params, timeout=timeout
+        )
+        return self._process_response(response, params, use_document_model)
+
+    def _submit_request(
+        self,
+        url: str,
+        verify: bool,
+        params: dict,
+        timeout: int | None = None,
+    ) -> requests.Response:
+        """Submits GET request and downloads the response, without decoding it.
+
+        Arguments:
+            url: URL to send request to
+            verify: whether to verify the server's TLS certificate
+            params: dictionary of parameters to send in the request
+            timeout: Time in seconds to wait until a request timeout error is thrown
+
+        Returns:
+            The response to the request
+        """
+        if self._response_cache is not None:
+            cache_key = self._response_cache_key(url, params)
+            if (content := self._response_cache.get(cache_key)) is not None:
+                return _cached_response(url, content)
+
+        limiter = get_limiter(
+            self.base_endpoint,
+            initial_limit=MAPI_CLIENT_SETTINGS.NUM_PARALLEL_REQUESTS,
+            max_limit=_max_parallel_requests(),
+            rate=MAPI_CLIENT_SETTINGS.REQUEST_RATE_LIMIT,
+            adaptive=MAPI_CLIENT_SETTINGS.ADAPTIVE_CONCURRENCY,
+        )
+        for attempt in range(MAPI_CLIENT_SETTINGS.MAX_RETRIES + 1):
+            started = limiter.acquire()
+            status_code = retry_after = None
+            try:
+                response = self.session.get(
+                    url=url,
+                    verify=verify,
+                    params=params,
+                    timeout=timeout,
+                    headers=self.headers,
+                )
+                status_code = response.status_code
+                if status_code == 429:
+                    # Pause all requests to the server for as long as it asks
+                    retry_after = _retry_after_seconds(
+                        response.headers.get("Retry-After")
+                    ) or MAPI_CLIENT_SETTINGS.BACKOFF_FACTOR * (2**attempt)
+            except requests.exceptions.ConnectTimeout:
+                raise MPRestError(
+                    f"REST query timed out on URL {url}. Try again with a smaller request."
+                )
+            finally:
+                limiter.release(started, status_code, retry_after)
+
+            if status_code != 429:
+                break
+
+        if self._response_cache is not None and response.status_code == 200:
+            self._response_cache.set(
+                cache_key, response.content, version=self.db_version
             )
 
+        return response
+
+    def _response_cache_key(self, url: str, params: dict) -> str:
+        """Key a GET request by its URL, normalized parameters, database version and API key.
+
+        Arguments:
+            url: URL to send request to
+            params: dictionary of parameters to send in the request
+
+        Returns:
+            A hash of the request
+        """
+        return hashlib.sha256(
+            json.dumps(
+                [
+                    url,
+                    sorted((k, str(v)) for k, v in params.items()),
+                    self.db_version,
+                    # Responses can depend on the access rights of the user
+                    hashlib.sha256((self.api_key or "").encode()).hexdigest(),
+                ]
+            ).encode()
+        ).hexdigest()
+
+    def _process_response(
+        self, response: Any, params: dict, use_document_model: bool
+    ) -> tuple[dict, int]:
+        """Decode the response to a GET request, or raise the error it contains.
+
+        Arguments:
+            response: requests or httpx response to a GET request
+            params: dictionary of parameters sent in the request
+            use_document_model: whether to use the document model
+
+        Returns:
+            Tuple with data and total number of docs in matching the query in the database.
+        """
         if response.status_code in [400]:
             raise MPRestError(
                 f"The server does not support the request made to {response.url}. "
@@ -1481,7 +2713,8 @@ class BaseRester(_Rester):
             )
 
         if response.status_code == 200:
-            data = load_json(response.text)
+            # Decoding the raw bytes skips guessing the text encoding of large responses
+            data = load_json(response.content)
             # other sub-urls may use different document models
             # the client does not handle this in a particularly smart way currently
             if self.document_model and use_document_model:
@@ -1582,6 +2815,7 @@ class BaseRester(_Rester):
         # If user specifies page, ensure only one chunk is returned
         if isinstance(kwargs.get("_page"), int) and num_chunks is None:
             num_chunks = 1
+
         return self._get_all_documents(
             kwargs,
             all_fields=all_fields,
@@ -1590,6 +2824,108 @@ class BaseRester(_Rester):
             num_chunks=num_chunks,
         )
 
+    def _plan_search(
+        self, *args, **kwargs
+    ) -> tuple[list[dict[str, Any]], list[BaseModel] | list[dict]]:
+        """Run the `search` method of this rester without retrieving documents.
+
+        Arguments:
+            *args: positional arguments of `search`
+            **kwargs: keyword arguments of `search`
+
+        Returns:
+            The keyword arguments of each query `search` made to `_query_resource`,
+            and the return value of `search` when no documents are retrieved.
+        """
+        search = getattr(self, "search", self._search)
+        with _record_queries(self) as plans:
+            results = search(*args, **kwargs)
+        return plans, results
+
+    def search_iter(self, *args, **kwargs) -> Iterator[list[BaseModel] | list[dict]]:
+        """Lazily search for documents, yielding one page of documents at a time.
+
+        Takes the same arguments as the `search` method of this rester. Pages of
+        `chunk_size` documents are retrieved, decoded and validated only as they
+        are consumed, so that the full set of results is never held in memory.
+
+        Example:
+            >>> with MPRester() as mpr:
+            >>>     for docs in mpr.materials.summary.search_iter(
+            >>>         elements=["Li"], fields=["material_id", "band_gap"], chunk_size=500
+            >>>     ):
+            >>>         ...
+
+        Arguments:
+            *args: positional arguments of `search`
+            **kwargs: keyword arguments of `search`
+
+        Yields:
+            Lists of documents, one per page
+        """
+        plans, _ = self._plan_search(*args, **kwargs)
+        for plan in plans:
+            yield from self._query_resource_iter(**plan)
+
+    def search_table(
+        self, *args, output: Literal["arrow", "pandas"] = "arrow", **kwargs
+    ) -> pa.Table | pd.DataFrame:
+        """Search for documents, returning them as a single table.
+
+        Takes the same arguments as the `search` method of this rester. Each page of
+        documents is converted straight from JSON to arrow, using the same schema as
+        the delta-backed datasets, see `emmet.core.arrow.arrowize`. No document models
+        are built, which is considerably faster and leaner for large tabular queries.
+
+        Example:
+            >>> with MPRester() as mpr:
+            >>>     df = mpr.materials.summary.search_table(
+            >>>         elements=["Li"], fields=["material_id", "band_gap"], output="pandas"
+            >>>     )
+
+        Arguments:
+            *args: positional arguments of `search`
+            output (str): "arrow" for a pyarrow Table, or "pandas" for a pandas DataFrame.
+            **kwargs: keyword arguments of `search`
+
+        Returns:
+            A pyarrow Table or pandas DataFrame, with one row per document
+        """
+        if output not in ("arrow", "pandas"):
+            raise MPRestError(
+                f"Unknown output {output!r}, should be 'arrow' or 'pandas'."
+            )
+
+        schema = _arrow_schema(self.document_model) if self.document_model else None
+        plans, _ = self._plan_search(*args, **kwargs)
+
+        tables = []
+        for plan in plans:
+            plan["use_document_model"] = False
+            if self._is_full_download(plan["criteria"], plan["num_chunks"]):
+                data = self._query_resource(**plan)["data"]
+                tables.append(
+                    data.pyarrow_dataset.to_table()
+                    if isinstance(data, MPDataset)
+                    else _docs_to_table(data, schema)
+                )
+                continue
+
+            tables.extend(
+                _docs_to_table(page, schema, fields=plan["fields"])
+                for page in self._query_resource_iter(**plan)
+            )
+
+        table = (
+            pa.concat_tables(tables, promote_options="permissive")
+            if tables
+            else _docs_to_table(
+                [], schema, fields=plans[0]["fields"] if plans else None
+            )
+        )
+
+        return table.to_pandas() if output == "pandas" else table
+
     def get_data_by_id(
         self,
         document_id: str,
@@ -1664,38 +3000,29 @@ class BaseRester(_Rester):
         Returns:
             int : Count of total results
         """
-        criteria = criteria or {}
-        user_preferences = (
-            self.use_document_model,
-            self.mute_progress_bars,
-        )
-        self.use_document_model, self.mute_progress_bars = (
-            False,
-            True,
-        )  # do not waste cycles decoding
-        results = self._query_resource(criteria=criteria, num_chunks=1, chunk_size=1)
-        cnt = results["meta"]["total_doc"]
-
-        no_query = not {field for field in criteria if field[0] != "_"}
-        if no_query and hasattr(self, "search"):
-            allowed_params = inspect.getfullargspec(self.search).args
-            if "deprecated" in allowed_params:
-                criteria["deprecated"] = True
-                results = self._query_resource(
-                    criteria=criteria, num_chunks=1, chunk_size=1
-                )
-                cnt += results["meta"]["total_doc"]
-                warnings.warn(
-                    "Omitting a query also includes deprecated documents in the results. "
-                    "Make sure to post-filter them out.",
-                    category=MPRestWarning,
-                    stacklevel=2,
-                )
-
-        (
-            self.use_document_model,
-            self.mute_progress_bars,
-        ) = user_preferences
+        criteria = dict(criteria or {})
+        # do not waste cycles decoding
+        with self._call_options(use_document_model=False, mute_progress_bars=True):
+            results = self._query_resource(
+                criteria=criteria, num_chunks=1, chunk_size=1
+            )
+            cnt = results["meta"]["total_doc"]
+
+            no_query = not {field for field in criteria if field[0] != "_"}
+            if no_query and hasattr(self, "search"):
+                allowed_params = inspect.getfullargspec(self.search).args
+                if "deprecated" in allowed_params:
+                    criteria["deprecated"] = True
+                    results = self._query_resource(
+                        criteria=criteria, num_chunks=1, chunk_size=1
+                    )
+                    cnt += results["meta"]["total_doc"]
+                    warnings.warn(
+                        "Omitting a query also includes deprecated documents in the results. "
+                        "Make sure to post-filter them out.",
+                        category=MPRestWarning,
+                        stacklevel=2,
+                    )
 
         if isinstance(cnt, str):
             raise MPRestError(f"Error counting documents: {cnt}")
@@ -1735,6 +3062,13 @@ class CoreRester(BaseRester):
         super().__init__(**kwargs)
         self.sub_resters = {k: v.copy() for k, v in self._sub_resters.items()}
 
+    def _child_resters(self) -> list[_Rester]:
+        return super()._child_resters() + [
+            lazy_rester._obj
+            for lazy_rester in self.sub_resters.values()
+            if isinstance(lazy_rester._obj, _Rester)
+        ]
+
     def __getattr__(self, v: str):
         if v in self.sub_resters:
             if self.sub_resters[v]._obj is None:
@@ -1743,13 +3077,16 @@ class CoreRester(BaseRester):
                     endpoint=self.base_endpoint,
                     include_user_agent=self.include_user_agent,
                     session=self.session,
-                    use_document_model=self.use_document_model,
+                    # Not the options of the current call, see `_call_options`
+                    use_document_model=self._use_document_model,
                     headers=self.headers,
-                    mute_progress_bars=self.mute_progress_bars,
+                    mute_progress_bars=self._mute_progress_bars,
                     db_version=self.db_version,
                     local_dataset_cache=self.local_dataset_cache,
                     force_renew=self.force_renew,
+                    sync_datasets=self.sync_datasets,
                     query_builder=self._query_builder,
+                    executor=self.executor,
                 )
             return self.sub_resters[v]
         raise AttributeError(f"{self.__class__} has no attribute {v}")
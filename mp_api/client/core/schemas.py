@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from functools import cached_property
+from functools import cached_property, lru_cache
 from importlib import import_module
 from itertools import chain
 from typing import TYPE_CHECKING, ForwardRef, get_args
@@ -57,14 +57,20 @@ class _DictLikeAccess(BaseModel):
         return self.__str__()
 
 
+# Maximum number of generated models to keep, see `_build_returned_model`
+_MAX_CACHED_MODELS = 256
+
+
 def _generate_returned_model(
     doc: dict[str, Any],
     document_model: type[BaseModel],
     model_name: str = "MPDataDoc",
     requested_fields: list[str] | None = None,
-) -> tuple[type[BaseModel], set[str], set[str]]:
+) -> tuple[type[BaseModel], frozenset[str], frozenset[str]]:
     """Dynamically generates a pydantic.BaseModel model from API response content.
 
+    Models are cached, so that pages of documents with the same fields share a model.
+
     Args:
         doc (dict): A single document returned from the API
         document_model (BaseModel) : Document model to infer annotations/validation from
@@ -73,14 +79,40 @@ def _generate_returned_model(
 
     Returns:
         BaseModel: the pydantic model representing the data
-        set of str: fields set in the document model
-        set of str: set_fields, fields_not_requested)
+        frozenset of str: fields set in the document model
+        frozenset of str: fields not requested
+    """
+    return _build_returned_model(
+        document_model,
+        model_name,
+        frozenset(doc).intersection(document_model.model_fields),
+        tuple(requested_fields or ()),
+    )
+
+
+@lru_cache(maxsize=_MAX_CACHED_MODELS)
+def _build_returned_model(
+    document_model: type[BaseModel],
+    model_name: str,
+    set_fields: frozenset[str],
+    requested_fields: tuple[str, ...],
+) -> tuple[type[BaseModel], frozenset[str], frozenset[str]]:
+    """Build the model returned by `_generate_returned_model`.
+
+    Args:
+        document_model (BaseModel) : Document model to infer annotations/validation from
+        model_name (str) : Class name of the dynamic model
+        set_fields (frozenset of str): fields of the document model set in the returned documents
+        requested_fields (tuple of str): fields to be returned
+
+    Returns:
+        BaseModel: the pydantic model representing the data
+        frozenset of str: fields set in the document model
+        frozenset of str: fields not requested
     """
     model_fields = document_model.model_fields
-    set_fields = set(doc).intersection(model_fields)
     unset_fields = set(model_fields).difference(set_fields)
-    user_requested_fields: list[str] = requested_fields or []
-    fields_not_requested = unset_fields.difference(user_requested_fields)
+    fields_not_requested = unset_fields.difference(requested_fields)
 
     # Update with locals() from external module if needed
     if any(
@@ -110,7 +142,7 @@ def _generate_returned_model(
         fields_not_requested=(list[str], list(fields_not_requested)),
         unavailable_fields=(
             list[str],
-            list(unset_fields.intersection(user_requested_fields)),
+            list(unset_fields.intersection(requested_fields)),
         ),
         __base__=_DictLikeAccess,
         __doc__=".".join(
@@ -173,7 +205,7 @@ def _generate_returned_model(
         ):
             setattr(data_model, attr, prop_method)
 
-    return data_model, set_fields, fields_not_requested
+    return data_model, set_fields, frozenset(fields_not_requested)
 
 
 def _convert_to_model(
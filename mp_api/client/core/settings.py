@@ -18,7 +18,7 @@ PMG_SETTINGS = _load_pmg_settings()
 _NUM_PARALLEL_REQUESTS = min(PMG_SETTINGS.get("MPRESTER_NUM_PARALLEL_REQUESTS", 4), 4)
 _MAX_RETRIES = min(PMG_SETTINGS.get("MPRESTER_MAX_RETRIES", 3), 3)
 _MUTE_PROGRESS_BAR = PMG_SETTINGS.get("MPRESTER_MUTE_PROGRESS_BARS", False)
-_MAX_LIST_LENGTH = min(PMG_SETTINGS.get("MPRESTER_MAX_LIST_LENGTH", 10000), 10000)
+_MAX_LIST_LENGTH = PMG_SETTINGS.get("MPRESTER_MAX_LIST_LENGTH", 250_000)
 
 _EMMET_SETTINGS = EmmetSettings()  # type: ignore[call-arg]
 _DEFAULT_ENDPOINT = "https://api.materialsproject.org/"
@@ -36,7 +36,45 @@ class MAPIClientSettings(BaseSettings):
 
     NUM_PARALLEL_REQUESTS: int = Field(
         _NUM_PARALLEL_REQUESTS,
-        description="Number of parallel requests to send.",
+        description="Number of parallel requests to send. With ADAPTIVE_CONCURRENCY, "
+        "the initial number of parallel requests.",
+    )
+
+    ADAPTIVE_CONCURRENCY: bool = Field(
+        True,
+        description="Whether to adapt the number of parallel requests to the server, "
+        "between 1 and MAX_PARALLEL_REQUESTS: it grows while responses stay fast, and "
+        "is halved when the server is rate limiting or overloaded.",
+    )
+
+    MAX_PARALLEL_REQUESTS: int | None = Field(
+        None,
+        description="Maximum number of parallel requests with ADAPTIVE_CONCURRENCY. "
+        "Defaults to 4 times NUM_PARALLEL_REQUESTS, which the client grows up to "
+        "while the server keeps up.",
+    )
+
+    REQUEST_RATE_LIMIT: float = Field(
+        25.0,
+        description="Maximum number of requests per second sent to a server by all "
+        "threads of a process. Set to 0 to disable.",
+    )
+
+    CONCURRENT_PAGINATION: bool = Field(
+        True,
+        description="Whether to retrieve the remaining pages of a paginated query in parallel, "
+        "using up to NUM_PARALLEL_REQUESTS requests at once.",
+    )
+
+    PREFETCH_DEPTH: int = Field(
+        4,
+        description="Maximum number of pages to download ahead of the page being decoded "
+        "and validated when paginating. Set to 0 to decode each page before requesting the next.",
+    )
+
+    NUM_ASYNC_REQUESTS: int = Field(
+        32,
+        description="Maximum number of requests an asynchronous client keeps in flight at once.",
     )
 
     MAX_RETRIES: int = Field(
@@ -59,7 +97,15 @@ class MAPIClientSettings(BaseSettings):
     )
 
     MAX_LIST_LENGTH: int = Field(
-        _MAX_LIST_LENGTH, description="Maximum length of query parameter list"
+        _MAX_LIST_LENGTH,
+        description="Maximum length of query parameter list. Longer lists are split "
+        "into requests whose URLs fit within MAX_URL_LENGTH.",
+    )
+
+    MAX_URL_LENGTH: int = Field(
+        8000,
+        description="Maximum length in characters of a request URL. Queries on long "
+        "lists of values are split into concurrent requests below this length.",
     )
 
     ENDPOINT: str = Field("", description="The default API endpoint to use.")
@@ -90,7 +136,71 @@ class MAPIClientSettings(BaseSettings):
 
     DATASET_FLUSH_THRESHOLD: int = Field(
         int(2.75 * 1024**3),
-        description="Threshold bytes to accumulate in memory before flushing dataset to disk",
+        description="Maximum bytes of downloaded data to buffer in memory before it is "
+        "written to disk when retrieving full datasets.",
+    )
+
+    DATASET_MEMORY_FRACTION: float = Field(
+        0.25,
+        description="Fraction of the available memory which downloaded data may occupy "
+        "before it is written to disk. The buffer is also capped by DATASET_FLUSH_THRESHOLD.",
+    )
+
+    DATASET_MAX_FILE_SIZE: int = Field(
+        512 * 1024**2,
+        description="Uncompressed bytes to write to a Parquet file of a local dataset "
+        "before starting a new one.",
+    )
+
+    DELTA_PUSHDOWN: bool = Field(
+        True,
+        description="Whether to serve large queries from the delta-backed datasets on S3, "
+        "filtering and projecting the Parquet files, instead of paginating through the API.",
+    )
+
+    DELTA_PUSHDOWN_MIN_DOCS: int = Field(
+        100_000,
+        description="Minimum number of documents matching a query to serve it from the "
+        "delta-backed datasets.",
+    )
+
+    CACHE_DIR: Path = Field(
+        Path("~/.cache/mp_api").expanduser(),
+        description="Directory for the persistent caches of the client.",
+    )
+
+    RESPONSE_CACHE: bool = Field(
+        False,
+        description="Whether to cache API responses on disk in CACHE_DIR. Cached responses "
+        "are dropped when a new database version is released.",
+    )
+
+    RESPONSE_CACHE_MAX_SIZE: int = Field(
+        2 * 1024**3,
+        description="Maximum size in bytes of the compressed API responses to cache on disk.",
+    )
+
+    PHASE_DIAGRAM_CACHE: bool = Field(
+        False,
+        description="Whether to cache retrieved phase diagrams on disk in CACHE_DIR, "
+        "keyed by chemical system, thermo type, database version and pymatgen version.",
+    )
+
+    PHASE_DIAGRAM_CACHE_MAX_SIZE: int = Field(
+        1024**3,
+        description="Maximum size in bytes of the compressed phase diagrams to cache on disk.",
+    )
+
+    REFERENCE_DATA_CACHE: bool = Field(
+        False,
+        description="Whether to cache reference data from MPContribs (e.g., ion reference "
+        "data and isolated atom energies) on disk in CACHE_DIR.",
+    )
+
+    REFERENCE_DATA_MAX_AGE: int = Field(
+        7 * 24 * 3600,
+        description="Age in seconds after which cached reference data are refreshed "
+        "in the background. Cached data are still used in the meantime.",
     )
 
     model_config = SettingsConfigDict(env_prefix="MPRESTER_")
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import json
 import os
+import threading
 import warnings
-from functools import cached_property
+from collections import defaultdict, deque
+from datetime import UTC, datetime
+from functools import cache, cached_property
 from importlib import import_module
-from itertools import chain
+from itertools import chain, islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 
 import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from deltalake import DeltaTable
 from emmet.core import __version__ as _EMMET_CORE_VER
+from emmet.core.arrow import arrowize
 from emmet.core.mpid import validate_identifier
 from monty.json import MontyDecoder
 from packaging.version import parse as parse_version
+from pydantic import TypeAdapter
 
 from mp_api.client.core.exceptions import (
     MPDatasetIndexingWarning,
@@ -24,11 +33,12 @@ from mp_api.client.core.exceptions import (
     MPRestError,
     MPRestWarning,
 )
+from mp_api.client.core.schemas import _convert_to_model
 from mp_api.client.core.settings import MAPI_CLIENT_SETTINGS
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
-    from typing import Any, Literal
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import Any, Literal, Self
 
     from pydantic._internal._model_construction import ModelMetaclass
 
@@ -147,6 +157,465 @@ def validate_endpoint(endpoint: str | None, suffix: str | None = None) -> str:
     return new_endpoint
 
 
+@cache
+def _arrow_schema(document_model: ModelMetaclass) -> pa.Schema | None:
+    """Get the arrow schema of a document model, or None if it has none.
+
+    This is the schema used for the delta-backed datasets. Models with fields
+    which cannot be represented in arrow, e.g., unions of types, have none.
+    """
+    try:
+        return pa.schema(arrowize(document_model))
+    except (AssertionError, KeyError, StopIteration, TypeError):
+        return None
+
+
+def _parse_timestamp(value: Any) -> Any:
+    # Naive timestamps returned by the API are in UTC
+    if not isinstance(value, str):
+        return value
+    timestamp = datetime.fromisoformat(value)
+    return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=UTC)
+
+
+def _timestamp_parser(arrow_type: pa.DataType) -> Callable[[Any], Any] | None:
+    """Build a function parsing the JSON timestamps in values of an arrow type.
+
+    Arrow cannot convert ISO strings to timestamps while converting python
+    objects, so these are parsed beforehand. Returns None if values of the
+    type contain no timestamps, so that those are left untouched.
+    """
+    if pa.types.is_timestamp(arrow_type):
+        return _parse_timestamp
+
+    if pa.types.is_struct(arrow_type):
+        parsers = {
+            field.name: parser
+            for field in arrow_type
+            if (parser := _timestamp_parser(field.type)) is not None
+        }
+        if not parsers:
+            return None
+        return lambda value: (
+            {
+                **value,
+                **{k: parser(value[k]) for k, parser in parsers.items() if k in value},
+            }
+            if isinstance(value, dict)
+            else value
+        )
+
+    if pa.types.is_map(arrow_type):
+        parser = _timestamp_parser(arrow_type.item_type)
+        if parser is None:
+            return None
+        return lambda value: (
+            {k: parser(v) for k, v in value.items()}
+            if isinstance(value, dict)
+            else value
+        )
+
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        parser = _timestamp_parser(arrow_type.value_type)
+        if parser is None:
+            return None
+        return lambda value: (
+            [parser(v) for v in value] if isinstance(value, list) else value
+        )
+
+    return None
+
+
+def _docs_to_table(
+    docs: list[dict[str, Any]],
+    schema: pa.Schema | None,
+    fields: list[str] | None = None,
+) -> pa.Table:
+    """Convert JSON documents to an arrow table, without validating them.
+
+    Parameters
+    -----------
+    docs : list of dict
+        Documents as returned by the API.
+    schema : pa.Schema or None
+        Arrow schema of the documents, see `_arrow_schema`. The types of
+        columns are inferred from the documents if None.
+    fields : list of str or None
+        Fields requested from the API. Only these columns are returned,
+        with the types of fields outside of the schema inferred.
+
+    Returns:
+        An arrow table with one row per document
+    """
+    if schema is None:
+        return pa.Table.from_pylist(docs)
+
+    names = list(dict.fromkeys(field.split(".", 1)[0] for field in fields or []))
+    if names:
+        inferred = [name for name in names if name not in schema.names]
+        schema = pa.schema(
+            [schema.field(name) for name in names if name in schema.names]
+        )
+    else:
+        inferred = []
+
+    parsers = {
+        field.name: parser
+        for field in schema
+        if (parser := _timestamp_parser(field.type)) is not None
+    }
+    if parsers:
+        docs = [
+            {
+                **doc,
+                **{k: parser(doc[k]) for k, parser in parsers.items() if k in doc},
+            }
+            for doc in docs
+        ]
+
+    try:
+        table = pa.Table.from_pylist(docs, schema=schema)
+        for name in inferred:
+            table = table.append_column(name, pa.array([doc.get(name) for doc in docs]))
+    except (pa.ArrowException, ValueError) as exc:
+        raise MPRestError(
+            f"Could not convert documents to arrow: {exc}. "
+            "Retrieve them with `search` instead."
+        )
+
+    return table.select(names) if names else table
+
+
+# Query parameters of the API which only affect pagination and projection
+_PAGINATION_PARAMS = {"_fields", "_all_fields", "_limit"}
+
+# Query parameters of the API for fields nested in a column
+_NESTED_COLUMNS = {
+    "batch_id": ("builder_meta", "batch_id"),
+    "license": ("builder_meta", "license"),
+}
+
+# Columns which the API normalizes values of before matching, e.g., "O-Li" -> "Li-O"
+_NORMALIZED_COLUMNS = {"chemsys", "formula_pretty", "formula_anonymous"}
+
+
+def _sql_literal(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int | float):
+        return repr(value)
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    raise TypeError(f"Cannot convert {value!r} to SQL")
+
+
+def _sql_column(name: str, schema: pa.Schema) -> tuple[str, pa.DataType] | None:
+    if name in schema.names:
+        return f'"{name}"', schema.field(name).type
+    if name in _NESTED_COLUMNS:
+        parent, child = _NESTED_COLUMNS[name]
+        parent_type = schema.field(parent).type if parent in schema.names else None
+        if (
+            parent_type is not None
+            and pa.types.is_struct(parent_type)
+            and parent_type.get_field_index(child) >= 0
+        ):
+            return f"\"{parent}\"['{child}']", parent_type.field(child).type
+    return None
+
+
+def _param_to_sql(param: str, value: Any, schema: pa.Schema) -> str | None:
+    values = value.split(",") if isinstance(value, str) else value
+    is_number = isinstance(value, int | float) and not isinstance(value, bool)
+
+    if param in ("elements", "exclude_elements") and "elements" in schema.names:
+        array = f"make_array({', '.join(_sql_literal(v) for v in values)})"
+        return (
+            f'array_has_all("elements", {array})'
+            if param == "elements"
+            else f'NOT array_has_any("elements", {array})'
+        )
+
+    for suffix in ("_min", "_max", "_not_eq", "_neq_any", "_eq_any"):
+        if not param.endswith(suffix) or not (
+            column := _sql_column(param.removesuffix(suffix), schema)
+        ):
+            continue
+        name, arrow_type = column
+        if suffix in ("_min", "_max"):
+            if not is_number or not (
+                pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+            ):
+                return None
+            return f"{name} {'>=' if suffix == '_min' else '<='} {_sql_literal(value)}"
+        if pa.types.is_nested(arrow_type):
+            return None
+        if suffix == "_not_eq":
+            return f"({name} IS NULL OR {name} != {_sql_literal(value)})"
+        in_list = f"({', '.join(_sql_literal(v) for v in values)})"
+        if suffix == "_neq_any":
+            return f"({name} IS NULL OR {name} NOT IN {in_list})"
+        return f"{name} IN {in_list}"
+
+    if (column := _sql_column(param, schema)) is not None:
+        name, arrow_type = column
+        if (
+            pa.types.is_nested(arrow_type)
+            or param in _NORMALIZED_COLUMNS
+            or (isinstance(value, str) and "," in value)
+        ):
+            return None
+        return f"{name} = {_sql_literal(value)}"
+
+    # Plural parameters, e.g., material_ids, match any of a list of identifiers
+    if param.endswith("s") and (column := _sql_column(param[:-1], schema)):
+        name, arrow_type = column
+        if not pa.types.is_string(arrow_type):
+            return None
+        return f"{name} IN ({', '.join(_sql_literal(v) for v in values)})"
+
+    return None
+
+
+def _criteria_to_sql(
+    criteria: dict[str, Any], schema: pa.Schema
+) -> tuple[str, list[str]] | None:
+    """Translate the query parameters of an API request to SQL.
+
+    Only parameters whose meaning on the server is known are translated:
+    ranges (`_min` / `_max`), (in)equality with a column, lists of
+    identifiers, and the `elements` / `exclude_elements` filters.
+
+    Parameters
+    -----------
+    criteria : dict of str to Any
+        Query parameters of the API request.
+    schema : pa.Schema
+        Arrow schema of the delta-backed dataset, see `_arrow_schema`.
+
+    Returns:
+        The columns to select and the conditions of the WHERE clause, or
+        None if any parameter cannot be translated.
+    """
+    conditions = []
+    for param, value in criteria.items():
+        if param in _PAGINATION_PARAMS:
+            continue
+        try:
+            condition = _param_to_sql(param, value, schema)
+        except TypeError:
+            return None
+        if condition is None:
+            return None
+        conditions.append(condition)
+
+    if criteria.get("_all_fields") or not criteria.get("_fields"):
+        return "*", conditions
+
+    names = list(
+        dict.fromkeys(f.split(".", 1)[0] for f in criteria["_fields"].split(","))
+    )
+    if any(name not in schema.names for name in names):
+        return None
+    return ", ".join(f'"{name}"' for name in names), conditions
+
+
+def _available_memory() -> int | None:
+    """Bytes of memory available to the process, if they can be determined."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _dataset_memory_budget() -> int:
+    """Bytes of downloaded data which may be held in memory when retrieving datasets."""
+    budget = MAPI_CLIENT_SETTINGS.DATASET_FLUSH_THRESHOLD
+    if (available := _available_memory()) is not None:
+        budget = min(
+            budget, int(available * MAPI_CLIENT_SETTINGS.DATASET_MEMORY_FRACTION)
+        )
+    return max(budget, 1)
+
+
+def _prefetch_batches(
+    batches: Iterable[Any], max_bytes: int
+) -> Iterator[pa.RecordBatch]:
+    """Read record batches ahead of their consumer in a background thread.
+
+    The source is only read from while less than `max_bytes` of batches are waiting
+    to be consumed, so that a slow consumer throttles the source instead of letting
+    batches pile up in memory.
+
+    Args:
+        batches (Iterable) : record batches, or objects implementing the Arrow
+            PyCapsule interface for them
+        max_bytes (int) : bytes of batches to hold before pausing the source
+
+    Yields:
+        pa.RecordBatch : the batches of `batches`, in order
+    """
+    buffer: deque[tuple[pa.RecordBatch, int]] = deque()
+    state: dict[str, Any] = {"buffered": 0, "done": False, "stop": False, "error": None}
+    cond = threading.Condition()
+
+    def _produce() -> None:
+        try:
+            source = iter(batches)
+            while True:
+                with cond:
+                    cond.wait_for(
+                        lambda: state["stop"] or state["buffered"] < max_bytes
+                    )
+                    if state["stop"]:
+                        return
+                if (batch := next(source, None)) is None:
+                    return
+                batch = pa.record_batch(batch)
+                size = batch.get_total_buffer_size()
+                with cond:
+                    buffer.append((batch, size))
+                    state["buffered"] += size
+                    cond.notify_all()
+        except BaseException as exc:
+            state["error"] = exc
+        finally:
+            with cond:
+                state["done"] = True
+                cond.notify_all()
+
+    producer = threading.Thread(target=_produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            with cond:
+                cond.wait_for(lambda: buffer or state["done"])
+                if not buffer:
+                    break
+                batch, size = buffer.popleft()
+                state["buffered"] -= size
+                cond.notify_all()
+            yield batch
+    finally:
+        with cond:
+            state["stop"] = True
+            cond.notify_all()
+        producer.join()
+
+    if state["error"] is not None:
+        raise state["error"]
+
+
+class _StreamingDatasetWriter:
+    """Write record batches to a Parquet dataset on disk as they arrive.
+
+    Batches are appended to one open Parquet file per partition, so that only the
+    batch being written is held in memory. A new file is started once
+    `max_file_size` uncompressed bytes were written to the current one.
+    """
+
+    def __init__(
+        self,
+        base_dir: str | Path,
+        schema: pa.Schema,
+        partition_by: str | None = None,
+        max_file_size: int | None = None,
+        max_rows_per_group: int = 1024,
+        basename_template: str = "part-{i}.zstd.parquet",
+    ) -> None:
+        """Initialize a _StreamingDatasetWriter.
+
+        Args:
+            base_dir (str or Path) : root directory of the dataset
+            schema (pa.Schema) : schema of the dataset, batches are cast to it
+            partition_by (str or None) : column to partition the dataset on with the
+                hive flavor, which is then not stored in the files
+            max_file_size (int or None) : uncompressed bytes to write to a file before
+                starting a new one. Defaults to DATASET_MAX_FILE_SIZE.
+            max_rows_per_group (int) : maximum number of rows per row group
+            basename_template (str) : template of the file names, "{i}" is replaced
+                with the index of the file in its partition
+        """
+        self.base_dir = Path(base_dir)
+        self.schema = schema
+        self.partition_by = partition_by
+        self.max_file_size = max_file_size or MAPI_CLIENT_SETTINGS.DATASET_MAX_FILE_SIZE
+        self.max_rows_per_group = max_rows_per_group
+        self.basename_template = basename_template
+        self._file_schema = (
+            schema.remove(schema.get_field_index(partition_by))
+            if partition_by
+            else schema
+        )
+        # partition -> [writer, bytes written to its file, index of its file]
+        self._files: dict[Any, list[Any]] = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def write_batch(self, batch: pa.RecordBatch) -> None:
+        """Append a record batch to the dataset.
+
+        Args:
+            batch (pa.RecordBatch) : batch with (at least) the columns of the schema
+        """
+        # somewhere post datafusion 51.0.0 and arrow-rs 57.0.0
+        # casts to *View types began, need to cast back to base schema
+        # -> pyarrow is behind on implementation support for *View types
+        table = (
+            pa.Table.from_batches([batch])
+            .select(self.schema.names)
+            .cast(target_schema=self.schema)
+        )
+        if not self.partition_by:
+            self._write(None, table)
+            return
+
+        column = table[self.partition_by]
+        table = table.drop_columns([self.partition_by])
+        for value in pc.unique(column).to_pylist():
+            mask = pc.is_null(column) if value is None else pc.equal(column, value)
+            self._write(value, table.filter(mask))
+
+    def _write(self, partition: Any, table: pa.Table) -> None:
+        state = self._files.get(partition)
+        if state is None or state[1] >= self.max_file_size:
+            index = 0
+            if state is not None:
+                state[0].close()
+                index = state[2] + 1
+            directory = self.base_dir
+            if self.partition_by:
+                value = "__HIVE_DEFAULT_PARTITION__" if partition is None else partition
+                directory /= f"{self.partition_by}={value}"
+            directory.mkdir(parents=True, exist_ok=True)
+            writer = pq.ParquetWriter(
+                directory / self.basename_template.format(i=index),
+                self._file_schema,
+                compression="zstd",
+            )
+            state = self._files[partition] = [writer, 0, index]
+
+        state[0].write_table(table, row_group_size=self.max_rows_per_group)
+        state[1] += table.nbytes
+
+    def close(self) -> None:
+        """Close the open files of the dataset."""
+        for writer, *_ in self._files.values():
+            writer.close()
+        self._files.clear()
+
+
 class LazyImport:
     """Lazily import and load an object.
 
@@ -191,6 +660,20 @@ class LazyImport:
             + (f".{self._class_name}" if self._class_name else "")
         )
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the import string and loaded object, not the imported module."""
+        return {
+            "_module_name": self._module_name,
+            "_class_name": self._class_name,
+            "_obj": self._obj,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled LazyImport, which imports its object again on use."""
+        for attr, value in state.items():
+            setattr(self, attr, value)
+        self._imported = None
+
     def __str__(self) -> str:
         return f"LazyImport of {self._module_name}" + (
             f".{self._class_name}" if self._class_name else ""
@@ -251,6 +734,10 @@ class LazyImport:
         return self._obj.__dir__() if hasattr(self._obj, "__dir__") else []
 
 
+# Sidecar file holding the primary key index of a MPDataset
+_INDEX_FILE = "_mp_index.parquet"
+
+
 class MPDataset:
     """Convenience wrapper for pyarrow datasets stored on disk."""
 
@@ -259,6 +746,7 @@ class MPDataset:
         path: str | Path,
         document_model: ModelMetaclass,
         use_document_model: bool,
+        primary_key: str = "material_id",
     ):
         """Initialize a MPDataset.
 
@@ -270,9 +758,12 @@ class MPDataset:
             Pydantic document model for use during de-serialization of arrow data
         use_document_model: bool
             Use 'document_model' during de-serialization of arrow data.
+        primary_key: str
+            Column uniquely identifying the documents, used by `MPDataset.get`.
         """
         self._start: int = 0
         self._path = Path(path)
+        self._primary_key = primary_key
         self._document_model: ModelMetaclass = document_model
         self._dataset = ds.dataset(path)
         self._row_groups: list[Any] = list(
@@ -341,23 +832,286 @@ class MPDataset:
         _row = self._dataset.take([idx]).to_pylist(maps_as_pydicts="strict")[0]
         return self._document_model(**_row) if self._use_document_model else _row
 
-    def __len__(self) -> int:
+    @cached_property
+    def _num_rows(self) -> int:
         return self._dataset.count_rows()
 
-    def __iter__(self):
-        with warnings.catch_warnings(
-            action="ignore", category=MPDatasetIndexingWarning
-        ):
+    @cached_property
+    def _document_adapter(self) -> TypeAdapter:
+        return TypeAdapter(list[self._document_model])  # type: ignore[name-defined]
+
+    def _convert_rows(
+        self, rows: list[dict[str, Any]], columns: list[str] | None = None
+    ) -> list[Any]:
+        if not self._use_document_model:
+            return rows
+        if columns is not None:
+            return _convert_to_model(
+                rows, self._document_model, requested_fields=columns
+            )
+        return self._document_adapter.validate_python(rows)
+
+    def iter_batches(
+        self,
+        batch_size: int = 1024,
+        columns: list[str] | None = None,
+        filter: pc.Expression | None = None,
+    ) -> Iterator[list[Any]]:
+        """Iterate through the dataset in batches of documents.
+
+        The row groups of the dataset are read in order, and the rows of each record
+        batch are converted (and validated, if `use_document_model`) all at once.
+
+        Parameters
+        -----------
+        batch_size: int
+            Maximum number of documents per batch.
+        columns: list[str] or None
+            Columns to read, defaults to all columns.
+        filter: pyarrow.compute.Expression or None
+            Only read the rows which satisfy this expression.
+
+        Yields:
+        -----------
+        list of dict, or of pydantic models if `use_document_model`
+        """
+        pending: list[dict[str, Any]] = []
+        for row_group in self._row_groups:
+            for record_batch in row_group.to_batches(
+                schema=self._dataset.schema,
+                columns=columns,
+                filter=filter,
+                batch_size=batch_size,
+            ):
+                pending.extend(record_batch.to_pylist(maps_as_pydicts="strict"))
+                while len(pending) >= batch_size:
+                    yield self._convert_rows(pending[:batch_size], columns=columns)
+                    del pending[:batch_size]
+        if pending:
+            yield self._convert_rows(pending, columns=columns)
+
+    def _index_fragments(self) -> list[list[Any]]:
+        """Path relative to the dataset, size and modification time of its files."""
+        fragments = []
+        for fragment in self._dataset.get_fragments():
+            stat = os.stat(fragment.path)
+            fragments.append(
+                [
+                    os.path.relpath(fragment.path, self._path),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ]
+            )
+        return fragments
+
+    def build_index(self, force: bool = False) -> pa.Table:
+        """Build the primary key index of the dataset, and persist it next to its files.
+
+        The index maps the primary key of each document to the file, row group and
+        row of the document, and is stored in the dataset directory. It is rebuilt
+        when the files of the dataset change, e.g., after the dataset is updated.
+
+        In datasets partitioned on db version, a document may appear once per
+        version, and the "version" of each document is indexed as well.
+
+        Parameters
+        -----------
+        force: bool
+            Rebuild the index even if an up-to-date one exists.
+
+        Returns:
+        -----------
+        pyarrow.Table with columns "key", "version", "fragment", "row_group" and "row"
+
+        Raises:
+        -----------
+        MPRestError if a primary key appears more than once in a version
+        """
+        index_path = self._path / _INDEX_FILE
+        fragments = self._index_fragments()
+        if not force and index_path.exists():
+            try:
+                index = pq.read_table(index_path)
+                meta = json.loads(index.schema.metadata[b"mp_index"])
+                if (
+                    meta["primary_key"] == self._primary_key
+                    and meta["fragments"] == fragments
+                    and "version" in index.column_names
+                ):
+                    return index
+            except (OSError, KeyError, ValueError, pa.ArrowException):
+                pass
+
+        if self._primary_key not in self._dataset.schema.names:
+            raise MPRestError(
+                f"Dataset at {self._path} has no {self._primary_key} column to index."
+            )
+
+        columns: dict[str, list[Any]] = {
+            "key": [],
+            "version": [],
+            "fragment": [],
+            "row_group": [],
+            "row": [],
+        }
+        for fragment_index, fragment in enumerate(self._dataset.get_fragments()):
+            parquet_file = pq.ParquetFile(fragment.path)
+            # Partition values are stored in the file paths, rather than the file
+            version = next(
+                (
+                    part.split("=", 1)[1]
+                    for part in Path(os.path.relpath(fragment.path, self._path)).parts
+                    if part.startswith("version=")
+                ),
+                None,
+            )
+            for row_group in range(parquet_file.num_row_groups):
+                keys = parquet_file.read_row_group(
+                    row_group, columns=[self._primary_key]
+                )[self._primary_key]
+                columns["key"].append(pc.cast(keys, pa.string()))
+                columns["version"].append(
+                    pa.repeat(pa.scalar(version, pa.string()), len(keys))
+                )
+                columns["fragment"].append(
+                    pa.repeat(pa.scalar(fragment_index, pa.int32()), len(keys))
+                )
+                columns["row_group"].append(
+                    pa.repeat(pa.scalar(row_group, pa.int32()), len(keys))
+                )
+                columns["row"].append(pa.array(range(len(keys)), pa.int32()))
+
+        schema = pa.schema(
+            [
+                ("key", pa.string()),
+                ("version", pa.string()),
+                ("fragment", pa.int32()),
+                ("row_group", pa.int32()),
+                ("row", pa.int32()),
+            ],
+            metadata={
+                "mp_index": json.dumps(
+                    {"primary_key": self._primary_key, "fragments": fragments}
+                )
+            },
+        )
+        index = pa.table(
+            {
+                name: pa.chunked_array(chunks, schema.field(name).type)
+                for name, chunks in columns.items()
+            },
+            schema=schema,
+        )
+
+        counts = index.group_by(["key", "version"], use_threads=False).aggregate(
+            [("row", "count")]
+        )
+        duplicates = counts.filter(pc.field("row_count") > 1)["key"]
+        if len(duplicates):
+            raise MPRestError(
+                f"Dataset at {self._path} has {len(duplicates)} duplicate "
+                f"{self._primary_key} values, e.g. {duplicates[0]}."
+            )
+
+        try:
+            pq.write_table(index, index_path, compression="zstd")
+        except OSError:
             warnings.warn(
-                """
-                Iterating through arrow-based MPDatasets is sub-optimal, consider using
-                idiomatic arrow patterns. See MP's docs on MPDatasets for relevant examples:
-                docs.materialsproject.org/materials-project-data-lakehouse/arrow-datasets
-                """,
-                MPDatasetIterationWarning,
+                f"Could not write the index of the dataset at {self._path}.",
+                MPRestWarning,
                 stacklevel=2,
             )
-            current = self._start
-            while current < len(self):
-                yield self[current]
-                current += 1
+        self.__dict__.pop("_index", None)
+        return index
+
+    @staticmethod
+    def _index_locations(index: pa.Table) -> dict[str, tuple[int, int, int]]:
+        """Map primary keys to their file, row group and row, the last row winning."""
+        return dict(
+            zip(
+                index["key"].to_pylist(),
+                zip(
+                    index["fragment"].to_pylist(),
+                    index["row_group"].to_pylist(),
+                    index["row"].to_pylist(),
+                    strict=True,
+                ),
+                strict=True,
+            )
+        )
+
+    @cached_property
+    def _index(self) -> dict[str, tuple[int, int, int]]:
+        # Keys resolve to their latest version, versions are dates
+        return self._index_locations(
+            self.build_index().sort_by([("version", "ascending")])
+        )
+
+    def get(self, ids: str | list[str], version: str | None = None) -> list[Any]:
+        """Retrieve documents by their primary key.
+
+        Only the row groups holding the requested documents are read, using the
+        index of the dataset (see `MPDataset.build_index`).
+
+        Parameters
+        -----------
+        ids: str or list of str
+            Primary key(s) of the documents.
+        version: str or None
+            For datasets partitioned on db version, the version of the documents.
+            Defaults to the latest version holding each document.
+
+        Returns:
+        -----------
+        list of dict, or of pydantic models if `use_document_model`, in the order
+        of `ids`. Identifiers which are not in the dataset are skipped.
+        """
+        ids = [ids] if isinstance(ids, str) else list(ids)
+        fragments = list(self._dataset.get_fragments())
+        index = (
+            self._index
+            if version is None
+            else self._index_locations(
+                self.build_index().filter(pc.field("version") == version)
+            )
+        )
+
+        positions: dict[tuple[int, int], list[int]] = defaultdict(list)
+        locations = {}
+        for _id in ids:
+            if (location := index.get(str(_id))) is not None:
+                positions[location[:2]].append(location[2])
+                locations[str(_id)] = location
+
+        rows: dict[tuple[int, int, int], dict[str, Any]] = {}
+        for (fragment_index, row_group), offsets in positions.items():
+            table = (
+                fragments[fragment_index]
+                .subset(row_group_ids=[row_group])
+                .to_table(schema=self._dataset.schema)
+                .take(offsets)
+            )
+            for offset, row in zip(
+                offsets, table.to_pylist(maps_as_pydicts="strict"), strict=True
+            ):
+                rows[(fragment_index, row_group, offset)] = row
+
+        return self._convert_rows(
+            [rows[locations[str(_id)]] for _id in ids if str(_id) in locations]
+        )
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def __iter__(self):
+        warnings.warn(
+            """
+            Iterating through arrow-based MPDatasets is sub-optimal, consider using
+            idiomatic arrow patterns or MPDataset.iter_batches. See MP's docs on
+            MPDatasets for relevant examples:
+            docs.materialsproject.org/materials-project-data-lakehouse/arrow-datasets
+            """,
+            MPDatasetIterationWarning,
+            stacklevel=2,
+        )
+        yield from islice(chain.from_iterable(self.iter_batches()), self._start, None)
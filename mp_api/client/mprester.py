@@ -4,9 +4,13 @@ import itertools
 import json
 import os
 import re
+import threading
+import time
 import warnings
-from collections import defaultdict
-from functools import cache, lru_cache
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from functools import cache, cached_property
 from typing import TYPE_CHECKING
 from urllib.parse import urlencode
 
@@ -17,6 +21,7 @@ from emmet.core.types.pymatgen_types.computed_entries_adapter import (
     ComputedStructureEntryType,
 )
 from emmet.core.vasp.calc_types import CalcType
+from monty.json import MontyDecoder, MontyEncoder
 from packaging import version
 from pydantic import BaseModel, TypeAdapter
 from pymatgen.analysis.phase_diagram import PhaseDiagram
@@ -28,8 +33,9 @@ from pymatgen.io.vasp import Chgcar
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from requests import Session, get
 
+from mp_api.client.core._hull import HullEvaluator
 from mp_api.client.core._oxygen_evolution import OxygenEvolution
-from mp_api.client.core.client import _Rester
+from mp_api.client.core.client import _open_disk_cache, _Rester, logger
 from mp_api.client.core.exceptions import (
     MPRestError,
     MPRestWarning,
@@ -46,7 +52,7 @@ from mp_api.client.routes.materials import MATERIALS_RESTERS
 from mp_api.client.routes.molecules import MOLECULES_RESTERS
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
     from typing import Any, Literal
 
     import numpy as np
@@ -62,6 +68,7 @@ if TYPE_CHECKING:
     )
     from pymatgen.util.typing import SpeciesLike
 
+    from mp_api.client.core.cache import DiskCache
     from mp_api.client.core.client import QueryBuilderWithCache
     from mp_api.client.core.schemas import _DictLikeAccess
 
@@ -101,9 +108,43 @@ def _all_subchemsyses(elements: Iterable[str]) -> list[str]:
     ]
 
 
+_ENTRIES_ADAPTER = TypeAdapter(list[ComputedStructureEntryType])
+
+# Minimum number of entries to convert to conventional cells across processes
+_MIN_PARALLEL_ENTRIES = 64
+
+# Maximum number of chemical systems (per thermo types and entry options) whose
+# entries are kept in memory, the least recently used are evicted first
+_MAX_CACHED_CHEMSYSES = 1024
+
+# Maximum size in bytes of the compressed reference data to cache on disk
+_REFERENCE_DATA_CACHE_MAX_SIZE = 64 * 1024**2
+
+
+def _to_conventional_entry_dict(entry_dict: dict) -> dict:
+    """Rescale a ComputedStructureEntry dict to its conventional standard cell."""
+    entry_struct = Structure.from_dict(entry_dict["structure"])
+    s = SpacegroupAnalyzer(entry_struct).get_conventional_standard_structure()
+    site_ratio = len(s) / len(entry_struct)
+
+    entry_dict["energy"] *= site_ratio
+    entry_dict["structure"] = s.as_dict()
+    entry_dict["correction"] = 0.0
+
+    for element in entry_dict["composition"]:
+        entry_dict["composition"][element] *= site_ratio
+
+    for correction in entry_dict["energy_adjustments"]:
+        if "n_atoms" in correction:
+            correction["n_atoms"] *= site_ratio
+    return entry_dict
+
+
 class MPRester(_Rester):
     """Access the new Materials Project API."""
 
+    _connection_attrs = (*_Rester._connection_attrs, "_contribs")
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -118,6 +159,7 @@ class MPRester(_Rester):
             str | os.PathLike
         ) = MAPI_CLIENT_SETTINGS.LOCAL_DATASET_CACHE,
         force_renew: bool = False,
+        sync_datasets: bool = False,
         query_builder: QueryBuilderWithCache | None = None,
         notify_db_version: bool = False,
         **kwargs,
@@ -153,6 +195,8 @@ class MPRester(_Rester):
             local_dataset_cache: Target directory for downloading full datasets. Defaults
                 to "mp_datasets" in the user's home directory
             force_renew: Option to overwrite existing local dataset
+            sync_datasets: Option to incrementally update existing local datasets,
+                only retrieving the data which changed since they were downloaded
             query_builder : Instance of QueryBuilderWithCache to use in querying delta tables
                 NOTE: Must be a QueryBuilderWithCache, a deltalake.QueryBuilder will be ignored.
             notify_db_version (bool): If True, the current MP database version will
@@ -175,11 +219,18 @@ class MPRester(_Rester):
             db_version=db_version,
             local_dataset_cache=local_dataset_cache,
             force_renew=force_renew,
+            sync_datasets=sync_datasets,
             query_builder=query_builder,
             **kwargs,
         )
 
         self._contribs = None
+        self._hull_evaluators: dict[tuple[str, str], HullEvaluator] = {}
+        self._entry_cache: OrderedDict[tuple, list[ComputedStructureEntry]] = (
+            OrderedDict()
+        )
+        self._reference_data: dict[str, Any] = {}
+        self._reference_data_lock = threading.Lock()
         self._contribs_kwargs = {
             k: kwargs[k]
             for k in (
@@ -262,16 +313,42 @@ class MPRester(_Rester):
                         endpoint=self.endpoint,
                         include_user_agent=self.include_user_agent,
                         session=self.session,
-                        use_document_model=self.use_document_model,
+                        use_document_model=self._use_document_model,
                         headers=self.headers,
-                        mute_progress_bars=self.mute_progress_bars,
+                        mute_progress_bars=self._mute_progress_bars,
                         db_version=self.db_version,
                         local_dataset_cache=self.local_dataset_cache,
                         force_renew=self.force_renew,
+                        sync_datasets=self.sync_datasets,
                         query_builder=self._query_builder,
+                        executor=self.executor,
                     ),
                 )
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the configuration of the client and its resters.
+
+        In-memory caches are not pickled, data cached on disk is shared between
+        processes instead.
+        """
+        state = super().__getstate__()
+        state.update(
+            _hull_evaluators={}, _entry_cache=OrderedDict(), _reference_data={}
+        )
+        state.pop("_reference_data_lock", None)
+        # The lazily imported resters of all MPRester instances
+        state.pop("_all_resters", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._all_resters = list(RESTER_LAYOUT.values())
+
+    def _reset_connections(self) -> None:
+        super()._reset_connections()
+        # May be held by a thread which does not exist in the child of a fork
+        self._reference_data_lock = threading.Lock()
+
     @property
     def contribs(self):
         """Create an instance of the MP ContribsClient.
@@ -291,7 +368,7 @@ class MPRester(_Rester):
                     api_key=self.api_key,
                     headers=self.headers,
                     session=self.session,
-                    use_document_model=self.use_document_model,
+                    use_document_model=self._use_document_model,
                     **self._contribs_kwargs,
                 )
 
@@ -554,6 +631,9 @@ class MPRester(_Rester):
         stol: float = MAPI_CLIENT_SETTINGS.STOL,
         angle_tol: float = MAPI_CLIENT_SETTINGS.ANGLE_TOL,
         allow_multiple_results: bool = False,
+        match_spacegroup: bool = False,
+        volume_tol: float | None = None,
+        num_processes: int = 1,
     ) -> list[str] | str:
         """Finds matching structures from the Materials Project database.
 
@@ -569,6 +649,11 @@ class MPRester(_Rester):
             angle_tol: angle tolerance in degrees
             allow_multiple_results: changes return type for either
             a single material_id or list of material_ids
+            match_spacegroup: only match materials with the same spacegroup number
+            volume_tol: only match materials whose volume per atom is within
+            this fraction of that of the structure
+            num_processes: number of processes to match structures with,
+            defaults to 1, i.e. matching in this process
         Returns:
             A matching material_id if one is found or list of results if allow_multiple_results
             is True
@@ -581,6 +666,47 @@ class MPRester(_Rester):
             stol=stol,
             angle_tol=angle_tol,
             allow_multiple_results=allow_multiple_results,
+            match_spacegroup=match_spacegroup,
+            volume_tol=volume_tol,
+            num_processes=num_processes,
+        )
+
+    def find_structures(
+        self,
+        filenames_or_structures: list[str | Structure],
+        ltol: float = MAPI_CLIENT_SETTINGS.LTOL,
+        stol: float = MAPI_CLIENT_SETTINGS.STOL,
+        angle_tol: float = MAPI_CLIENT_SETTINGS.ANGLE_TOL,
+        allow_multiple_results: bool = False,
+        match_spacegroup: bool = False,
+        volume_tol: float | None = None,
+        num_processes: int = 1,
+    ) -> list[list[str] | str]:
+        """Finds matching structures from the Materials Project database for many structures.
+
+        Args:
+            filenames_or_structures: filenames or Structure objects
+            ltol: fractional length tolerance
+            stol: site tolerance
+            angle_tol: angle tolerance in degrees
+            allow_multiple_results: see `find_structure`
+            match_spacegroup: see `find_structure`
+            volume_tol: see `find_structure`
+            num_processes: see `find_structure`
+        Returns:
+            The result of `find_structure` for each structure, in order
+        Raises:
+            MPRestError
+        """
+        return self.materials.find_structures(
+            filenames_or_structures,
+            ltol=ltol,
+            stol=stol,
+            angle_tol=angle_tol,
+            allow_multiple_results=allow_multiple_results,
+            match_spacegroup=match_spacegroup,
+            volume_tol=volume_tol,
+            num_processes=num_processes,
         )
 
     def get_entries(
@@ -590,6 +716,7 @@ class MPRester(_Rester):
         property_data: list[str] | None = None,
         conventional_unit_cell: bool = False,
         additional_criteria: dict | None = None,
+        num_processes: int = 1,
         **kwargs,
     ) -> list[ComputedStructureEntry]:
         """Get a list of ComputedStructureEntry from a chemical system, or formula, or MPID.
@@ -619,6 +746,11 @@ class MPRester(_Rester):
                 correspond to proper function inputs to `MPRester.thermo.search`. For instance,
                 if you are only interested in entries on the convex hull, you could pass
                 {"energy_above_hull": (0.0, 0.0)} or {"is_stable": True}.
+            num_processes (int): number of processes to convert entries to
+                conventional unit cells with. Defaults to 1, i.e., converting in this
+                process; a process pool is only started for a larger value. Scripts
+                converting in parallel should be guarded by `if __name__ == "__main__":`
+                on platforms which spawn processes.
             kwargs: Used here only to gracefully handle deprecated arguments. All kwargs are ignored.
 
         Returns:
@@ -646,8 +778,6 @@ class MPRester(_Rester):
         if additional_criteria:
             input_params = {**input_params, **additional_criteria}
 
-        entries: set[ComputedStructureEntry] = set()
-
         fields = (
             ["entries", "thermo_type"]
             if not property_data
@@ -660,12 +790,12 @@ class MPRester(_Rester):
             fields=fields,
         )
 
+        # Entries are shared between the docs of different thermo types, so de-duplicate
+        # the raw dicts as ComputedEntry.__eq__ would, before doing any work on them
+        entry_dicts: dict[tuple | int, dict] = {}
         for doc in docs:
-            entry_list = (doc.model_dump() if isinstance(doc, BaseModel) else doc)[
-                "entries"
-            ].values()
-
-            for entry_dict in entry_list:
+            doc_dict = doc.model_dump() if isinstance(doc, BaseModel) else doc
+            for entry_dict in doc_dict["entries"].values():
                 if not compatible_only:
                     entry_dict["correction"] = 0.0
                     entry_dict["energy_adjustments"] = []
@@ -673,33 +803,36 @@ class MPRester(_Rester):
                 if (
                     property_data
                 ):  # merge property_data, retaining entry data (e.g. `oxidation_states`)
-                    entry_dict["data"] |= {prop: doc[prop] for prop in property_data}
-
-                if conventional_unit_cell:
-                    entry_struct = Structure.from_dict(entry_dict["structure"])
-                    s = SpacegroupAnalyzer(
-                        entry_struct
-                    ).get_conventional_standard_structure()
-                    site_ratio = len(s) / len(entry_struct)
-                    new_energy = entry_dict["energy"] * site_ratio
-
-                    entry_dict["energy"] = new_energy
-                    entry_dict["structure"] = s.as_dict()
-                    entry_dict["correction"] = 0.0
-
-                    for element in entry_dict["composition"]:
-                        entry_dict["composition"][element] *= site_ratio
-
-                    for correction in entry_dict["energy_adjustments"]:
-                        if "n_atoms" in correction:
-                            correction["n_atoms"] *= site_ratio
+                    entry_dict["data"] |= {
+                        prop: doc_dict[prop] for prop in property_data
+                    }
 
-                # Need to store object to permit de-duplication
-                entries.add(
-                    TypeAdapter(ComputedStructureEntryType).validate_python(entry_dict)
+                key = (
+                    (
+                        entry_dict["entry_id"],
+                        entry_dict["energy"],
+                        entry_dict.get("correction"),
+                    )
+                    if entry_dict.get("entry_id") is not None
+                    else id(entry_dict)
                 )
+                entry_dicts.setdefault(key, entry_dict)
+
+        unique_dicts = list(entry_dicts.values())
+        if conventional_unit_cell:
+            if num_processes > 1 and len(unique_dicts) >= _MIN_PARALLEL_ENTRIES:
+                with ProcessPoolExecutor(max_workers=num_processes) as executor:
+                    unique_dicts = list(
+                        executor.map(
+                            _to_conventional_entry_dict,
+                            unique_dicts,
+                            chunksize=max(len(unique_dicts) // (4 * num_processes), 1),
+                        )
+                    )
+            else:
+                unique_dicts = [_to_conventional_entry_dict(d) for d in unique_dicts]
 
-        return list(entries)
+        return _ENTRIES_ADAPTER.validate_python(unique_dicts)
 
     def get_pourbaix_entries(
         self,
@@ -874,7 +1007,76 @@ class MPRester(_Rester):
 
         return pbx_entries
 
-    @lru_cache
+    @cached_property
+    def _reference_data_cache(self) -> DiskCache | None:
+        if not MAPI_CLIENT_SETTINGS.REFERENCE_DATA_CACHE:
+            return None
+        return _open_disk_cache(
+            MAPI_CLIENT_SETTINGS.CACHE_DIR / "reference_data.sqlite",
+            _REFERENCE_DATA_CACHE_MAX_SIZE,
+        )
+
+    def _retrieve_reference_data(self, key: str, retrieve: Callable[[], Any]) -> Any:
+        data = retrieve()
+        with self._reference_data_lock:
+            self._reference_data[key] = data
+        if self._reference_data_cache is not None:
+            try:
+                cached = json.dumps(
+                    {"retrieved_at": time.time(), "data": data}, cls=MontyEncoder
+                )
+            except (TypeError, ValueError) as exc:
+                logger.warning(f"Could not cache reference data {key}: {exc}")
+            else:
+                self._reference_data_cache.set(key, cached.encode())
+        return data
+
+    def _revalidate_reference_data(self, key: str, retrieve: Callable[[], Any]) -> None:
+        try:
+            self._retrieve_reference_data(key, retrieve)
+        except Exception as exc:
+            # Keep serving the cached data, whatever failed in the background
+            logger.warning(f"Could not refresh cached reference data {key}: {exc}")
+
+    def _get_reference_data(self, key: str, retrieve: Callable[[], Any]) -> Any:
+        """Get small, static reference data once per process, and from disk across processes.
+
+        Data cached on disk for longer than `REFERENCE_DATA_MAX_AGE` are still
+        returned, and refreshed in a background thread for later calls.
+
+        Args:
+            key (str): key of the data in the caches
+            retrieve (Callable): function retrieving the data
+
+        Returns:
+            The reference data
+        """
+        with self._reference_data_lock:
+            if key in self._reference_data:
+                return self._reference_data[key]
+
+        if self._reference_data_cache is not None and (
+            cached := self._reference_data_cache.get(key)
+        ):
+            try:
+                cached_data = json.loads(cached, cls=MontyDecoder)
+                retrieved_at, data = cached_data["retrieved_at"], cached_data["data"]
+            except (ValueError, TypeError, KeyError) as exc:
+                logger.warning(f"Ignoring invalid cached reference data {key}: {exc}")
+            else:
+                with self._reference_data_lock:
+                    self._reference_data.setdefault(key, data)
+                age = time.time() - retrieved_at
+                if age > MAPI_CLIENT_SETTINGS.REFERENCE_DATA_MAX_AGE:
+                    threading.Thread(
+                        target=self._revalidate_reference_data,
+                        args=(key, retrieve),
+                        daemon=True,
+                    ).start()
+                return data
+
+        return self._retrieve_reference_data(key, retrieve)
+
     def get_ion_reference_data(self) -> list[dict]:
         """Download aqueous ion reference data used in the construction of Pourbaix diagrams.
 
@@ -901,13 +1103,14 @@ class MPRester(_Rester):
                 'reference': 'H. E. Barner and R. V. Scheuerman, Handbook of thermochemical data for
                 compounds and aqueous species, Wiley, New York (1978)'}}
         """
-        return self.contribs.query_contributions(  # type: ignore
-            query={"project": "ion_ref_data"},
-            fields=["identifier", "formula", "data"],
-            paginate=True,
-        ).get(
-            "data"
-        )  # type: ignore
+        return self._get_reference_data(
+            "ion_ref_data",
+            lambda: self.contribs.query_contributions(  # type: ignore
+                query={"project": "ion_ref_data"},
+                fields=["identifier", "formula", "data"],
+                paginate=True,
+            ).get("data"),
+        )
 
     def get_ion_reference_data_for_chemsys(self, chemsys: str | list) -> list[dict]:
         """Download aqueous ion reference data used in the construction of Pourbaix diagrams.
@@ -1081,7 +1284,7 @@ class MPRester(_Rester):
         return [
             entry
             for thermo_type in (ThermoType.GGA_GGA_U, ThermoType.R2SCAN)
-            for entry in self.get_entries(
+            for entry in self._get_cached_entries(
                 chemsyses,
                 compatible_only=True,
                 additional_criteria={"thermo_types": [thermo_type.value]},
@@ -1089,6 +1292,76 @@ class MPRester(_Rester):
             )
         ]
 
+    def _get_cached_entries(
+        self,
+        chemsyses: list[str],
+        compatible_only: bool = True,
+        property_data: list[str] | None = None,
+        conventional_unit_cell: bool = False,
+        additional_criteria: dict | None = None,
+        copy: bool = True,
+        **kwargs,
+    ) -> list[ComputedStructureEntry]:
+        """`get_entries` for many chemical systems, only retrieving those not seen before.
+
+        Entries are kept in memory per chemical system, thermo types, entry options
+        and database version, so that sweeps over overlapping chemical systems only
+        query their new subsystems. Up to `_MAX_CACHED_CHEMSYSES` chemical systems are
+        kept, the least recently used are evicted first. Queries with criteria other
+        than thermo types are not cached.
+
+        With `copy`, copies of the cached entries are returned, as processing entries
+        with a compatibility scheme modifies them in place. Otherwise, the entries are
+        shared with the cache and must not be modified.
+        """
+        if set(additional_criteria or {}) - {"thermo_types"}:
+            return self.get_entries(
+                chemsyses,
+                compatible_only=compatible_only,
+                property_data=property_data,
+                conventional_unit_cell=conventional_unit_cell,
+                additional_criteria=additional_criteria,
+                **kwargs,
+            )
+
+        options = (
+            tuple(sorted((additional_criteria or {}).get("thermo_types", []))),
+            compatible_only,
+            tuple(sorted(property_data or [])),
+            conventional_unit_cell,
+            self.db_version,
+        )
+        if missing := [
+            chemsys
+            for chemsys in chemsyses
+            if (chemsys, *options) not in self._entry_cache
+        ]:
+            retrieved: dict[str, list[ComputedStructureEntry]] = {
+                chemsys: [] for chemsys in missing
+            }
+            for entry in self.get_entries(
+                missing,
+                compatible_only=compatible_only,
+                property_data=property_data,
+                conventional_unit_cell=conventional_unit_cell,
+                additional_criteria=additional_criteria,
+                **kwargs,
+            ):
+                retrieved.setdefault(entry.composition.chemical_system, []).append(
+                    entry
+                )
+            for chemsys, entries in retrieved.items():
+                self._entry_cache[(chemsys, *options)] = entries
+
+        cached = []
+        for chemsys in chemsyses:
+            self._entry_cache.move_to_end((chemsys, *options))
+            cached.extend(self._entry_cache[(chemsys, *options)])
+        while len(self._entry_cache) > _MAX_CACHED_CHEMSYSES:
+            self._entry_cache.popitem(last=False)
+
+        return deepcopy(cached) if copy else cached
+
     def get_entries_in_chemsys(
         self,
         elements: str | list[str],
@@ -1116,6 +1389,9 @@ class MPRester(_Rester):
         ``property_data`` and ``conventional_unit_cell`` re-apply the mixing scheme here
         instead, which can differ slightly from MP. Warnings are thrown for these cases.
 
+        Entries of each subsystem are kept in memory, so that later calls for overlapping
+        chemical systems (e.g. Li-Fe-O, then Li-Fe-O-P) only retrieve the new subsystems.
+
         Args:
             elements (str or [str]): Parent chemical system string comprising element
                 symbols separated by dashes, e.g., "Li-Fe-O" or List of element
@@ -1234,12 +1510,14 @@ class MPRester(_Rester):
                     stacklevel=2,
                 )
 
-            entries = self.get_entries(
+            entries = self._get_cached_entries(
                 all_chemsyses,
                 compatible_only=compatible_only,
                 property_data=property_data,
                 conventional_unit_cell=conventional_unit_cell,
                 additional_criteria=additional_criteria,
+                # Gibbs entries are built anew from the entries
+                copy=not use_gibbs,
                 **kwargs,
             )
 
@@ -1641,7 +1919,6 @@ class MPRester(_Rester):
             )
         return e_coh_per_atom
 
-    @lru_cache
     def get_atom_reference_data(
         self,
         funcs: tuple[str, ...] = (
@@ -1661,22 +1938,29 @@ class MPRester(_Rester):
             (dict[str, dict[str, float]]) : dict containing isolated atom energies,
             indexed first by the functionals in funcs, and second by the atom.
         """
-        _atomic_energies = self.contribs.query_contributions(
-            query={"project": "isolated_atom_energies"},
-            fields=["formula", *[f"data.{dfa}.energy" for dfa in funcs]],
-        ).get("data")
-
-        return {
-            dfa: {
-                entry["formula"]: (
-                    entry["data"][f"{dfa}.energy"].value
-                    if self.use_document_model
-                    else entry["data"][dfa]["energy"]["value"]
-                )
-                for entry in _atomic_energies
+        funcs = tuple(funcs)
+
+        def _retrieve() -> dict[str, dict[str, float]]:
+            _atomic_energies = self.contribs.query_contributions(
+                query={"project": "isolated_atom_energies"},
+                fields=["formula", *[f"data.{dfa}.energy" for dfa in funcs]],
+            ).get("data")
+
+            return {
+                dfa: {
+                    entry["formula"]: (
+                        entry["data"][f"{dfa}.energy"].value
+                        if self.use_document_model
+                        else entry["data"][dfa]["energy"]["value"]
+                    )
+                    for entry in _atomic_energies
+                }
+                for dfa in funcs
             }
-            for dfa in funcs
-        }
+
+        return self._get_reference_data(
+            f"isolated_atom_energies:{','.join(funcs)}", _retrieve
+        )
 
     @staticmethod
     def _get_cohesive_energy(
@@ -1739,11 +2023,7 @@ class MPRester(_Rester):
         }
         chemsys_str = "-".join(sorted(str(ele) for ele in chemsys))
 
-        thermo_type_valid_str: str = (
-            ThermoType(thermo_type).value
-            if (isinstance(thermo_type, str) and thermo_type != "r2SCAN")
-            else str(thermo_type)
-        )
+        thermo_type_valid_str = self._validate_stability_thermo_type(thermo_type)
 
         corrector: Compatibility | None = None
         if thermo_type_valid_str == ThermoType.GGA_GGA_U.value:
@@ -1799,6 +2079,142 @@ class MPRester(_Rester):
             for idx, entry in enumerate(entries)
         ]
 
+    @staticmethod
+    def _validate_stability_thermo_type(thermo_type: ThermoType | str) -> str:
+        return (
+            ThermoType(thermo_type).value
+            if (isinstance(thermo_type, str) and thermo_type != "r2SCAN")
+            else str(thermo_type)
+        )
+
+    def get_hull_evaluators(
+        self,
+        chemsys: list[str],
+        thermo_type: ThermoType | str = DEFAULT_THERMOTYPE,
+    ) -> dict[str, HullEvaluator]:
+        """Get reusable evaluators of the energy above the hull of many chemical systems.
+
+        Evaluators are built once per chemical system and thermo type, from the
+        phase diagrams of the Materials Project.
+
+        Args:
+        chemsys (list of str) : Chemical systems (e.g. [Li-Fe-O, Na-Cl])
+        thermo_type (str or ThermoType) : The hull type to use.
+            Defaults to ThermoType.GGA_GGA_U_R2SCAN.
+
+        Returns:
+        dict of chemical system, as given, to HullEvaluator. Chemical systems
+            without a phase diagram are omitted.
+        """
+        thermo_type_valid_str = self._validate_stability_thermo_type(thermo_type)
+        sorted_chemsys = {
+            _chemsys: "-".join(sorted(_chemsys.split("-"))) for _chemsys in chemsys
+        }
+
+        if missing := {
+            _sorted
+            for _sorted in sorted_chemsys.values()
+            if (_sorted, thermo_type_valid_str) not in self._hull_evaluators
+        }:
+            for _sorted, pd in self.materials.thermo.get_phase_diagrams_from_chemsys(
+                sorted(missing), thermo_type=thermo_type_valid_str
+            ).items():
+                self._hull_evaluators[(_sorted, thermo_type_valid_str)] = (
+                    HullEvaluator(pd)
+                )
+
+        return {
+            _chemsys: self._hull_evaluators[(_sorted, thermo_type_valid_str)]
+            for _chemsys, _sorted in sorted_chemsys.items()
+            if (_sorted, thermo_type_valid_str) in self._hull_evaluators
+        }
+
+    def get_energies_above_hull(
+        self,
+        entries: Sequence[ComputedEntry | ComputedStructureEntry | PDEntry],
+        thermo_type: ThermoType | str = DEFAULT_THERMOTYPE,
+    ) -> np.ndarray:
+        """Screen the stability of many entries against the hulls of the Materials Project.
+
+        Unlike `get_stability`, entries are not added to the hull they are evaluated
+        against, nor mixed with the entries of the Materials Project: this is meant
+        for high-throughput screening, where `get_stability` would rebuild a phase
+        diagram per call. Entries are grouped by chemical system, all required phase
+        diagrams are retrieved at once, and the energies of each group are
+        evaluated in a single vectorized pass (see `get_hull_evaluators`).
+
+        For the GGA(+U) and mixed GGA(+U)/r2SCAN hulls, the MaterialsProject2020
+        corrections are applied to all entries in bulk first; for the mixed hull,
+        the entries should thus be GGA(+U) calculations. Entries which the
+        corrections cannot be applied to are NaN.
+
+        Args:
+        entries (list of ComputedEntry or ComputedStructureEntry or PDEntry) :
+            Entries with energy and composition information.
+        thermo_type (str or ThermoType) : The hull type to use.
+            Defaults to ThermoType.GGA_GGA_U_R2SCAN.
+
+        Returns:
+        np.ndarray of the energies above the hull in eV/atom, in the order of
+            `entries`. Entries below the hull have a negative energy above it, and
+            entries in chemical systems without a phase diagram are NaN.
+
+        Raises:
+        ValueError: if plain PDEntries, which carry no calculation parameters to
+            correct, are evaluated against a GGA(+U) or mixed GGA(+U)/r2SCAN hull.
+        """
+        import numpy as np
+
+        thermo_type_valid_str = self._validate_stability_thermo_type(thermo_type)
+        entries = list(entries)
+
+        corrected: list[Any] = entries
+        if thermo_type_valid_str in {
+            ThermoType.GGA_GGA_U.value,
+            ThermoType.GGA_GGA_U_R2SCAN.value,
+        }:
+            from pymatgen.entries.compatibility import MaterialsProject2020Compatibility
+            from pymatgen.entries.computed_entries import ComputedEntry
+
+            if uncorrectable := [
+                idx
+                for idx, entry in enumerate(entries)
+                if not isinstance(entry, ComputedEntry)
+            ]:
+                raise ValueError(
+                    f"Entries at indices {uncorrectable} are not ComputedEntries, and "
+                    f"cannot be corrected for the {thermo_type_valid_str} hull. Use "
+                    "ComputedEntries with their calculation parameters, or the r2SCAN "
+                    "hull for already corrected energies."
+                )
+
+            # Corrected in place on copies, to match them back to their position:
+            # process_entries drops the entries it cannot correct
+            copies = deepcopy(entries)
+            processed = {
+                id(entry)
+                for entry in MaterialsProject2020Compatibility().process_entries(
+                    copies, clean=True, inplace=True, on_error="ignore"
+                )
+            }
+            corrected = [entry if id(entry) in processed else None for entry in copies]
+
+        groups: dict[str, list[int]] = defaultdict(list)
+        for idx, entry in enumerate(corrected):
+            if entry is not None:
+                groups[entry.composition.chemical_system].append(idx)
+
+        e_above_hull = np.full(len(entries), np.nan)
+        evaluators = self.get_hull_evaluators(
+            list(groups), thermo_type=thermo_type_valid_str
+        )
+        for _chemsys, evaluator in evaluators.items():
+            idxs = groups[_chemsys]
+            e_above_hull[idxs] = evaluator.get_e_above_hull_of_entries(
+                [corrected[idx] for idx in idxs]
+            )
+        return e_above_hull
+
     def get_oxygen_evolution(
         self,
         material_id: str | MPID | AlphaID,
@@ -20,6 +20,8 @@ from mp_api.client.core import BaseRester, MPRestError
 from mp_api.client.core.utils import validate_ids
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from pymatgen.electronic_structure.dos import Dos
 
 
@@ -161,12 +163,82 @@ class BaseESPropertyRester(BaseRester):
                 endpoint=self.base_endpoint,
                 include_user_agent=self.include_user_agent,
                 session=self.session,
-                use_document_model=self.use_document_model,
+                use_document_model=self._use_document_model,
                 headers=self.headers,
-                mute_progress_bars=self.mute_progress_bars,
+                mute_progress_bars=self._mute_progress_bars,
+                executor=self.executor,
             )
         return self._es_rester
 
+    def _get_es_rows(
+        self,
+        prefix: str,
+        label: str,
+        task_ids: list[str],
+        conditions: str = "",
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve rows of a parsed electronic structure table for many task IDs at once.
+
+        Arguments:
+            prefix (str): S3 object prefix of the table
+            label (str): label of the table in the query builder
+            task_ids (list of str): task IDs to retrieve rows for
+            conditions (str): additional SQL conditions on the rows
+
+        Returns:
+            dict of task ID to the first row found for it
+        """
+        identifiers = {
+            str(AlphaID(task_id.split("-")[-1], padlen=8)): task_id
+            for task_id in task_ids
+        }
+        if not identifiers:
+            return {}
+
+        table_lbl, _ = self._get_delta_table(
+            "materialsproject-parsed", prefix, label=label
+        )
+        id_str = ", ".join(f"'{identifier}'" for identifier in identifiers)
+        table = self._query_delta_single(
+            f"""
+            SELECT *
+            FROM   {table_lbl}
+            WHERE  identifier IN ({id_str})
+            """
+            + conditions
+        )
+
+        rows: dict[str, dict[str, Any]] = {}
+        for row in table.to_pylist(maps_as_pydicts="strict"):
+            rows.setdefault(identifiers[row["identifier"]], row)
+        return rows
+
+    def _get_es_task_ids(
+        self, material_ids: list[str], field: str
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve the summary of a property of many electronic structure docs at once.
+
+        Arguments:
+            material_ids (list of str): Materials Project IDs
+            field (str): "bandstructure" or "dos"
+
+        Returns:
+            dict of material ID to the (non-null) summary of the property
+        """
+        if not material_ids:
+            return {}
+        docs = self.es_rester.search(
+            material_ids=validate_ids(material_ids),
+            fields=["material_id", field],
+        )
+        summaries = {}
+        for doc in docs:
+            if (summary := doc.get(field)) is not None:
+                summaries[str(doc["material_id"])] = (
+                    summary.model_dump() if self.use_document_model else summary  # type: ignore
+                )
+        return summaries
+
 
 class BandStructureRester(BaseESPropertyRester):
     suffix = "materials/electronic_structure/bandstructure"
@@ -280,47 +352,76 @@ class BandStructureRester(BaseESPropertyRester):
         Returns:
             bandstructure (BandStructure): BandStructure or BandStructureSymmLine object
         """
-        bs_lbl, _ = self._get_delta_table(
-            "materialsproject-parsed",
-            "core/electronic-structure/bandstructures/",
-            label="bandstructure",
-        )
+        if (
+            bs := self.get_bandstructures_from_task_ids(
+                [task_id],
+                run_type=run_type,
+                path_type=path_type,
+                load_projections=load_projections,
+            ).get(task_id)
+        ) is None:
+            raise MPRestError(
+                f"No bandstructure data found for {task_id=}"
+                + (f"run_type={run_type}" if run_type else "")
+            )
+        return bs
 
-        query = f"""
-            SELECT *
-            FROM   {bs_lbl}
-            WHERE  identifier='{str(AlphaID(task_id.split("-")[-1],padlen=8))}'
-        """
+    def get_bandstructures_from_task_ids(
+        self,
+        task_ids: list[str],
+        run_type: str | RunType | None = None,
+        path_type: str | BSPathType | None = None,
+        load_projections: bool = False,
+    ) -> dict[str, BandStructure]:
+        """Get the band structure pymatgen objects associated with many task IDs.
+
+        The band structures (and projections) are retrieved with a single query
+        per table.
+
+        Arguments:
+            task_ids (list of str): Task IDs for the band structure calculations
+            run_type (str, RunType, or None): Optional run type,
+                will speed up query due to delta table partitioning.
+            path_type (str, BSPathType, or None) : Optional path type to
+                speed up query
+            load_projections (bool) : Optionally load atom- and spin-projected
+                bandstructures, if available.
 
+        Returns:
+            dict of task ID to BandStructure or BandStructureSymmLine object.
+                Task IDs without band structure data are omitted.
+        """
+        conditions = ""
         if run_type:
             rt = RunType(run_type) if isinstance(run_type, str) else run_type
-            query += f"\nAND run_type='{rt.value}'"
+            conditions += f"\nAND run_type='{rt.value}'"
         if path_type:
-            query += f"\nAND path_convention='{path_type}'"
-
-        table = self._query_delta_single(query)
-        if len(deser := table.to_pylist(maps_as_pydicts="strict")) > 0:
-            if load_projections:
-                proj_bs_label, _ = self._get_delta_table(
-                    "materialsproject-parsed",
-                    "core/electronic-structure/projected-bandstructures/",
-                    label="bandstructure_projections",
-                )
-                proj_table = self._query_delta_single(
-                    query.replace(bs_lbl, proj_bs_label)
-                )
-                if (
-                    len(deser_proj := proj_table.to_pylist(maps_as_pydicts="strict"))
-                    > 0
-                ):
-                    deser[0]["projections"] = deser_proj[0]
-            emmet_bs = ElectronicBS(**deser[0])
-            return emmet_bs.to_pmg(
-                pmg_cls=BandStructureSymmLine if emmet_bs.labels_dict else BandStructure
-            )
-        raise MPRestError(
-            f"No bandstructure data found for {task_id=}"
-            + (f"run_type={rt}" if run_type else "")
+            conditions += f"\nAND path_convention='{path_type}'"
+
+        rows = self._get_es_rows(
+            "core/electronic-structure/bandstructures/",
+            "bandstructure",
+            task_ids,
+            conditions=conditions,
+        )
+        if rows and load_projections:
+            for task_id, proj_row in self._get_es_rows(
+                "core/electronic-structure/projected-bandstructures/",
+                "bandstructure_projections",
+                list(rows),
+                conditions=conditions,
+            ).items():
+                rows[task_id]["projections"] = proj_row
+
+        return {
+            task_id: self._decode_bandstructure(row) for task_id, row in rows.items()
+        }
+
+    @staticmethod
+    def _decode_bandstructure(row: dict[str, Any]) -> BandStructure:
+        emmet_bs = ElectronicBS(**row)
+        return emmet_bs.to_pmg(
+            pmg_cls=BandStructureSymmLine if emmet_bs.labels_dict else BandStructure
         )
 
     def get_bandstructure_from_material_id(
@@ -402,6 +503,52 @@ class BandStructureRester(BaseESPropertyRester):
             return bs_obj
         raise MPRestError("No band structure object found.")
 
+    def get_bandstructures_from_material_ids(
+        self,
+        material_ids: list[str],
+        path_type: str | BSPathType = BSPathType.setyawan_curtarolo,
+        line_mode=True,
+        load_projections: bool = False,
+    ) -> dict[str, BandStructure]:
+        """Get the band structure pymatgen objects associated with many Materials Project IDs.
+
+        The task IDs of the band structures are resolved with a single search of the
+        electronic structure docs, see `get_bandstructures_from_task_ids`.
+
+        Arguments:
+            material_ids (list of str): Materials Project IDs
+            path_type (BSPathType or its value as a str): k-point path selection convention
+            line_mode (bool): Whether to return data for line-mode calculations
+            load_projections (bool) : Optionally load atom- and spin-projected
+                bandstructures, if available.
+
+        Returns:
+            dict of material ID to BandStructure or BandStructureSymmLine object.
+                Materials without band structure data are omitted.
+        """
+        pt: BSPathType = (
+            BSPathType(path_type) if isinstance(path_type, str) else path_type
+        )
+        task_ids = {}
+        for material_id, summary in self._get_es_task_ids(
+            material_ids, "bandstructure" if line_mode else "dos"
+        ).items():
+            if line_mode and summary.get(pt.value) is not None:
+                task_ids[material_id] = summary[pt.value]["task_id"]
+            elif not line_mode and summary.get("total") is not None:
+                task_ids[material_id] = summary["task_id"]
+
+        bandstructures = self.get_bandstructures_from_task_ids(
+            list(set(task_ids.values())),
+            path_type=pt if line_mode else BSPathType.unknown,
+            load_projections=load_projections,
+        )
+        return {
+            material_id: bandstructures[task_id]
+            for material_id, task_id in task_ids.items()
+            if task_id in bandstructures
+        }
+
 
 class DosRester(BaseESPropertyRester):
     suffix = "materials/electronic_structure/dos"
@@ -537,42 +684,63 @@ class DosRester(BaseESPropertyRester):
         Returns:
             pymatgen Dos
         """
-        dos_lbl, _ = self._get_delta_table(
-            "materialsproject-parsed",
-            "core/electronic-structure/total-dos/",
-            label="total_dos",
-        )
+        if (
+            dos := self.get_dos_from_task_ids(
+                [task_id], run_type=run_type, load_projections=load_projections
+            ).get(task_id)
+        ) is None:
+            raise MPRestError(
+                f"No DOS data found for {task_id=}"
+                + (f"run_type={run_type}" if run_type else "")
+            )
+        return dos
 
-        query = f"""
-            SELECT *
-            FROM   {dos_lbl}
-            WHERE  identifier='{str(AlphaID(task_id.split("-")[-1],padlen=8))}'
-        """
+    def get_dos_from_task_ids(
+        self,
+        task_ids: list[str],
+        run_type: str | RunType | None = None,
+        load_projections: bool = False,
+    ) -> dict[str, Dos]:
+        """Get the density of states pymatgen objects associated with many calculation IDs.
 
+        The densities of states (and projections) are retrieved with a single query
+        per table.
+
+        Arguments:
+            task_ids (list of str): Task IDs for the density of states calculations
+            run_type (str, RunType, or None): Optional run type to query by.
+                Will speed up query due to delta table partitioning.
+            load_projections (bool) : Optionally load atom- and spin-orbital-projected
+                DOS, if available.
+
+        Returns:
+            dict of task ID to pymatgen Dos. Task IDs without DOS data are omitted.
+        """
+        conditions = ""
         if run_type:
             rt = RunType(run_type) if isinstance(run_type, str) else run_type
-            query += f"\nAND run_type='{rt.value}'"
-
-        table = self._query_delta_single(query)
-        if len(deser := table.to_pylist(maps_as_pydicts="strict")) > 0:
-            if load_projections:
-                proj_dos_label, _ = self._get_delta_table(
-                    "materialsproject-parsed",
-                    "core/electronic-structure/projected-dos/",
-                    label="dos_projections",
-                )
-                proj_table = self._query_delta_single(
-                    query.replace(dos_lbl, proj_dos_label)
-                )
-                if (
-                    len(deser_proj := proj_table.to_pylist(maps_as_pydicts="strict"))
-                    > 0
-                ):
-                    deser[0]["projected_densities"] = deser_proj[0]
-            return ElectronicDos(**deser[0]).to_pmg()
-        raise MPRestError(
-            f"No DOS data found for {task_id=}" + (f"run_type={rt}" if run_type else "")
+            conditions += f"\nAND run_type='{rt.value}'"
+
+        rows = self._get_es_rows(
+            "core/electronic-structure/total-dos/",
+            "total_dos",
+            task_ids,
+            conditions=conditions,
         )
+        if rows and load_projections:
+            for task_id, proj_row in self._get_es_rows(
+                "core/electronic-structure/projected-dos/",
+                "dos_projections",
+                list(rows),
+                conditions=conditions,
+            ).items():
+                rows[task_id]["projected_densities"] = proj_row
+
+        return {task_id: self._decode_dos(row) for task_id, row in rows.items()}
+
+    @staticmethod
+    def _decode_dos(row: dict[str, Any]) -> Dos:
+        return ElectronicDos(**row).to_pmg()
 
     def get_dos_from_material_id(
         self, material_id: str, load_projections: bool = False
@@ -601,3 +769,34 @@ class DosRester(BaseESPropertyRester):
             "task_id"
         ]
         return self.get_dos_from_task_id(dos_task_id, load_projections=load_projections)
+
+    def get_dos_from_material_ids(
+        self, material_ids: list[str], load_projections: bool = False
+    ) -> dict[str, Dos]:
+        """Get the complete density of states pymatgen objects associated with many Materials Project IDs.
+
+        The task IDs of the densities of states are resolved with a single search of
+        the electronic structure docs, see `get_dos_from_task_ids`.
+
+        Arguments:
+            material_ids (list of str): Materials Project IDs
+            load_projections (bool) : Optionally load atom- and spin-orbital-projected
+                DOS, if available.
+
+        Returns:
+            dict of material ID to pymatgen Dos. Materials without DOS data are omitted.
+        """
+        task_ids = {
+            material_id: summary["task_id"]
+            for material_id, summary in self._get_es_task_ids(
+                material_ids, "dos"
+            ).items()
+        }
+        dos = self.get_dos_from_task_ids(
+            list(set(task_ids.values())), load_projections=load_projections
+        )
+        return {
+            material_id: dos[task_id]
+            for material_id, task_id in task_ids.items()
+            if task_id in dos
+        }
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from math import ceil
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -7,6 +10,7 @@ from emmet.core.symmetry import CrystalSystem
 from emmet.core.vasp.calc_types import RunType
 from emmet.core.vasp.material import BlessedCalcs, MaterialsDoc
 from pymatgen.core.structure import Structure
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 from mp_api.client.core.client import CoreRester, MPRestError
 from mp_api.client.core.settings import MAPI_CLIENT_SETTINGS
@@ -14,8 +18,92 @@ from mp_api.client.core.utils import validate_ids
 from mp_api.client.routes.materials import MATERIALS_RESTERS
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from typing import Any
 
+    from pymatgen.analysis.structure_matcher import StructureMatcher
+
+# Minimum number of structure fits to spread across processes
+_MIN_PARALLEL_FITS = 16
+
+
+class _WorkerMatcher:
+    """Matcher of a worker process, set once by the pool initializer instead of
+    being pickled with every task.
+    """
+
+    matcher: StructureMatcher | None = None
+
+
+def _init_matcher(matcher: StructureMatcher) -> None:
+    _WorkerMatcher.matcher = matcher
+
+
+def _fit_structures(structure: Structure, candidates: list[Structure]) -> list[bool]:
+    """Whether a structure matches each of the candidates."""
+    return [
+        _WorkerMatcher.matcher.fit(structure, candidate)  # type: ignore[union-attr]
+        for candidate in candidates
+    ]
+
+
+def _match_in_processes(
+    matcher: StructureMatcher,
+    structures: list[Structure],
+    candidates: list[list[tuple[str, Structure]]],
+    max_matches: list[int],
+    num_processes: int,
+) -> list[list[str]]:
+    """Match structures to their candidates across a process pool.
+
+    The candidates are matched in chunks, submitted in order with a bounded number
+    in flight. Once the leading chunks of a structure hold `max_matches` matches,
+    its remaining chunks are not submitted.
+
+    Returns:
+        The material IDs of the first `max_matches` matches of each structure
+    """
+    num_fits = sum(len(_candidates) for _candidates in candidates)
+    chunk_size = max(ceil(num_fits / (4 * num_processes)), 1)
+    tasks = deque(
+        (idx, start // chunk_size, _candidates[start : start + chunk_size])
+        for idx, _candidates in enumerate(candidates)
+        for start in range(0, len(_candidates), chunk_size)
+    )
+    chunk_matches: list[dict[int, list[str]]] = [{} for _ in structures]
+
+    def _leading_matches(idx: int) -> list[str]:
+        matches, chunk_idx = [], 0
+        while (chunk := chunk_matches[idx].get(chunk_idx)) is not None:
+            matches.extend(chunk)
+            chunk_idx += 1
+        return matches
+
+    pending: dict[Future, tuple[int, int, list[str]]] = {}
+    with ProcessPoolExecutor(
+        max_workers=num_processes, initializer=_init_matcher, initargs=(matcher,)
+    ) as executor:
+        while tasks or pending:
+            while tasks and len(pending) < 2 * num_processes:
+                idx, chunk_idx, chunk = tasks.popleft()
+                if len(_leading_matches(idx)) < max_matches[idx]:
+                    future = executor.submit(
+                        _fit_structures, structures[idx], [c for _, c in chunk]
+                    )
+                    pending[future] = (idx, chunk_idx, [mpid for mpid, _ in chunk])
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, chunk_idx, material_ids = pending.pop(future)
+                chunk_matches[idx][chunk_idx] = [
+                    mpid
+                    for mpid, fit in zip(material_ids, future.result(), strict=True)
+                    if fit
+                ]
+
+    return [
+        _leading_matches(idx)[: max_matches[idx]] for idx in range(len(structures))
+    ]
+
 
 class MaterialsRester(CoreRester):
     suffix = "materials/core"
@@ -174,6 +262,17 @@ class MaterialsRester(CoreRester):
             **query_params,
         )
 
+    @staticmethod
+    def _load_structure(filename_or_structure: str | Path | Structure) -> Structure:
+        if (
+            isinstance(filename_or_structure, str | Path)
+            and Path(filename_or_structure).exists()
+        ):
+            return Structure.from_file(filename_or_structure)
+        elif isinstance(filename_or_structure, Structure):
+            return filename_or_structure
+        raise MPRestError("Provide filename or Structure object.")
+
     def find_structure(
         self,
         filename_or_structure: str | Path | Structure,
@@ -181,6 +280,9 @@ class MaterialsRester(CoreRester):
         stol=MAPI_CLIENT_SETTINGS.STOL,
         angle_tol=MAPI_CLIENT_SETTINGS.ANGLE_TOL,
         allow_multiple_results: bool | int = False,
+        match_spacegroup: bool = False,
+        volume_tol: float | None = None,
+        num_processes: int = 1,
     ) -> list[str] | str:
         """Finds matching structures from the Materials Project database.
 
@@ -198,6 +300,17 @@ class MaterialsRester(CoreRester):
                 a single material_id or list of material_ids.
                 If a bool, returns either all matches (True) or one match at most (False).
                 If an int, returns that many matches at most.
+            match_spacegroup (bool): only match materials with the same spacegroup
+                number as the structure. Faster, but may miss matches within the
+                tolerances whose symmetry was detected differently.
+            volume_tol (float or None): only match materials whose volume per atom,
+                i.e. density for a given formula, is within this fraction of that of
+                the structure. Faster, but the volumes are otherwise scaled before
+                matching.
+            num_processes (int): number of processes to match structures with.
+                Defaults to 1, i.e., matching in this process; a process pool is only
+                started for a larger value. Scripts matching in parallel should be
+                guarded by `if __name__ == "__main__":` on platforms which spawn processes.
 
         Returns:
             A matching material_id if one is found or list of results if allow_multiple_results
@@ -205,34 +318,110 @@ class MaterialsRester(CoreRester):
         Raises:
             MPRestError
         """
+        return self.find_structures(
+            [filename_or_structure],
+            ltol=ltol,
+            stol=stol,
+            angle_tol=angle_tol,
+            allow_multiple_results=allow_multiple_results,
+            match_spacegroup=match_spacegroup,
+            volume_tol=volume_tol,
+            num_processes=num_processes,
+        )[0]
+
+    def find_structures(
+        self,
+        filenames_or_structures: list[str | Path | Structure],
+        ltol=MAPI_CLIENT_SETTINGS.LTOL,
+        stol=MAPI_CLIENT_SETTINGS.STOL,
+        angle_tol=MAPI_CLIENT_SETTINGS.ANGLE_TOL,
+        allow_multiple_results: bool | int = False,
+        match_spacegroup: bool = False,
+        volume_tol: float | None = None,
+        num_processes: int = 1,
+    ) -> list[list[str] | str]:
+        """Finds matching Materials Project structures for many structures at once.
+
+        The candidate materials of all structures are retrieved with a single search
+        by reduced formula, and optionally matched across a process pool.
+
+        Args:
+            filenames_or_structures: filenames as a str or Path, or Structure objects
+            ltol: fractional length tolerance
+            stol: site tolerance
+            angle_tol: angle tolerance in degrees
+            allow_multiple_results (bool or int): see `find_structure`
+            match_spacegroup (bool): see `find_structure`
+            volume_tol (float or None): see `find_structure`
+            num_processes (int): see `find_structure`
+
+        Returns:
+            The result of `find_structure` for each structure, in order
+        Raises:
+            MPRestError
+        """
         from pymatgen.analysis.structure_matcher import (
             ElementComparator,
             StructureMatcher,
         )
 
-        if (
-            isinstance(filename_or_structure, str | Path)
-            and Path(filename_or_structure).exists()
-        ):
-            s = Structure.from_file(filename_or_structure)
-        elif isinstance(filename_or_structure, Structure):
-            s = filename_or_structure
-        else:
-            raise MPRestError("Provide filename or Structure object.")
+        structures = [self._load_structure(s) for s in filenames_or_structures]
+        if not isinstance(allow_multiple_results, bool | int):
+            raise MPRestError(
+                f"`allow_multiple_results` must be a bool or int, not {type(allow_multiple_results)}"
+            )
 
-        mat_docs = self.search(
-            formula=s.reduced_formula, fields=["material_id", "structure"]
+        formulas = sorted({s.reduced_formula for s in structures})
+        mat_docs = (
+            self.search(
+                formula=formulas,
+                fields=["material_id", "structure"]
+                + (["symmetry"] if match_spacegroup else []),
+            )
+            if formulas
+            else []
         )
-        if not mat_docs:
-            return []
 
-        if isinstance(allow_multiple_results, bool):
-            max_matches: int = len(mat_docs) if allow_multiple_results else 1
-        elif isinstance(allow_multiple_results, int):
-            max_matches = allow_multiple_results
-        else:
-            raise MPRestError(
-                f"`allow_multiple_results` must be a bool or int, not {type(allow_multiple_results)}"
+        candidates_by_formula: dict[str, list[tuple[str, Structure, int | None]]] = (
+            defaultdict(list)
+        )
+        for doc in mat_docs:
+            if self.use_document_model:
+                material_id = doc.material_id.string  # type: ignore[union-attr]
+                structure = doc.structure  # type: ignore[union-attr]
+                spacegroup = doc.symmetry.number if match_spacegroup else None  # type: ignore[union-attr]
+            else:
+                material_id = doc["material_id"]  # type: ignore[index]
+                structure = Structure.from_dict(doc["structure"])  # type: ignore[index]
+                spacegroup = (
+                    doc["symmetry"]["number"] if match_spacegroup else None  # type: ignore[index]
+                )
+            candidates_by_formula[structure.reduced_formula].append(
+                (material_id, structure, spacegroup)
+            )
+
+        # Cheap invariants, to only run the matcher on plausible candidates
+        candidates: list[list[tuple[str, Structure]]] = []
+        for s in structures:
+            spacegroup = (
+                SpacegroupAnalyzer(s).get_space_group_number()
+                if match_spacegroup
+                else None
+            )
+            volume_per_atom = s.volume / len(s)
+            candidates.append(
+                [
+                    (material_id, candidate)
+                    for material_id, candidate, sg in candidates_by_formula[
+                        s.reduced_formula
+                    ]
+                    if (spacegroup is None or sg == spacegroup)
+                    and (
+                        volume_tol is None
+                        or abs(candidate.volume / len(candidate) - volume_per_atom)
+                        <= volume_tol * volume_per_atom
+                    )
+                ]
             )
 
         matcher = StructureMatcher(
@@ -245,20 +434,40 @@ class MaterialsRester(CoreRester):
             comparator=ElementComparator(),
         )
 
-        matches: list[str] = []
-        for doc in mat_docs:
-            if matcher.fit(
-                s,
-                doc.structure if self.use_document_model else Structure.from_dict(doc["structure"]),  # type: ignore
+        def _max_matches(num_candidates: int) -> int:
+            if isinstance(allow_multiple_results, bool):
+                return num_candidates if allow_multiple_results else 1
+            return allow_multiple_results
+
+        max_matches = [_max_matches(len(_candidates)) for _candidates in candidates]
+        num_fits = sum(len(_candidates) for _candidates in candidates)
+        matched_ids: list[list[str]] = []
+        if num_processes > 1 and num_fits >= _MIN_PARALLEL_FITS:
+            matched_ids = _match_in_processes(
+                matcher, structures, candidates, max_matches, num_processes
+            )
+        else:
+            for s, _candidates, _max in zip(
+                structures, candidates, max_matches, strict=True
             ):
-                matches.append(doc.material_id.string if self.use_document_model else doc["material_id"])  # type: ignore
-                if len(matches) >= max_matches:
-                    break
-
-        if not matches:
-            return []
-        material_ids = validate_ids(matches)
-        return material_ids if allow_multiple_results else material_ids[0]
+                matches = []
+                for material_id, candidate in _candidates:
+                    if matcher.fit(s, candidate):
+                        matches.append(material_id)
+                        if len(matches) >= _max:
+                            break
+                matched_ids.append(matches)
+
+        return [
+            (
+                validate_ids(matches)
+                if allow_multiple_results
+                else validate_ids(matches)[0]
+            )
+            if matches
+            else []
+            for matches in matched_ids
+        ]
 
     def get_blessed_entries(
         self,
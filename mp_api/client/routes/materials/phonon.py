@@ -31,9 +31,10 @@ class PhononRester(BaseRester):
                 endpoint=self.base_endpoint,
                 include_user_agent=self.include_user_agent,
                 session=self.session,
-                use_document_model=self.use_document_model,
+                use_document_model=self._use_document_model,
                 headers=self.headers,
-                mute_progress_bars=self.mute_progress_bars,
+                mute_progress_bars=self._mute_progress_bars,
+                executor=self.executor,
             )
         return self._summary_rester
 
@@ -143,6 +144,85 @@ class PhononRester(BaseRester):
             **query_params,
         )
 
+    def _get_phonon_ids(
+        self, material_ids: list[str], phonon_method: str
+    ) -> dict[str, str]:
+        """Resolve the phonon IDs of many materials with a single summary query.
+
+        Arguments:
+            material_ids (list of str): Materials Project IDs
+            phonon_method (str): phonon method, i.e. pheasy or dfpt
+
+        Returns:
+            dict of material ID to its first phonon ID for `phonon_method`.
+                Materials without such a phonon ID are omitted.
+        """
+        if not material_ids:
+            return {}
+        summary_docs = self.summary_rester.search(
+            material_ids=validate_ids(material_ids),
+            fields=["material_id", "phonon_IDs"],
+        )
+        return {
+            str(doc["material_id"]): phonon_ids[0]  # type: ignore[index]
+            for doc in summary_docs
+            if (phonon_ids := (doc.get("phonon_IDs") or {}).get(phonon_method))  # type: ignore[union-attr]
+        }
+
+    def _get_phonon_rows(
+        self,
+        prefix: str,
+        label: str,
+        identifiers: list[str],
+        phonon_method: str,
+        conditions: str = "",
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve rows of a parsed phonon table for many phonon IDs with a single query.
+
+        Arguments:
+            prefix (str): S3 object prefix of the table
+            label (str): label of the table in the query builder
+            identifiers (list of str): phonon IDs to retrieve rows for
+            phonon_method (str): phonon method, i.e. pheasy or dfpt
+            conditions (str): additional SQL conditions on the rows
+
+        Returns:
+            dict of phonon ID to the first row found for it
+        """
+        normalized = {
+            str(AlphaID(identifier.split("-")[-1], padlen=8)): identifier
+            for identifier in identifiers
+        }
+        if not normalized:
+            return {}
+
+        table_lbl, _ = self._get_delta_table(
+            "materialsproject-parsed", prefix, label=label
+        )
+        id_str = ", ".join(f"'{identifier}'" for identifier in normalized)
+        table = self._query_delta_single(
+            f"""
+            SELECT *
+            FROM   {table_lbl}
+            WHERE  identifier IN ({id_str})
+            AND    phonon_method='{phonon_method}'
+            """
+            + conditions
+        )
+
+        rows: dict[str, dict[str, Any]] = {}
+        for row in table.to_pylist(maps_as_pydicts="strict"):
+            rows.setdefault(normalized[row["identifier"]], row)
+        return rows
+
+    def _to_documents(
+        self, data: dict[str, dict[str, Any]], model: type[PhononBS | PhononDOS]
+    ) -> dict[str, Any]:
+        """Validate phonon data, if `use_document_model`."""
+        if not self.use_document_model:
+            return data
+        return {key: model(**values) for key, values in data.items()}
+
     def get_bandstructure_from_phonon_id(
         self,
         identifier: str,
@@ -159,31 +239,50 @@ class PhononRester(BaseRester):
         Returns:
             bandstructure (PhononBS): PhononBS object
         """
-        ph_bs_lbl, _ = self._get_delta_table(
-            "materialsproject-parsed",
-            "phonon/electronic-structure/bandstructures/",
-            label="ph_bandstructure",
-        )
+        if (
+            bs := self.get_bandstructures_from_phonon_ids(
+                [identifier], phonon_method, path_type=path_type
+            ).get(identifier)
+        ) is None:
+            raise MPRestError(
+                f"No phonon bandstructure data found for {identifier=} and {phonon_method=}"
+                + (f" and run_type={path_type}" if path_type else "")
+            )
+        return bs
 
-        query = f"""
-            SELECT *
-            FROM   {ph_bs_lbl}
-            WHERE  identifier='{str(AlphaID(identifier.split("-")[-1],padlen=8))}'
-            AND    phonon_method='{phonon_method}'
-        """
+    def get_bandstructures_from_phonon_ids(
+        self,
+        identifiers: list[str],
+        phonon_method: str,
+        path_type: str | BSPathType = BSPathType.setyawan_curtarolo,
+    ) -> dict[str, PhononBS | dict[str, Any]]:
+        """Get the phonon band structures associated with many phonon IDs and a phonon method.
 
-        if path_type:
-            query += f"\nAND path_convention='{path_type}'"
+        The band structures are retrieved with a single query.
 
-        table = self._query_delta_single(query)
-        deser = table.to_pylist(maps_as_pydicts="strict")
-        if deser and deser[0].get("bandstructure") is not None:
-            bs = deser[0]["bandstructure"]
-            return PhononBS(**bs) if self.use_document_model else bs
+        Arguments:
+            identifiers (list of str): Phonon IDs for the phonon band structure calculations
+            phonon_method (str): phonon method, i.e. pheasy or dfpt
+            path_type (BSPathType or str): k-path selection convention for the band structure.
 
-        raise MPRestError(
-            f"No phonon bandstructure data found for {identifier=} and {phonon_method=}"
-            + (f" and run_type={path_type}" if path_type else "")
+        Returns:
+            dict of phonon ID to PhononBS object. Phonon IDs without band structure
+                data are omitted.
+        """
+        rows = self._get_phonon_rows(
+            "phonon/electronic-structure/bandstructures/",
+            "ph_bandstructure",
+            identifiers,
+            phonon_method,
+            conditions=f"\nAND path_convention='{path_type}'" if path_type else "",
+        )
+        return self._to_documents(
+            {
+                identifier: row["bandstructure"]
+                for identifier, row in rows.items()
+                if row.get("bandstructure") is not None
+            },
+            PhononBS,
         )
 
     def get_bandstructure_from_material_id(
@@ -224,6 +323,39 @@ class PhononRester(BaseRester):
             summary_doc[0]["phonon_IDs"][phonon_method][0], phonon_method, pt  # type: ignore[arg-type, index]
         )
 
+    def get_bandstructures_from_material_ids(
+        self,
+        material_ids: list[str],
+        phonon_method: str,
+        path_type: str | BSPathType = BSPathType.setyawan_curtarolo,
+    ) -> dict[str, PhononBS | dict[str, Any]]:
+        """Get the phonon band structures associated with many material IDs and a phonon method.
+
+        The phonon IDs of the materials are resolved with a single summary query,
+        see `get_bandstructures_from_phonon_ids`.
+
+        Arguments:
+            material_ids (list of str): Materials Project IDs
+            phonon_method (str): phonon method, i.e. pheasy or dfpt
+            path_type (BSPathType or str): k-path selection convention for the band structure.
+
+        Returns:
+            dict of material ID to PhononBS object. Materials without phonon band
+                structure data are omitted.
+        """
+        pt: BSPathType = (
+            BSPathType(path_type) if isinstance(path_type, str) else path_type
+        )
+        phonon_ids = self._get_phonon_ids(material_ids, phonon_method)
+        bandstructures = self.get_bandstructures_from_phonon_ids(
+            list(set(phonon_ids.values())), phonon_method, pt
+        )
+        return {
+            material_id: bandstructures[identifier]
+            for material_id, identifier in phonon_ids.items()
+            if identifier in bandstructures
+        }
+
     def get_dos_from_phonon_id(
         self, identifier: str, phonon_method: str
     ) -> PhononDOS | dict[str, Any]:
@@ -236,27 +368,41 @@ class PhononRester(BaseRester):
         Returns:
             dos (PhononDOS): PhononDOS object
         """
-        ph_dos_lbl, _ = self._get_delta_table(
-            "materialsproject-parsed",
-            "phonon/electronic-structure/dos/",
-            label="ph_dos",
-        )
+        if (
+            dos := self.get_dos_from_phonon_ids([identifier], phonon_method).get(
+                identifier
+            )
+        ) is None:
+            raise MPRestError(
+                f"No phonon dos data found for {identifier=} and {phonon_method=}"
+            )
+        return dos
 
-        query = f"""
-            SELECT *
-            FROM   {ph_dos_lbl}
-            WHERE  identifier='{str(AlphaID(identifier.split("-")[-1],padlen=8))}'
-            AND    phonon_method='{phonon_method}'
-        """
+    def get_dos_from_phonon_ids(
+        self, identifiers: list[str], phonon_method: str
+    ) -> dict[str, PhononDOS | dict[str, Any]]:
+        """Get the phonon dos associated with many phonon IDs and a phonon method.
 
-        table = self._query_delta_single(query)
-        deser = table.to_pylist(maps_as_pydicts="strict")
-        if deser and deser[0].get("dos") is not None:
-            dos = deser[0]["dos"]
-            return PhononDOS(**dos) if self.use_document_model else dos
+        The densities of states are retrieved with a single query.
 
-        raise MPRestError(
-            f"No phonon dos data found for {identifier=} and {phonon_method=}"
+        Arguments:
+            identifiers (list of str): Phonon IDs for the phonon dos calculations
+            phonon_method (str): phonon method, i.e. pheasy or dfpt
+
+        Returns:
+            dict of phonon ID to PhononDOS object. Phonon IDs without dos data
+                are omitted.
+        """
+        rows = self._get_phonon_rows(
+            "phonon/electronic-structure/dos/", "ph_dos", identifiers, phonon_method
+        )
+        return self._to_documents(
+            {
+                identifier: row["dos"]
+                for identifier, row in rows.items()
+                if row.get("dos") is not None
+            },
+            PhononDOS,
         )
 
     def get_dos_from_material_id(
@@ -289,6 +435,32 @@ class PhononRester(BaseRester):
             summary_doc[0]["phonon_IDs"][phonon_method][0], phonon_method  # type: ignore[arg-type, index]
         )
 
+    def get_dos_from_material_ids(
+        self, material_ids: list[str], phonon_method: str
+    ) -> dict[str, PhononDOS | dict[str, Any]]:
+        """Get the phonon dos associated with many material IDs and a phonon method.
+
+        The phonon IDs of the materials are resolved with a single summary query,
+        see `get_dos_from_phonon_ids`.
+
+        Arguments:
+            material_ids (list of str): Materials Project IDs
+            phonon_method (str): phonon method, i.e. pheasy or dfpt
+
+        Returns:
+            dict of material ID to PhononDOS object. Materials without phonon dos
+                data are omitted.
+        """
+        phonon_ids = self._get_phonon_ids(material_ids, phonon_method)
+        dos = self.get_dos_from_phonon_ids(
+            list(set(phonon_ids.values())), phonon_method
+        )
+        return {
+            material_id: dos[identifier]
+            for material_id, identifier in phonon_ids.items()
+            if identifier in dos
+        }
+
     def get_forceconstants_from_phonon_id(
         self, identifier: str, phonon_method: str
     ) -> list[list[Matrix3D]]:
@@ -301,27 +473,42 @@ class PhononRester(BaseRester):
         Returns:
             force constants (list[list[Matrix3D]]): force constants
         """
-        ph_fc_lbl, _ = self._get_delta_table(
-            "materialsproject-parsed",
-            "phonon/force-constants/",
-            label="ph_force_constants",
-        )
+        if (
+            force_constants := self.get_forceconstants_from_phonon_ids(
+                [identifier], phonon_method
+            ).get(identifier)
+        ) is None:
+            raise MPRestError(
+                f"No phonon force constants data found for {identifier=} and {phonon_method=}"
+            )
+        return force_constants
 
-        query = f"""
-            SELECT *
-            FROM   {ph_fc_lbl}
-            WHERE  identifier='{str(AlphaID(identifier.split("-")[-1],padlen=8))}'
-            AND    phonon_method='{phonon_method}'
-        """
+    def get_forceconstants_from_phonon_ids(
+        self, identifiers: list[str], phonon_method: str
+    ) -> dict[str, list[list[Matrix3D]]]:
+        """Get the force constants associated with many phonon IDs and a phonon method.
 
-        table = self._query_delta_single(query)
-        deser = table.to_pylist(maps_as_pydicts="strict")
-        if deser and deser[0].get("force_constants") is not None:
-            return deser[0]["force_constants"]
+        The force constants are retrieved with a single query.
+
+        Arguments:
+            identifiers (list of str): Phonon IDs for the force constants calculations
+            phonon_method (str): phonon method, i.e. pheasy or dfpt
 
-        raise MPRestError(
-            f"No phonon force constants data found for {identifier=} and {phonon_method=}"
+        Returns:
+            dict of phonon ID to force constants. Phonon IDs without force constants
+                data are omitted.
+        """
+        rows = self._get_phonon_rows(
+            "phonon/force-constants/",
+            "ph_force_constants",
+            identifiers,
+            phonon_method,
         )
+        return {
+            identifier: row["force_constants"]
+            for identifier, row in rows.items()
+            if row.get("force_constants") is not None
+        }
 
     def get_forceconstants_from_material_id(
         self, material_id: str, phonon_method: str
@@ -353,6 +540,32 @@ class PhononRester(BaseRester):
             summary_doc[0]["phonon_IDs"][phonon_method][0], phonon_method  # type: ignore[arg-type, index]
         )
 
+    def get_forceconstants_from_material_ids(
+        self, material_ids: list[str], phonon_method: str
+    ) -> dict[str, list[list[Matrix3D]]]:
+        """Get the force constants associated with many material IDs and a phonon method.
+
+        The phonon IDs of the materials are resolved with a single summary query,
+        see `get_forceconstants_from_phonon_ids`.
+
+        Arguments:
+            material_ids (list of str): Materials Project IDs
+            phonon_method (str): phonon method, i.e. pheasy or dfpt
+
+        Returns:
+            dict of material ID to force constants. Materials without force constants
+                data are omitted.
+        """
+        phonon_ids = self._get_phonon_ids(material_ids, phonon_method)
+        force_constants = self.get_forceconstants_from_phonon_ids(
+            list(set(phonon_ids.values())), phonon_method
+        )
+        return {
+            material_id: force_constants[identifier]
+            for material_id, identifier in phonon_ids.items()
+            if identifier in force_constants
+        }
+
     def compute_thermo_quantities(
         self,
         material_id: str | None = None,
@@ -380,9 +593,7 @@ class PhononRester(BaseRester):
         if not identifier and not material_id:
             raise MPRestError("One of `identifier` or `material_id` must be specified.")
 
-        use_document_model = self.use_document_model
-        self.use_document_model = False
-        try:
+        with self._call_options(use_document_model=False):
             if material_id:
                 if not (
                     summary_doc := self.summary_rester.search(
@@ -413,10 +624,84 @@ class PhononRester(BaseRester):
             if not docs or not docs[0]:
                 raise MPRestError("No phonon document found")
 
-            self.use_document_model = True
-            docs[0]["phonon_dos"] = ph_dos  # type: ignore[index]
-            doc = PhononBSDOSDoc(**docs[0])  # type: ignore[arg-type, index]
-        finally:
-            self.use_document_model = use_document_model
+        docs[0]["phonon_dos"] = ph_dos  # type: ignore[index]
+        doc = PhononBSDOSDoc(**docs[0])  # type: ignore[arg-type, index]
+        return self._thermo_quantities(doc)
+
+    @staticmethod
+    def _thermo_quantities(doc: PhononBSDOSDoc) -> dict[str, Any]:
         # below: same as numpy.linspace(0,800,100) but written out for mypy
         return doc.compute_thermo_quantities([i * 800 / 99 for i in range(100)])
+
+    def compute_thermo_quantities_from_phonon_ids(
+        self, identifiers: list[str], phonon_method: str
+    ) -> dict[str, dict[str, Any]]:
+        """Compute thermodynamical quantities for many phonon IDs and a phonon method.
+
+        This is a batch helper: the phonon docs and their dos are each retrieved
+        with a single query instead of one query per phonon ID. The quantities
+        themselves are computed one doc after the other, as in
+        `compute_thermo_quantities`.
+
+        Arguments:
+            identifiers (list of str): Phonon IDs to calculate quantities for
+            phonon_method (str): phonon method, i.e. pheasy or dfpt
+
+        Returns:
+            dict of phonon ID to its thermodynamical quantities. Phonon IDs without
+                phonon data are omitted.
+        """
+        with self._call_options(use_document_model=False):
+            ph_dos = self.get_dos_from_phonon_ids(identifiers, phonon_method)
+            docs = (
+                self.search(identifiers=list(ph_dos), phonon_method=phonon_method)
+                if ph_dos
+                else []
+            )
+
+        normalized = {
+            str(AlphaID(identifier.split("-")[-1], padlen=8)): identifier
+            for identifier in ph_dos
+        }
+        ph_docs = {}
+        for doc in docs:
+            identifier = normalized.get(
+                str(AlphaID(str(doc["identifier"]).split("-")[-1], padlen=8))  # type: ignore[index]
+            )
+            if identifier is not None and identifier not in ph_docs:
+                ph_docs[identifier] = PhononBSDOSDoc(
+                    **{**doc, "phonon_dos": ph_dos[identifier]}  # type: ignore[dict-item]
+                )
+
+        return {
+            identifier: self._thermo_quantities(doc)
+            for identifier, doc in ph_docs.items()
+        }
+
+    def compute_thermo_quantities_from_material_ids(
+        self, material_ids: list[str], phonon_method: str
+    ) -> dict[str, dict[str, Any]]:
+        """Compute thermodynamical quantities for many material IDs and a phonon method.
+
+        The phonon IDs of the materials are resolved with a single summary query,
+        see `compute_thermo_quantities_from_phonon_ids`.
+
+        Arguments:
+            material_ids (list of str): Materials Project IDs to calculate quantities
+                for; the first phonon ID associated with `phonon_method` for each
+                material will be used.
+            phonon_method (str): phonon method, i.e. pheasy or dfpt
+
+        Returns:
+            dict of material ID to its thermodynamical quantities. Materials without
+                phonon data are omitted.
+        """
+        phonon_ids = self._get_phonon_ids(material_ids, phonon_method)
+        quantities = self.compute_thermo_quantities_from_phonon_ids(
+            list(set(phonon_ids.values())), phonon_method
+        )
+        return {
+            material_id: quantities[identifier]
+            for material_id, identifier in phonon_ids.items()
+            if identifier in quantities
+        }
@@ -1,26 +1,39 @@
 from __future__ import annotations
 
+import json
 from collections import defaultdict
+from functools import cached_property
+from importlib.metadata import version as package_version
 from typing import TYPE_CHECKING
 
 import numpy as np
 from emmet.core.thermo import ThermoDoc, validate_thermo_id
 from emmet.core.types.enums import ThermoType
 from emmet.core.types.pymatgen_types.phase_diagram_adapter import PhaseDiagramType
+from monty.json import MontyDecoder, MontyEncoder
 from pydantic import TypeAdapter
 from pymatgen.analysis.phase_diagram import PhaseDiagram
 from pymatgen.core import Element
 
 from mp_api.client.core import BaseRester
+from mp_api.client.core.client import _open_disk_cache, logger
 from mp_api.client.core.exceptions import MPRestError
-from mp_api.client.core.settings import DEFAULT_THERMOTYPE
+from mp_api.client.core.settings import DEFAULT_THERMOTYPE, MAPI_CLIENT_SETTINGS
 from mp_api.client.core.utils import validate_ids
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from typing import Any
 
     from enums import Enum
 
+    from mp_api.client.core.cache import DiskCache
+
+_PHASE_DIAGRAM_ADAPTER = TypeAdapter(PhaseDiagramType)
+
+# Cached phase diagrams are only read back by the pymatgen version which wrote them
+_PYMATGEN_VERSION = package_version("pymatgen")
+
 
 class ThermoRester(BaseRester):
     suffix = "materials/thermo"
@@ -185,6 +198,35 @@ class ThermoRester(BaseRester):
             **query_params,
         )
 
+    @cached_property
+    def _phase_diagram_cache(self) -> DiskCache | None:
+        if not MAPI_CLIENT_SETTINGS.PHASE_DIAGRAM_CACHE:
+            return None
+        # Entries are keyed by database version, stale ones are evicted by size
+        return _open_disk_cache(
+            MAPI_CLIENT_SETTINGS.CACHE_DIR / "phase_diagrams.sqlite",
+            MAPI_CLIENT_SETTINGS.PHASE_DIAGRAM_CACHE_MAX_SIZE,
+        )
+
+    @staticmethod
+    def _deserialize_phase_diagram(phase_diagram: dict[str, Any]) -> PhaseDiagram:
+        pd = _PHASE_DIAGRAM_ADAPTER.validate_python(phase_diagram)
+
+        # Ensure el_ref keys are Element objects for PDPlotter.
+        # Ensure qhull_data is a numpy array
+        # This should be fixed in pymatgen
+        for key, entry in list(pd.el_refs.items()):
+            if not isinstance(key, str):
+                break
+
+            pd.el_refs[Element(str(key))] = entry
+            pd.el_refs.pop(key)
+
+        if isinstance(pd.qhull_data, list):
+            pd.qhull_data = np.array(pd.qhull_data)
+
+        return pd
+
     def get_phase_diagram_from_chemsys(
         self, chemsys: str, thermo_type: ThermoType | str = DEFAULT_THERMOTYPE
     ) -> PhaseDiagram:
@@ -198,41 +240,83 @@ class ThermoRester(BaseRester):
         Returns:
             (PhaseDiagram): Pymatgen phase diagram object.
         """
-        validated_thermo_type = self._check_thermo_types([thermo_type]).pop()
-
-        sorted_chemsys = "-".join(sorted(chemsys.split("-")))
-        version = self.db_version.replace(".", "-")
+        return self.get_phase_diagrams_from_chemsys(  # type: ignore[return-value]
+            [chemsys], thermo_type=thermo_type
+        ).get(chemsys)
 
-        pd_lbl, _ = self._get_delta_table(
-            "materialsproject-build", "objects/phase-diagrams", label="phase_diagrams"
-        )
-
-        query = f"""
-            SELECT phase_diagram
-            FROM   {pd_lbl}
-            WHERE  chemsys='{sorted_chemsys}'
-              AND  version='{version}'
-              AND  thermo_type='{validated_thermo_type}'
-        """
-        table = self._query_delta_single(query)
-        as_py = table["phase_diagram"].to_pylist(maps_as_pydicts="strict")
+    def get_phase_diagrams_from_chemsys(
+        self,
+        chemsys: list[str],
+        thermo_type: ThermoType | str = DEFAULT_THERMOTYPE,
+    ) -> dict[str, PhaseDiagram]:
+        """Get pre-computed phase diagrams for many chemsys.
 
-        pd: PhaseDiagram | None = None
-        if len(pds := TypeAdapter(list[PhaseDiagramType]).validate_python(as_py)) > 0:
-            pd = pds[0]
+        Phase diagrams are retrieved with a single query, and cached on disk
+        once deserialized (see MAPI_CLIENT_SETTINGS.PHASE_DIAGRAM_CACHE).
 
-        # Ensure el_ref keys are Element objects for PDPlotter.
-        # Ensure qhull_data is a numpy array
-        # This should be fixed in pymatgen
-        if pd:
-            for key, entry in list(pd.el_refs.items()):
-                if not isinstance(key, str):
-                    break
+        Arguments:
+            chemsys (list of str): Chemical systems (e.g. [Li-Fe-O, Na-Cl])
+            thermo_type (ThermoType): The thermo type for the phase diagrams.
+                Defaults to ThermoType.GGA_GGA_U_R2SCAN.
 
-                pd.el_refs[Element(str(key))] = entry
-                pd.el_refs.pop(key)
+        Returns:
+            (dict): Chemical system, as given, to pymatgen phase diagram object.
+                Chemical systems without a phase diagram are omitted.
+        """
+        validated_thermo_type = self._check_thermo_types([thermo_type]).pop()
+        version = self.db_version.replace(".", "-")
 
-            if isinstance(pd.qhull_data, list):
-                pd.qhull_data = np.array(pd.qhull_data)
+        sorted_chemsys = {
+            _chemsys: "-".join(sorted(_chemsys.split("-"))) for _chemsys in chemsys
+        }
+        cache_keys = {
+            _sorted: f"{_sorted}:{validated_thermo_type}:{version}:{_PYMATGEN_VERSION}"
+            for _sorted in sorted_chemsys.values()
+        }
 
-        return pd  # type: ignore
+        pds: dict[str, PhaseDiagram] = {}
+        if self._phase_diagram_cache is not None:
+            for _sorted, cache_key in cache_keys.items():
+                if (cached := self._phase_diagram_cache.get(cache_key)) is not None:
+                    try:
+                        pds[_sorted] = json.loads(cached, cls=MontyDecoder)
+                    except (ValueError, TypeError, KeyError) as exc:
+                        logger.warning(
+                            f"Ignoring invalid cached phase diagram of {_sorted}: {exc}"
+                        )
+
+        if missing := [_sorted for _sorted in cache_keys if _sorted not in pds]:
+            pd_lbl, _ = self._get_delta_table(
+                "materialsproject-build",
+                "objects/phase-diagrams",
+                label="phase_diagrams",
+            )
+            chemsys_str = ", ".join(f"'{_sorted}'" for _sorted in missing)
+            query = f"""
+                SELECT chemsys, phase_diagram
+                FROM   {pd_lbl}
+                WHERE  chemsys IN ({chemsys_str})
+                  AND  version='{version}'
+                  AND  thermo_type='{validated_thermo_type}'
+            """
+            table = self._query_delta_single(query)
+            for _sorted, phase_diagram in zip(
+                table["chemsys"].to_pylist(),
+                table["phase_diagram"].to_pylist(maps_as_pydicts="strict"),
+                strict=True,
+            ):
+                if _sorted in pds or phase_diagram is None:
+                    continue
+                pds[_sorted] = self._deserialize_phase_diagram(phase_diagram)
+                if self._phase_diagram_cache is not None:
+                    self._phase_diagram_cache.set(
+                        cache_keys[_sorted],
+                        json.dumps(pds[_sorted].as_dict(), cls=MontyEncoder).encode(),
+                        version=self.db_version,
+                    )
+
+        return {
+            _chemsys: pds[_sorted]
+            for _chemsys, _sorted in sorted_chemsys.items()
+            if _sorted in pds
+        }
@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from mp_api.client.core.async_client import AsyncBaseRester
+from mp_api.client.core.client import _Rester
+from mp_api.client.routes.materials.materials import MaterialsRester
+
+
+def _serve_material_ids(request: httpx.Request) -> httpx.Response:
+    """Serve one document per requested material ID, rejecting long ID lists."""
+    material_ids = request.url.params.get("material_ids", "").split(",")
+    if len(material_ids) > 100:
+        return httpx.Response(414, json={"detail": "URI Too Long"})
+
+    skip = int(request.url.params.get("_skip", 0))
+    limit = int(request.url.params.get("_limit", len(material_ids)))
+    return httpx.Response(
+        200,
+        text=json.dumps(
+            {
+                "data": [
+                    {"material_id": mpid} for mpid in material_ids[skip : skip + limit]
+                ],
+                "meta": {"total_doc": len(material_ids)},
+            }
+        ),
+    )
+
+
+@pytest.fixture
+def async_rester(monkeypatch):
+    monkeypatch.setattr(
+        _Rester,
+        "_get_heartbeat_info",
+        staticmethod(lambda endpoint: ("2025.01.01", [])),
+    )
+    return AsyncBaseRester(
+        MaterialsRester(api_key="x" * 32, use_document_model=False),
+        httpx.AsyncClient(transport=httpx.MockTransport(_serve_material_ids)),
+        asyncio.Semaphore(4),
+    )
+
+
+def test_async_search(async_rester):
+    material_ids = [f"mp-{idx}" for idx in range(150)]
+
+    async def _search():
+        return await asyncio.gather(
+            async_rester.search(material_ids=material_ids[:95], chunk_size=10),
+            async_rester.search(material_ids=material_ids, chunk_size=1000),
+            async_rester.search(
+                material_ids=material_ids[:95], chunk_size=10, num_chunks=2
+            ),
+            async_rester.count({"material_ids": ",".join(material_ids[:42])}),
+        )
+
+    paginated, split, truncated, count = asyncio.run(_search())
+    assert [doc["material_id"] for doc in paginated] == material_ids[:95]
+    assert [doc["material_id"] for doc in split] == material_ids
+    assert [doc["material_id"] for doc in truncated] == material_ids[:20]
+    assert count == 42
+
+
+def test_async_retry_after(async_rester, monkeypatch):
+    retries = [
+        httpx.Response(429, headers={"Retry-After": "1.5"}),
+        httpx.Response(502, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+    ]
+
+    def _handler(request):
+        return retries.pop(0) if retries else _serve_material_ids(request)
+
+    delays = []
+
+    async def _sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+    async_rester._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    docs = asyncio.run(async_rester.search(material_ids=["mp-1"]))
+    assert [doc["material_id"] for doc in docs] == ["mp-1"]
+    # Fractional seconds are honored, and dates in the past retry with backoff
+    assert delays[0] == 1.5
+    assert delays[1] > 0
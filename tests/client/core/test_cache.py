@@ -0,0 +1,60 @@
+import zlib
+from multiprocessing import Pool
+
+from mp_api.client.core.cache import DiskCache
+
+
+def _write(args):
+    path, idx = args
+    DiskCache(path, max_size=10**6).set(f"key-{idx}", b"value" * idx, version="v1")
+
+
+def test_disk_cache(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite", max_size=10**6)
+    assert cache.get("missing") is None
+
+    cache.set("a", b"x" * 10_000, version="v1")
+    assert cache.get("a") == b"x" * 10_000
+    assert "a" in cache
+
+    # Other processes can share the cache
+    with Pool(2) as pool:
+        pool.map(_write, [(cache.path, idx) for idx in range(1, 9)])
+    assert len(cache) == 9
+    assert cache.get("key-3") == b"value" * 3
+
+    cache.set("b", b"y", version="v2")
+    cache.prune("v2")
+    assert len(cache) == 1
+    assert cache.get("b") == b"y"
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_disk_cache_eviction(tmp_path):
+    values = {key: bytes(range(256)) * 40 for key in "abcd"}
+    size = len(zlib.compress(values["a"]))
+    cache = DiskCache(tmp_path / "cache.sqlite", max_size=3 * size)
+
+    for key in "abc":
+        cache.set(key, values[key])
+    # Using "a" makes "b" the least recently used entry
+    assert cache.get("a") == values["a"]
+    cache.set("d", values["d"])
+
+    assert "b" not in cache
+    assert all(key in cache for key in "acd")
+
+
+def test_disk_cache_unavailable(tmp_path):
+    # The cache directory cannot be created, e.g., on a read-only file system
+    (tmp_path / "file").write_text("")
+    cache = DiskCache(tmp_path / "file" / "cache.sqlite", max_size=10**6)
+    assert not cache.enabled
+
+    cache.set("a", b"x")
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert len(cache) == 0
+    cache.clear()
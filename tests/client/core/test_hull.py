@@ -0,0 +1,54 @@
+"""Test the vectorized evaluation of energies above the hull."""
+
+import numpy as np
+from pymatgen.analysis.phase_diagram import PDEntry, PhaseDiagram
+from pymatgen.core import Composition
+
+from mp_api.client.core._hull import HullEvaluator
+
+
+def _phase_diagram() -> PhaseDiagram:
+    return PhaseDiagram(
+        [
+            PDEntry("Li", -1.9),
+            PDEntry("Fe", -8.3),
+            PDEntry("O2", -9.8),
+            PDEntry("Li2O", -14.3),
+            PDEntry("Fe2O3", -38.1),
+            PDEntry("LiFeO2", -26.6),
+            PDEntry("Li5FeO4", -51.0),
+            PDEntry("FeO", -16.0),
+        ]
+    )
+
+
+def test_hull_evaluator_matches_phase_diagram():
+    pd = _phase_diagram()
+    evaluator = HullEvaluator(pd)
+
+    candidates = [
+        PDEntry("LiFeO2", -26.0),
+        PDEntry("Li2FeO3", -33.0),
+        PDEntry("Fe3O4", -52.5),
+        PDEntry("LiO2", -12.0),
+        PDEntry("Li", -1.9),
+        PDEntry("Li4Fe3O8", -95.0),
+    ]
+    expected = [
+        pd.get_decomp_and_e_above_hull(entry, allow_negative=True)[1]
+        for entry in candidates
+    ]
+    assert np.allclose(evaluator.get_e_above_hull_of_entries(candidates), expected)
+
+    # Compositions can be given as strings or dicts, in any amounts
+    assert np.allclose(
+        evaluator.get_hull_energies(["Li2O", {"Li": 4, "O": 2}]),
+        [pd.get_hull_energy_per_atom(Composition("Li2O"))] * 2,
+    )
+
+
+def test_hull_evaluator_foreign_elements():
+    evaluator = HullEvaluator(_phase_diagram())
+    e_above_hull = evaluator.get_e_above_hull(["NaCl", "Li2O", "Li2S"], [0, 0, 0])
+    assert np.isnan(e_above_hull[[0, 2]]).all()
+    assert np.isfinite(e_above_hull[1])
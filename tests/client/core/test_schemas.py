@@ -4,7 +4,12 @@ from itertools import product
 from pydantic import BaseModel
 import pytest
 
-from mp_api.client.core.schemas import _DictLikeAccess, _convert_to_model
+from mp_api.client.core.schemas import (
+    _MAX_CACHED_MODELS,
+    _DictLikeAccess,
+    _build_returned_model,
+    _convert_to_model,
+)
 
 
 class TestClass(_DictLikeAccess):
@@ -106,3 +111,19 @@ def test_model_generation():
 
     # Ensure graceful handling of empty iterator input (no docs returned)
     assert _convert_to_model(iter([]), TestClass) == []
+
+
+def test_model_generation_cache():
+    docs = [{"a": 1, "b": 2.0}, {"a": 2, "b": 3.0}]
+
+    first_page = _convert_to_model(docs, TestClass, requested_fields=["a", "b"])
+    second_page = _convert_to_model(docs, TestClass, requested_fields=["a", "b"])
+    assert type(first_page[0]) is type(second_page[0])
+
+    # Different set or requested fields need their own model
+    assert type(_convert_to_model(docs, TestClass)[0]) is not type(first_page[0])
+    assert type(
+        _convert_to_model([{"a": 1}], TestClass, requested_fields=["a", "b"])[0]
+    ) is not type(first_page[0])
+
+    assert _build_returned_model.cache_info().maxsize == _MAX_CACHED_MODELS
@@ -0,0 +1,82 @@
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+from mp_api.client.core._throttle import RequestLimiter, _retry_after_seconds
+
+
+def test_aimd_limit():
+    limiter = RequestLimiter(initial_limit=4, max_limit=8)
+
+    # Healthy responses raise the limit by about one request per round
+    for _ in range(4):
+        limiter.release(limiter.acquire(), 200)
+    assert limiter.limit == pytest.approx(5, abs=0.2)
+
+    # Overload halves the limit, once for all requests in flight at the time
+    started = [limiter.acquire() for _ in range(3)]
+    for start in started:
+        limiter.release(start, 429)
+    assert limiter.limit == pytest.approx(2.5, abs=0.1)
+    limiter.release(limiter.acquire(), 503)
+    assert limiter.limit == pytest.approx(1.25, abs=0.1)
+
+    for _ in range(10):
+        limiter.release(limiter.acquire(), None)
+    assert limiter.limit == 1
+    assert limiter.in_flight == 0
+
+
+def test_fixed_limit():
+    limiter = RequestLimiter(initial_limit=4, max_limit=8, adaptive=False)
+    for status_code in (200, 200, 429, 503, None):
+        limiter.release(limiter.acquire(), status_code)
+    assert limiter.limit == 4
+
+    # Retry-After is still honored
+    limiter.release(limiter.acquire(), 429, retry_after=0.2)
+    start = time.monotonic()
+    limiter.release(limiter.acquire(), 200)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_concurrency_limit():
+    limiter = RequestLimiter(initial_limit=2, max_limit=2)
+    started = [limiter.acquire() for _ in range(2)]
+
+    acquired_third = threading.Event()
+
+    def _third():
+        limiter.acquire()
+        acquired_third.set()
+
+    thread = threading.Thread(target=_third)
+    thread.start()
+    assert not acquired_third.wait(timeout=0.1)
+
+    limiter.release(started[0], 200)
+    assert acquired_third.wait(timeout=5)
+    thread.join()
+
+
+def test_rate_and_retry_after():
+    limiter = RequestLimiter(initial_limit=10, max_limit=10, rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.release(limiter.acquire(), 200)
+    # The burst, then one request every 1 / 50 s
+    assert time.monotonic() - start >= 0.09
+
+    limiter.release(limiter.acquire(), 429, retry_after=0.2)
+    start = time.monotonic()
+    limiter.release(limiter.acquire(), 200)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_retry_after_seconds():
+    assert _retry_after_seconds(None) is None
+    assert _retry_after_seconds("3") == 3
+    assert _retry_after_seconds("not a date") is None
+    assert 50 < _retry_after_seconds(formatdate(time.time() + 60, usegmt=True)) <= 60
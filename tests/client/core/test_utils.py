@@ -3,7 +3,13 @@
 import pytest
 
 from mp_api.client.core.exceptions import MPRestError, MPRestWarning
-from mp_api.client.core.utils import LazyImport
+from mp_api.client.core.utils import (
+    LazyImport,
+    MPDataset,
+    _criteria_to_sql,
+    _prefetch_batches,
+    _StreamingDatasetWriter,
+)
 
 
 def test_lazy_import_module():
@@ -164,3 +170,234 @@ def test_api_key_validation(monkeypatch: pytest.MonkeyPatch):
     # Check that pymatgen API key is used
     monkeypatch.setenv("MP_API_KEY", "")
     assert validate_api_key() == other_junk_api_key
+
+
+def test_criteria_to_sql():
+    import pyarrow as pa
+
+    schema = pa.schema(
+        [
+            ("material_id", pa.string()),
+            ("nsites", pa.int64()),
+            ("deprecated", pa.bool_()),
+            ("chemsys", pa.string()),
+            ("elements", pa.list_(pa.string())),
+            ("builder_meta", pa.struct([("batch_id", pa.string())])),
+        ]
+    )
+
+    columns, conditions = _criteria_to_sql(
+        {
+            "material_ids": "mp-149,mp-13",
+            "nsites_min": 2,
+            "deprecated": False,
+            "elements": "Li,O",
+            "batch_id_not_eq": "gnome_r2scan_statics",
+            "_fields": "material_id,builder_meta.batch_id",
+            "_limit": 1000,
+        },
+        schema,
+    )
+    assert columns == '"material_id", "builder_meta"'
+    assert conditions == [
+        "\"material_id\" IN ('mp-149', 'mp-13')",
+        '"nsites" >= 2',
+        '"deprecated" = false',
+        "array_has_all(\"elements\", make_array('Li', 'O'))",
+        "(\"builder_meta\"['batch_id'] IS NULL "
+        "OR \"builder_meta\"['batch_id'] != 'gnome_r2scan_statics')",
+    ]
+    assert _criteria_to_sql({"_all_fields": True}, schema) == ("*", [])
+
+    # Parameters the server interprets itself are not translated
+    assert _criteria_to_sql({"chemsys": "Li-O"}, schema) is None
+    assert _criteria_to_sql({"nsites_min": "2"}, schema) is None
+    assert _criteria_to_sql({"formula": "Fe2O3"}, schema) is None
+    assert _criteria_to_sql({"_fields": "band_gap"}, schema) is None
+
+
+def test_streaming_dataset_writer(tmp_path):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    schema = pa.schema([("version", pa.string()), ("material_id", pa.string())])
+    batches = [
+        pa.record_batch(
+            {
+                # extra columns are dropped, and column types are cast to the schema
+                "nsites": pa.array([i, i + 1]),
+                "material_id": pa.array([f"mp-{i}", f"mp-{i + 1}"], pa.large_string()),
+                "version": pa.array(["1", "2"]),
+            }
+        )
+        for i in range(0, 20, 2)
+    ]
+
+    read = []
+
+    def _source():
+        for batch in batches:
+            read.append(batch)
+            yield batch
+
+    prefetched = _prefetch_batches(_source(), max_bytes=1)
+    assert next(prefetched).equals(batches[0])
+    # The source is paused while a batch is waiting to be consumed
+    assert len(read) <= 2
+
+    with _StreamingDatasetWriter(
+        tmp_path, schema, partition_by="version", max_file_size=1
+    ) as writer:
+        writer.write_batch(batches[0])
+        for batch in prefetched:
+            writer.write_batch(batch)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["version=1", "version=2"]
+    assert len(list((tmp_path / "version=1").glob("part-*.zstd.parquet"))) == 10
+    table = ds.dataset(
+        tmp_path,
+        partitioning=ds.partitioning(
+            pa.schema([("version", pa.string())]), flavor="hive"
+        ),
+    ).to_table()
+    assert table.schema.field("material_id").type == pa.string()
+    assert sorted(table["material_id"].to_pylist()) == sorted(
+        f"mp-{i}" for i in range(20)
+    )
+    assert sorted(
+        zip(table["material_id"].to_pylist(), table["version"].to_pylist())
+    )[:2] == [("mp-0", "1"), ("mp-1", "2")]
+
+
+def test_prefetch_batches_errors():
+    import pyarrow as pa
+
+    def _source():
+        yield pa.record_batch({"a": [1]})
+        raise ValueError("stream failed")
+
+    prefetched = _prefetch_batches(_source(), max_bytes=1024)
+    assert next(prefetched).num_rows == 1
+    with pytest.raises(ValueError, match="stream failed"):
+        next(prefetched)
+
+
+def test_mpdataset_iteration(tmp_path):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    from pydantic import BaseModel
+
+    from mp_api.client.core.exceptions import MPDatasetIterationWarning
+
+    class Doc(BaseModel):
+        material_id: str
+        nsites: int
+
+    ds.write_dataset(
+        pa.table(
+            {
+                "material_id": [f"mp-{i}" for i in range(25)],
+                "nsites": list(range(25)),
+            }
+        ),
+        tmp_path,
+        format="parquet",
+        max_rows_per_group=4,
+    )
+    dataset = MPDataset(tmp_path, document_model=Doc, use_document_model=False)
+
+    assert dataset.num_chunks == 7
+    assert len(dataset) == 25
+    batches = list(dataset.iter_batches(batch_size=10))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert batches[1][0] == {"material_id": "mp-10", "nsites": 10}
+
+    filtered = list(
+        dataset.iter_batches(columns=["nsites"], filter=pc.field("nsites") >= 20)
+    )
+    assert filtered == [[{"nsites": i} for i in range(20, 25)]]
+
+    dataset.use_document_model = True
+    with pytest.warns(MPDatasetIterationWarning):
+        docs = list(dataset)
+    assert docs[3] == Doc(material_id="mp-3", nsites=3)
+    assert [doc.nsites for doc in docs] == list(range(25))
+    projected = next(dataset.iter_batches(batch_size=2, columns=["material_id"]))
+    assert [doc.material_id for doc in projected] == ["mp-0", "mp-1"]
+
+
+def test_mpdataset_get(tmp_path):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    ds.write_dataset(
+        pa.table(
+            {
+                "task_id": [f"mp-{i}" for i in range(25)],
+                "nsites": list(range(25)),
+            }
+        ),
+        tmp_path,
+        format="parquet",
+        max_rows_per_group=4,
+        max_rows_per_file=10,
+    )
+    dataset = MPDataset(
+        tmp_path, document_model=None, use_document_model=False, primary_key="task_id"
+    )
+
+    assert dataset.get(["mp-24", "mp-404", "mp-3"]) == [
+        {"task_id": "mp-24", "nsites": 24},
+        {"task_id": "mp-3", "nsites": 3},
+    ]
+    assert dataset.get("mp-13") == [{"task_id": "mp-13", "nsites": 13}]
+
+    # The index is persisted without becoming part of the dataset
+    assert (tmp_path / "_mp_index.parquet").exists()
+    reloaded = MPDataset(
+        tmp_path, document_model=None, use_document_model=False, primary_key="task_id"
+    )
+    assert len(reloaded) == 25
+    assert reloaded.build_index().num_rows == 25
+
+    with pytest.raises(MPRestError, match="no material_id column"):
+        MPDataset(tmp_path, document_model=None, use_document_model=False).get("mp-1")
+
+
+def test_mpdataset_get_versions(tmp_path):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    def _write(path, versions, material_ids):
+        ds.write_dataset(
+            pa.table(
+                {
+                    "material_id": material_ids,
+                    "version": versions,
+                    "nsites": list(range(len(material_ids))),
+                }
+            ),
+            path,
+            format="parquet",
+            partitioning=["version"],
+            partitioning_flavor="hive",
+        )
+        return MPDataset(path, document_model=None, use_document_model=False)
+
+    # Documents appear once per version, and resolve to their latest version
+    dataset = _write(
+        tmp_path / "versioned",
+        ["2025.01.01", "2025.01.01", "2025.06.01"],
+        ["mp-1", "mp-2", "mp-1"],
+    )
+    assert [doc["nsites"] for doc in dataset.get(["mp-1", "mp-2"])] == [2, 1]
+    assert dataset.get("mp-1", version="2025.01.01") == [
+        {"material_id": "mp-1", "nsites": 0}
+    ]
+    assert dataset.get("mp-2", version="2025.06.01") == []
+
+    # Duplicates within a version are not silently dropped
+    dataset = _write(tmp_path / "duplicates", ["2025.01.01"] * 2, ["mp-1", "mp-1"])
+    with pytest.raises(MPRestError, match="1 duplicate material_id values"):
+        dataset.get("mp-1")
@@ -162,3 +162,46 @@ def test_dos_client():
 
         with pytest.raises(MPRestError, match="No DOS data found for task_id"):
             _ = dos_rester.get_dos_from_task_id("mp-0")
+
+
+def test_dos_from_task_ids_batched(monkeypatch):
+    import pyarrow as pa
+    from emmet.core.mpid import AlphaID
+
+    from mp_api.client.core.client import _Rester
+
+    monkeypatch.setattr(
+        _Rester,
+        "_get_heartbeat_info",
+        staticmethod(lambda endpoint: ("2025.01.01", [])),
+    )
+    queries = []
+
+    def _query_delta_single(query):
+        queries.append(query)
+        return pa.Table.from_pylist(
+            [
+                {"identifier": str(AlphaID(idx, padlen=8)), "run_type": "GGA"}
+                for idx in (1, 3)
+            ]
+        )
+
+    with DosRester(mute_progress_bars=True) as dos_rester:
+        monkeypatch.setattr(
+            dos_rester, "_get_delta_table", lambda *args, label=None: (label, None)
+        )
+        monkeypatch.setattr(dos_rester, "_query_delta_single", _query_delta_single)
+        monkeypatch.setattr(dos_rester, "_decode_dos", lambda row: row["identifier"])
+
+        dos = dos_rester.get_dos_from_task_ids(
+            ["mp-1", "mp-2", "mp-3"], load_projections=True
+        )
+
+    assert dos == {
+        "mp-1": str(AlphaID(1, padlen=8)),
+        "mp-3": str(AlphaID(3, padlen=8)),
+    }
+    # One query for the total DOS, and one for the projections
+    assert len(queries) == 2
+    assert "total_dos" in queries[0] and "IN (" in queries[0]
+    assert "dos_projections" in queries[1]
@@ -88,3 +88,58 @@ def test_blessed_entry(run_type, uncorrected_energy, use_document_model):
         and all(entry.get(k) is not None for k in ("material_id", "blessed_entry"))
         for entry in blessed
     )
+
+
+@pytest.mark.parametrize("num_processes", [1, 2])
+def test_find_structures(monkeypatch, num_processes):
+    from pymatgen.core import Lattice, Structure
+
+    from mp_api.client.core.client import _Rester
+
+    monkeypatch.setattr(
+        _Rester,
+        "_get_heartbeat_info",
+        staticmethod(lambda endpoint: ("2025.01.01", [])),
+    )
+
+    nacl = Structure.from_spacegroup(
+        "Fm-3m", Lattice.cubic(5.69), ["Na", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]]
+    )
+    cscl = Structure(Lattice.cubic(4.2), ["Cs", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+    searches = []
+
+    def search(**kwargs):
+        searches.append(kwargs)
+        # Enough candidates to be matched across processes
+        return [
+            {"material_id": f"mp-{idx + 1}", "structure": s.as_dict()}
+            for idx, s in enumerate(
+                [nacl.copy().scale_lattice(1.1 * nacl.volume)] * 20
+                + [cscl, nacl.copy().make_supercell(2)]
+            )
+        ]
+
+    with MaterialsRester(use_document_model=False) as rester:
+        monkeypatch.setattr(rester, "search", search)
+        matches = rester.find_structures(
+            [nacl, cscl, cscl * (1, 1, 2)],
+            allow_multiple_results=True,
+            num_processes=num_processes,
+        )
+        assert len(searches) == 1
+        assert searches[0]["formula"] == ["CsCl", "NaCl"]
+        assert matches[0] == [f"mp-{idx}" for idx in range(1, 21)] + ["mp-22"]
+        assert matches[1] == matches[2] == ["mp-21"]
+
+        # Matching stops at the first matches, in order of the candidates
+        assert rester.find_structures(
+            [nacl], allow_multiple_results=2, num_processes=num_processes
+        ) == [["mp-1", "mp-2"]]
+
+        # Volumes are otherwise scaled before matching
+        assert rester.find_structures(
+            [nacl], volume_tol=0.05, num_processes=num_processes
+        ) == ["mp-22"]
+        assert rester.find_structure(
+            cscl, match_spacegroup=False, num_processes=num_processes
+        ) == "mp-21"
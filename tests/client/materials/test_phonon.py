@@ -102,3 +102,53 @@ def test_phonon_thermo(use_document_model):
     assert all(
         isinstance(v, list) and len(v) == num_vals for v in thermo_props.values()
     )
+
+
+def test_phonon_batched_retrieval(monkeypatch):
+    import pyarrow as pa
+    from emmet.core.mpid import AlphaID
+
+    from mp_api.client.core.client import _Rester
+
+    monkeypatch.setattr(
+        _Rester,
+        "_get_heartbeat_info",
+        staticmethod(lambda endpoint: ("2025.01.01", [])),
+    )
+
+    searches = []
+    queries = []
+
+    class _SummaryRester:
+        def search(self, material_ids, fields):
+            searches.append(material_ids)
+            return [
+                {"material_id": "mp-1", "phonon_IDs": {"dfpt": ["mp-11"]}},
+                {"material_id": "mp-2", "phonon_IDs": {"pheasy": ["mp-12"]}},
+                {"material_id": "mp-3", "phonon_IDs": {"dfpt": ["mp-13", "mp-14"]}},
+            ]
+
+    def _query_delta_single(query):
+        queries.append(query)
+        return pa.Table.from_pylist(
+            [
+                {"identifier": str(AlphaID(11, padlen=8)), "force_constants": [[1]]},
+                {"identifier": str(AlphaID(13, padlen=8)), "force_constants": [[3]]},
+            ]
+        )
+
+    with PhononRester(mute_progress_bars=True) as rester:
+        monkeypatch.setattr(PhononRester, "summary_rester", _SummaryRester())
+        monkeypatch.setattr(
+            rester, "_get_delta_table", lambda *args, label=None: (label, None)
+        )
+        monkeypatch.setattr(rester, "_query_delta_single", _query_delta_single)
+
+        force_constants = rester.get_forceconstants_from_material_ids(
+            ["mp-1", "mp-2", "mp-3"], phonon_method="dfpt"
+        )
+
+    assert force_constants == {"mp-1": [[1]], "mp-3": [[3]]}
+    assert len(searches) == 1
+    assert len(queries) == 1
+    assert "IN (" in queries[0] and "phonon_method='dfpt'" in queries[0]
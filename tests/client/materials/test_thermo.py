@@ -2,7 +2,7 @@ import os
 
 import pytest
 from emmet.core.types.enums import ThermoType
-from pymatgen.analysis.phase_diagram import PhaseDiagram
+from pymatgen.analysis.phase_diagram import PDEntry, PhaseDiagram
 
 from mp_api._test_utils import client_search_testing, requires_api_key
 from mp_api.client.routes.materials.thermo import ThermoRester
@@ -69,3 +69,58 @@ def test_get_phase_diagram_from_chemsys():
         pd,
         PhaseDiagram,
     )
+
+
+def test_phase_diagrams_cached(monkeypatch, tmp_path):
+    import pyarrow as pa
+
+    from mp_api.client.core.client import _Rester
+    from mp_api.client.core.settings import MAPI_CLIENT_SETTINGS
+
+    monkeypatch.setattr(
+        _Rester,
+        "_get_heartbeat_info",
+        staticmethod(lambda endpoint: ("2025.01.01", [])),
+    )
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "PHASE_DIAGRAM_CACHE", True)
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "CACHE_DIR", tmp_path)
+
+    def _phase_diagram(phase_diagram):
+        return PhaseDiagram(
+            [PDEntry(el, 0.0) for el in phase_diagram["chemsys"].split("-")]
+        )
+
+    def _chemsys(phase_diagram):
+        return "-".join(sorted(str(el) for el in phase_diagram.elements))
+
+    queries = []
+
+    def _query_delta_single(query):
+        queries.append(query)
+        return pa.table(
+            {
+                "chemsys": ["Fe-Li-O", "Cl-Na"],
+                "phase_diagram": [{"chemsys": "Fe-Li-O"}, {"chemsys": "Cl-Na"}],
+            }
+        )
+
+    with ThermoRester(mute_progress_bars=True) as rester:
+        monkeypatch.setattr(
+            rester, "_get_delta_table", lambda *args, label=None: (label, None)
+        )
+        monkeypatch.setattr(rester, "_query_delta_single", _query_delta_single)
+        monkeypatch.setattr(rester, "_deserialize_phase_diagram", _phase_diagram)
+
+        pds = rester.get_phase_diagrams_from_chemsys(["Li-Fe-O", "Na-Cl", "Cs-Xe"])
+        assert {k: _chemsys(pd) for k, pd in pds.items()} == {
+            "Li-Fe-O": "Fe-Li-O",
+            "Na-Cl": "Cl-Na",
+        }
+        assert len(queries) == 1
+        assert "chemsys IN ('Fe-Li-O', 'Cl-Na', 'Cs-Xe')" in queries[0]
+
+        # Cached phase diagrams are not queried again
+        cached = rester.get_phase_diagram_from_chemsys("O-Li-Fe")
+        assert isinstance(cached, PhaseDiagram)
+        assert _chemsys(cached) == "Fe-Li-O"
+        assert len(queries) == 1
@@ -1,6 +1,8 @@
 import pytest
 
 import json
+import os
+from urllib.parse import urlencode
 
 from mp_api._test_utils import requires_api_key
 
@@ -8,6 +10,7 @@ from mp_api.client import MPRester
 from mp_api.client.core import BaseRester
 from mp_api.client.core.exceptions import MPRestError, MPRestWarning
 from mp_api.client.core.schemas import _generate_returned_model
+from mp_api.client.core.settings import MAPI_CLIENT_SETTINGS
 from mp_api.client.routes.materials.materials import MaterialsRester
 
 
@@ -113,3 +116,532 @@ def test_regression_batching():
         )
         <= num_idxs
     )
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict, status_code: int = 200, url: str = ""):
+        self.text = json.dumps(payload)
+        self.content = self.text.encode()
+        self.status_code = status_code
+        self.url = url
+
+
+class _FakeSession:
+    """Serve paginated documents without reaching the API."""
+
+    def __init__(self, num_docs: int):
+        self.docs = [{"material_id": f"mp-{idx}"} for idx in range(num_docs)]
+        self.calls: list[dict] = []
+        self.headers: dict = {}
+
+    def get(self, url, verify=True, params=None, timeout=None, headers=None):
+        params = dict(params or {})
+        self.calls.append(params)
+        skip = params.get("_skip", 0)
+        limit = params.get("_limit") or len(self.docs)
+        return _FakeResponse(
+            {
+                "data": self.docs[skip : skip + limit],
+                "meta": {"total_doc": len(self.docs)},
+            },
+            url=url,
+        )
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def offline_rester(monkeypatch):
+    from mp_api.client.core.client import _Rester
+
+    monkeypatch.setattr(
+        _Rester,
+        "_get_heartbeat_info",
+        staticmethod(lambda endpoint: ("2025.01.01", [])),
+    )
+
+    def _make_rester(num_docs: int = 0, **kwargs):
+        return MaterialsRester(
+            session=_FakeSession(num_docs), mute_progress_bars=True, **kwargs
+        )
+
+    return _make_rester
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+def test_pagination_order(offline_rester, monkeypatch, concurrent):
+
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "CONCURRENT_PAGINATION", concurrent)
+    rester = offline_rester(num_docs=95, use_document_model=False)
+
+    docs = rester.search(material_ids=[f"mp-{idx}" for idx in range(10)], chunk_size=10)
+    assert [doc["material_id"] for doc in docs] == [f"mp-{idx}" for idx in range(95)]
+    assert len(rester.session.calls) == 10
+
+    docs = rester.search(
+        material_ids=[f"mp-{idx}" for idx in range(10)], chunk_size=10, num_chunks=3
+    )
+    assert [doc["material_id"] for doc in docs] == [f"mp-{idx}" for idx in range(30)]
+    assert sorted(call.get("_skip", 0) for call in rester.session.calls[10:]) == [
+        0,
+        10,
+        20,
+    ]
+
+
+def test_search_iter(offline_rester):
+    rester = offline_rester(num_docs=95, use_document_model=False)
+    material_ids = [f"mp-{idx}" for idx in range(10)]
+
+    pages = rester.search_iter(material_ids=material_ids, chunk_size=10)
+    # Nothing is requested until the first page is consumed
+    assert rester.session.calls == []
+
+    first_page = next(pages)
+    assert [doc["material_id"] for doc in first_page] == [
+        f"mp-{idx}" for idx in range(10)
+    ]
+    assert len(rester.session.calls) <= 1 + MAPI_CLIENT_SETTINGS.NUM_PARALLEL_REQUESTS
+
+    pages = [first_page, *pages]
+    assert [len(page) for page in pages] == [10] * 9 + [5]
+    assert [doc["material_id"] for page in pages for doc in page] == [
+        doc["material_id"]
+        for doc in rester.search(material_ids=material_ids, chunk_size=10)
+    ]
+    assert (
+        sum(
+            1
+            for _ in rester.search_iter(
+                material_ids=material_ids, num_chunks=2, chunk_size=10
+            )
+        )
+        == 2
+    )
+
+
+def test_query_resource_iter_full_download(offline_rester, monkeypatch, tmp_path):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    from mp_api.client.core.utils import MPDataset
+
+    ds.write_dataset(
+        pa.table(
+            {"material_id": [f"mp-{i}" for i in range(25)], "nsites": list(range(25))}
+        ),
+        tmp_path,
+        format="parquet",
+        max_rows_per_group=4,
+    )
+    rester = offline_rester(num_docs=0, use_document_model=False)
+    monkeypatch.setattr(
+        rester,
+        "_query_resource",
+        lambda **kwargs: {
+            "data": MPDataset(tmp_path, document_model=None, use_document_model=False)
+        },
+    )
+
+    # Full downloads are yielded in chunks, projected on the requested fields
+    pages = list(rester._query_resource_iter(fields=["nsites"], chunk_size=10))
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert pages[1][0] == {"nsites": 10}
+    assert rester.session.calls == []
+
+
+@pytest.mark.parametrize("prefetch_depth", [0, 2])
+def test_prefetch_depth(offline_rester, monkeypatch, prefetch_depth):
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "CONCURRENT_PAGINATION", False)
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "PREFETCH_DEPTH", prefetch_depth)
+    rester = offline_rester(num_docs=95, use_document_model=False)
+
+    pages = rester.search_iter(
+        material_ids=[f"mp-{idx}" for idx in range(10)], chunk_size=10
+    )
+    next(pages)
+    next(pages)
+    # The first page, the second page, and at most `prefetch_depth` pages ahead
+    assert len(rester.session.calls) <= 2 + prefetch_depth
+    if prefetch_depth == 0:
+        assert len(rester.session.calls) == 2
+
+    assert sum(len(page) for page in pages) == 75
+    assert len(rester.session.calls) == 10
+
+
+def test_response_cache(offline_rester, monkeypatch, tmp_path):
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "RESPONSE_CACHE", True)
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "CACHE_DIR", tmp_path)
+    material_ids = [f"mp-{idx}" for idx in range(10)]
+
+    rester = offline_rester(num_docs=25, use_document_model=False)
+    docs = rester.search(material_ids=material_ids, chunk_size=10)
+    assert len(rester.session.calls) == 3
+
+    # A new client, e.g., in another process, reuses the cached responses
+    rester = offline_rester(num_docs=25, use_document_model=False)
+    assert rester.search(material_ids=material_ids, chunk_size=10) == docs
+    assert rester.session.calls == []
+
+    # Responses are cached per database version
+    rester = offline_rester(num_docs=25, use_document_model=False, db_version="1")
+    rester.search(material_ids=material_ids, chunk_size=10)
+    assert len(rester.session.calls) == 3
+
+
+@pytest.mark.parametrize("output", ["arrow", "pandas"])
+def test_search_table(offline_rester, monkeypatch, output):
+    rester = offline_rester(num_docs=25)
+    for doc in rester.session.docs:
+        doc.update(
+            last_updated="2025-01-01T00:00:00.123000",
+            builder_meta={"license": "BY-C", "build_date": "2025-01-01T00:00:00Z"},
+            origins=[{"name": "structure", "last_updated": "2025-01-01T00:00:00"}],
+        )
+
+    # Documents are converted straight to arrow, without building models
+    monkeypatch.setattr(
+        "mp_api.client.core.client._convert_to_model",
+        lambda *args, **kwargs: pytest.fail("models were built"),
+    )
+    table = rester.search_table(
+        material_ids=[f"mp-{idx}" for idx in range(10)],
+        fields=["material_id", "last_updated", "builder_meta.license", "origins"],
+        chunk_size=10,
+        output=output,
+    )
+    if output == "pandas":
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(table, preserve_index=False)
+
+    assert table.column_names == [
+        "material_id",
+        "last_updated",
+        "builder_meta",
+        "origins",
+    ]
+    assert table["material_id"].to_pylist() == [f"mp-{idx}" for idx in range(25)]
+    assert str(table.schema.field("last_updated").type) == "timestamp[us, tz=UTC]"
+    assert table["builder_meta"][0].as_py()["license"] == "BY-C"
+
+    with pytest.raises(MPRestError, match="Unknown output"):
+        rester.search_table(material_ids="mp-0", output="polars")
+
+
+def test_delta_pushdown(offline_rester, monkeypatch, tmp_path):
+    import pyarrow as pa
+    from deltalake import DeltaTable, write_deltalake
+
+    write_deltalake(
+        tmp_path,
+        pa.table(
+            {
+                "material_id": [f"mp-{idx}" for idx in range(5)] + ["mp-0"],
+                "nsites": [1, 4, 8, 5, 6, 4],
+                "elements": [["O"], ["Li", "O"], ["O"], ["Fe"], ["O"], ["O"]],
+                "deprecated": [False, False, False, False, True, False],
+                "builder_meta": [{"license": "BY-C"}] * 2
+                + [{"license": "BY-NC"}]
+                + [{"license": "BY-C"}] * 3,
+                # The last row is from an older release of the database
+                "version": ["2025-01-01"] * 5 + ["2024-01-01"],
+            }
+        ),
+        partition_by=["version"],
+    )
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "DELTA_PUSHDOWN_MIN_DOCS", 2)
+    rester = offline_rester(num_docs=5, use_document_model=False)
+    monkeypatch.setattr(rester, "_has_controlled_access", lambda timeout=None: False)
+
+    def _get_delta_table(bucket, prefix, label=None):
+        assert (bucket, prefix) == ("materialsproject-build", "collections/materials")
+        table = DeltaTable(str(tmp_path))
+        rester.query_builder.register("materials", table)
+        return "materials", table
+
+    monkeypatch.setattr(rester, "_get_delta_table", _get_delta_table)
+    queries = []
+    execute = rester.query_builder.execute
+
+    def _execute(query):
+        queries.append(query)
+        return execute(query)
+
+    monkeypatch.setattr(rester.query_builder, "execute", _execute)
+
+    docs = rester.search(
+        num_sites=(2, 10), elements=["O"], fields=["material_id", "nsites"]
+    )
+    assert docs == [{"material_id": "mp-1", "nsites": 4}]
+    assert len(queries) == 1
+    assert queries[0].startswith('SELECT "material_id", "nsites" FROM materials WHERE ')
+    assert "version = '2025-01-01'" in queries[0]
+    # The number of matching documents is taken from the first page of the API
+    assert len(rester.session.calls) == 1
+
+    # Queries which cannot be translated are sent to the API
+    rester.session.calls.clear()
+    assert len(rester.search(chemsys="Li-O")) == 5
+    assert len(rester.session.calls) == 1
+
+
+def test_sync_datasets(offline_rester, monkeypatch, tmp_path):
+    import pyarrow as pa
+    from deltalake import DeltaTable, write_deltalake
+
+    schema, _ = offline_rester()._dataset_schema(versioned=True)
+    remote_path = str(tmp_path / "remote")
+
+    def _write_remote(versions, material_ids, mode="append", licenses=None):
+        write_deltalake(
+            remote_path,
+            pa.Table.from_pylist(
+                [
+                    {
+                        "version": version,
+                        "material_id": material_id,
+                        "builder_meta": {"license": license},
+                    }
+                    for version, material_id, license in zip(
+                        versions,
+                        material_ids,
+                        licenses or ["BY-C"] * len(versions),
+                        strict=True,
+                    )
+                ],
+                schema=schema,
+            ),
+            partition_by=["version"],
+            mode=mode,
+            predicate=(f"version = '{versions[0]}'" if mode == "overwrite" else None),
+        )
+
+    def _download(**kwargs):
+        rester = offline_rester(
+            num_docs=0,
+            use_document_model=False,
+            local_dataset_cache=tmp_path / "local",
+            **kwargs,
+        )
+        monkeypatch.setattr(
+            rester, "_has_controlled_access", lambda timeout=None: False
+        )
+
+        def _get_delta_table(bucket, prefix, label=None):
+            # Registered once per rester, as by `_get_delta_table`
+            if (table := rester.query_builder._delta_tables.get("materials")) is None:
+                table = DeltaTable(remote_path)
+                rester.query_builder.register("materials", table)
+            return "materials", table
+
+        monkeypatch.setattr(rester, "_get_delta_table", _get_delta_table)
+        dataset = rester._query_delta_backed(
+            "materialsproject-build", "collections/materials", versioned=True
+        )["data"]
+        return sorted(
+            dataset.pyarrow_dataset.to_table(columns=["material_id"])[
+                "material_id"
+            ].to_pylist()
+        )
+
+    _write_remote(
+        ["1", "1", "1"], ["mp-1", "mp-2", "mp-3"], licenses=["BY-C", "BY-C", "BY-NC"]
+    )
+    assert _download() == ["mp-1", "mp-2"]
+
+    # A new release adds a partition and rewrites an existing one
+    _write_remote(["2", "2"], ["mp-4", "mp-5"])
+    _write_remote(["1"], ["mp-6"], mode="overwrite")
+    assert _download() == ["mp-1", "mp-2"]
+
+    fetched = []
+    fetch = BaseRester._fetch_delta_file
+
+    def _fetch_delta_file(**kwargs):
+        fetched.append(kwargs["partition"])
+        fetch(**kwargs)
+
+    monkeypatch.setattr(
+        BaseRester, "_fetch_delta_file", staticmethod(_fetch_delta_file)
+    )
+    assert _download(sync_datasets=True) == ["mp-4", "mp-5", "mp-6"]
+    assert sorted(fetched) == ["1", "2"]
+
+    # Up-to-date datasets are left untouched
+    fetched.clear()
+    assert _download(sync_datasets=True) == ["mp-4", "mp-5", "mp-6"]
+    assert fetched == []
+
+    # Files of tables with deletion vectors or column mapping are not read as is
+    monkeypatch.setattr(
+        BaseRester, "_plain_parquet_files", staticmethod(lambda delta_table: False)
+    )
+    _write_remote(["2"], ["mp-7"])
+    assert _download(sync_datasets=True) == ["mp-4", "mp-5", "mp-6", "mp-7"]
+    assert fetched == []
+
+
+class _IdSession(_FakeSession):
+    """Serve one document per requested value of a list parameter."""
+
+    def __init__(self, num_docs: int, param: str = "material_ids"):
+        super().__init__(num_docs)
+        self.param = param
+
+    def get(self, url, verify=True, params=None, timeout=None, headers=None):
+        params = dict(params or {})
+        self.calls.append(params)
+        values = params[self.param].split(",")
+        return _FakeResponse(
+            {
+                "data": [{self.param: value} for value in values],
+                "meta": {"total_doc": len(values)},
+            },
+            url=f"{url}?{urlencode(params)}",
+        )
+
+
+@pytest.mark.parametrize(
+    "param, values",
+    [
+        ("material_ids", [f"mp-{idx}" for idx in range(1000)]),
+        ("formula", [f"Li{idx}O" for idx in range(1, 1001)]),
+        ("chemsys", [f"Li-O-{el}" for el in ("Fe", "Co", "Ni", "Mn") * 250]),
+    ],
+)
+def test_split_by_url_length(offline_rester, monkeypatch, param, values):
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "MAX_URL_LENGTH", 500)
+    rester = offline_rester(use_document_model=False)
+    rester._session = _IdSession(0, param=param)
+
+    docs = rester.search(**{param: values}, fields=["material_id"])
+    assert [doc[param] for doc in docs] == values
+
+    # No request was rejected first, and every request fit in the URL length
+    calls = rester.session.calls
+    assert len(calls) > 1
+    assert all(len(f"{rester.endpoint}?{urlencode(call)}") <= 500 for call in calls)
+    assert sum(len(call[param].split(",")) for call in calls) == len(values)
+
+
+def test_max_parallel_requests(monkeypatch):
+    from mp_api.client.core.client import _max_parallel_requests
+
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "NUM_PARALLEL_REQUESTS", 4)
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "ADAPTIVE_CONCURRENCY", True)
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "MAX_PARALLEL_REQUESTS", None)
+    # Adapting leaves room to grow beyond the initial number of requests
+    assert _max_parallel_requests() == 16
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "MAX_PARALLEL_REQUESTS", 16)
+    assert _max_parallel_requests() == 16
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "ADAPTIVE_CONCURRENCY", False)
+    assert _max_parallel_requests() == 4
+
+
+def test_shared_executor(offline_rester):
+    from concurrent.futures import ThreadPoolExecutor
+
+    with offline_rester(num_docs=95, use_document_model=False) as rester:
+        executor = rester.executor
+        assert rester.thermo.executor is executor
+        material_ids = [f"mp-{idx}" for idx in range(10)]
+        assert len(rester.search(material_ids=material_ids, chunk_size=10)) == 95
+
+        # Nested parallel calls run in the calling worker, instead of waiting on
+        # (and possibly deadlocking) the shared executor
+        num_tasks = 2 * MAPI_CLIENT_SETTINGS.NUM_PARALLEL_REQUESTS
+        nested = rester._multi_thread_iter(
+            lambda idx: list(
+                rester._multi_thread_iter(
+                    lambda jdx: (idx, jdx), [{"jdx": 0}, {"jdx": 1}]
+                )
+            ),
+            [{"idx": idx} for idx in range(num_tasks)],
+        )
+        assert list(nested) == [[(idx, 0), (idx, 1)] for idx in range(num_tasks)]
+
+    # The client shuts down the executor it created, but not an injected one
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+    with ThreadPoolExecutor(max_workers=2) as injected:
+        with offline_rester(num_docs=5, executor=injected) as rester:
+            assert rester.executor is injected
+            assert rester.thermo.executor is injected
+        assert injected.submit(lambda: 1).result() == 1
+
+
+def test_call_options_thread_safe(offline_rester):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pydantic import BaseModel
+
+    with offline_rester(num_docs=25) as rester:
+        material_ids = [f"mp-{idx}" for idx in range(10)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            counts = pool.map(
+                lambda _: rester.count({"material_ids": "mp-0"}), range(16)
+            )
+            searches = pool.map(
+                lambda _: rester.search(material_ids=material_ids, chunk_size=10),
+                range(16),
+            )
+            assert list(counts) == [25] * 16
+            # Counting never switches concurrent searches to dictionaries
+            assert all(
+                isinstance(doc, BaseModel) for docs in searches for doc in docs
+            )
+        assert rester.use_document_model
+
+        # Options apply to all resters, and to the requests submitted by the call
+        with rester._call_options(use_document_model=False):
+            assert not rester.thermo.use_document_model
+            assert list(
+                rester._multi_thread_iter(
+                    lambda idx: rester.use_document_model, [{"idx": 0}, {"idx": 1}]
+                )
+            ) == [False, False]
+        assert rester.use_document_model and rester.thermo.use_document_model
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork")
+def test_fork_resets_connections(offline_rester, monkeypatch):
+    from mp_api.client.core.client import _RESTERS, _Rester
+
+    # Clients are only registered for the reset once fully initialized
+    heartbeat = _Rester._get_heartbeat_info
+
+    def _no_heartbeat(endpoint):
+        raise MPRestError("No heartbeat")
+
+    monkeypatch.setattr(_Rester, "_get_heartbeat_info", staticmethod(_no_heartbeat))
+    num_resters = len(_RESTERS)
+    # The traceback keeps the half-initialized client alive
+    with pytest.raises(MPRestError, match="No heartbeat") as excinfo:
+        MaterialsRester()
+    assert len(_RESTERS) == num_resters
+    del excinfo
+    monkeypatch.setattr(_Rester, "_get_heartbeat_info", staticmethod(heartbeat))
+
+    with offline_rester(num_docs=5) as rester:
+        session, executor = rester.session, rester.executor
+        assert rester.thermo.executor is executor
+
+        read_fd, write_fd = os.pipe()
+        if (pid := os.fork()) == 0:  # pragma: no cover
+            # The child gets its own connections, shared with the sub-resters
+            reset = (
+                rester.session is not session
+                and rester.executor is not executor
+                and rester.thermo.session is rester.session
+                and rester.thermo.executor is rester.executor
+                and rester.executor.submit(lambda: 1).result() == 1
+            )
+            os.write(write_fd, b"1" if reset else b"0")
+            os._exit(0)
+        os.waitpid(pid, 0)
+        assert os.read(read_fd, 1) == b"1"
+        assert rester.session is session and rester.executor is executor
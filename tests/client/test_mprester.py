@@ -271,6 +271,19 @@ loop_
 
         assert len(entries) == 0
 
+    def test_get_entries_conventional_parallel(self, mpr, monkeypatch):
+        from mp_api.client import mprester
+
+        monkeypatch.setattr(mprester, "_MIN_PARALLEL_ENTRIES", 1)
+        serial, parallel = (
+            mpr.get_entries("Li-O", conventional_unit_cell=True, num_processes=n)
+            for n in (1, 2)
+        )
+        assert len({(e.entry_id, e.energy) for e in serial}) == len(serial)
+        assert [(e.entry_id, e.energy, e.structure) for e in serial] == [
+            (e.entry_id, e.energy, e.structure) for e in parallel
+        ]
+
     def test_get_entries_in_chemsys(self, mpr):
         syms = ["Li", "Fe", "O"]
         syms2 = "Li-Fe-O"
@@ -835,3 +848,171 @@ loop_
                 MPRestWarning, match="The installed version of the mp-api"
             ):
                 MPRester()
+
+
+def test_entry_cache_subsystems(monkeypatch):
+    from mp_api.client import mprester
+    from mp_api.client.core.client import _Rester
+
+    monkeypatch.setattr(
+        _Rester,
+        "_get_heartbeat_info",
+        staticmethod(lambda endpoint: ("2025.01.01", [])),
+    )
+    monkeypatch.setattr(MPRester, "get_emmet_version", staticmethod(lambda _: None))
+
+    queried = []
+
+    def get_entries(chemsys_formula_mpids, **kwargs):
+        queried.append(sorted(chemsys_formula_mpids))
+        # Some subsystems have no entries
+        return [
+            ComputedEntry(chemsys.replace("-", ""), -1.0, entry_id=f"mp-{chemsys}")
+            for chemsys in chemsys_formula_mpids
+            if chemsys != "Fe-Li"
+        ]
+
+    criteria = {"thermo_types": ["GGA_GGA+U"]}
+    with MPRester(api_key="1" * 32) as mpr:
+        monkeypatch.setattr(mpr, "get_entries", get_entries)
+        li_o = mpr.get_entries_in_chemsys("Li-O", additional_criteria=criteria)
+        li_fe_o = mpr.get_entries_in_chemsys("Li-Fe-O", additional_criteria=criteria)
+
+        assert queried == [["Li", "Li-O", "O"], ["Fe", "Fe-Li", "Fe-Li-O", "Fe-O"]]
+        assert {e.entry_id for e in li_o} < {e.entry_id for e in li_fe_o}
+        assert len(li_fe_o) == 6
+
+        # Cached entries are copies, which can be modified in place
+        li_o[0].entry_id = "modified"
+        assert "modified" not in {
+            e.entry_id
+            for e in mpr.get_entries_in_chemsys("Li-O", additional_criteria=criteria)
+        }
+        assert len(queried) == 2
+
+        # Other criteria are not cached
+        mpr.get_entries_in_chemsys(
+            "Li-O", additional_criteria={**criteria, "is_stable": True}
+        )
+        assert len(queried) == 3
+
+        # The least recently used chemical systems are evicted
+        monkeypatch.setattr(mprester, "_MAX_CACHED_CHEMSYSES", 4)
+        mpr.get_entries_in_chemsys("Li-O", additional_criteria=criteria)
+        assert len(mpr._entry_cache) == 4
+        assert {key[0] for key in list(mpr._entry_cache)[1:]} == {"Li", "Li-O", "O"}
+        assert len(queried) == 3
+
+
+def test_reference_data_cache(monkeypatch, tmp_path):
+    import threading
+
+    from mp_api.client.core.client import _Rester
+    from mp_api.client.core.settings import MAPI_CLIENT_SETTINGS
+
+    monkeypatch.setattr(
+        _Rester,
+        "_get_heartbeat_info",
+        staticmethod(lambda endpoint: ("2025.01.01", [])),
+    )
+    monkeypatch.setattr(MPRester, "get_emmet_version", staticmethod(lambda _: None))
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "REFERENCE_DATA_CACHE", True)
+
+    queries = []
+    refreshed = threading.Event()
+
+    class Contribs:
+        def query_contributions(self, query, **kwargs):
+            queries.append(query["project"])
+            if len(queries) > 1:
+                refreshed.set()
+            return {"data": [{"identifier": "Li[+]", "version": len(queries)}]}
+
+    monkeypatch.setattr(MPRester, "contribs", property(lambda self: Contribs()))
+
+    with MPRester(api_key="1" * 32) as mpr:
+        assert mpr.get_ion_reference_data()[0]["version"] == 1
+        assert mpr.get_ion_reference_data()[0]["version"] == 1
+    assert queries == ["ion_ref_data"]
+
+    # A new client reads the data from disk
+    with MPRester(api_key="1" * 32) as mpr:
+        assert mpr.get_ion_reference_data()[0]["version"] == 1
+    assert queries == ["ion_ref_data"]
+
+    # Stale data are served while being refreshed in the background
+    monkeypatch.setattr(MAPI_CLIENT_SETTINGS, "REFERENCE_DATA_MAX_AGE", -1)
+    with MPRester(api_key="1" * 32) as mpr:
+        assert mpr.get_ion_reference_data()[0]["version"] == 1
+        assert refreshed.wait(timeout=10)
+    assert queries == ["ion_ref_data"] * 2
+
+
+def test_pickle_mprester(monkeypatch):
+    import pickle
+
+    from mp_api.client.core.client import _Rester
+
+    monkeypatch.setattr(
+        _Rester,
+        "_get_heartbeat_info",
+        staticmethod(lambda endpoint: ("2025.01.01", [])),
+    )
+    monkeypatch.setattr(MPRester, "get_emmet_version", staticmethod(lambda _: None))
+
+    with MPRester(api_key="1" * 32, use_document_model=False) as mpr:
+        thermo = mpr.materials.thermo
+        mpr._entry_cache[("Li",)] = []
+        clone = pickle.loads(pickle.dumps(mpr))
+
+    # The configuration is kept, but not the connections nor in-memory caches
+    assert clone.api_key == "1" * 32 and clone.db_version == "2025.01.01"
+    assert not clone.use_document_model
+    assert clone._entry_cache == {}
+    assert clone.materials.thermo is not thermo
+
+    # Resters share the new connections of the client
+    with clone:
+        assert clone.materials.session is clone.session
+        assert clone.materials.thermo.session is clone.session
+        assert clone.materials.thermo.executor is clone.executor
+        assert clone.executor.submit(lambda: 1).result() == 1
+
+
+def test_energies_above_hull_pdentries(monkeypatch):
+    from pymatgen.analysis.phase_diagram import PDEntry
+
+    from mp_api.client.core._hull import HullEvaluator
+    from mp_api.client.core.client import _Rester
+
+    monkeypatch.setattr(
+        _Rester,
+        "_get_heartbeat_info",
+        staticmethod(lambda endpoint: ("2025.01.01", [])),
+    )
+    monkeypatch.setattr(MPRester, "get_emmet_version", staticmethod(lambda _: None))
+
+    phase_diagram = PhaseDiagram(
+        [PDEntry("Li", -1.9), PDEntry("O2", -9.8), PDEntry("Li2O", -14.3)]
+    )
+    entries = [PDEntry("Li2O", -14.0), PDEntry("LiO2", -12.0)]
+    with MPRester(api_key="1" * 32) as mpr:
+        monkeypatch.setattr(
+            mpr,
+            "get_hull_evaluators",
+            lambda chemsys, thermo_type: {"Li-O": HullEvaluator(phase_diagram)},
+        )
+
+        # Plain PDEntries have no calculation parameters to correct
+        for thermo_type in (ThermoType.GGA_GGA_U_R2SCAN, ThermoType.GGA_GGA_U):
+            with pytest.raises(ValueError, match=r"indices \[0, 1\]"):
+                mpr.get_energies_above_hull(entries, thermo_type=thermo_type)
+
+        assert np.allclose(
+            mpr.get_energies_above_hull(entries, thermo_type="r2SCAN"),
+            [
+                phase_diagram.get_decomp_and_e_above_hull(entry, allow_negative=True)[1]
+                for entry in entries
+            ],
+        )